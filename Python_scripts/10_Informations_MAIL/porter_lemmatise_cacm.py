@@ -4,12 +4,23 @@ Nom du fichier: porter_lemmatise_cacm.py
 Objectif du programme:
     Appliquer l’algorithme de Porter Stemmer aux documents CACM
     afin de produire une version lemmatisée de la collection.
+    La racine de chaque mot distinct n'est calculée qu'une fois (ri.racinisation)
+    et les articles sont lus au fil du fichier HTML (ri.articles_html).
+Usage :
+  python porter_lemmatise_cacm.py            # un seul processus
+  python porter_lemmatise_cacm.py -j 4       # racinisation dans 4 processus
 """
 
 from pathlib import Path
-from bs4 import BeautifulSoup
-from nltk.stem.porter import PorterStemmer
+import argparse
 import re
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # accès au paquet ri
+
+from ri.articles_html import articles_html
+from ri.parallele import map_ordonne
+from ri.racinisation import Raciniseur
 
 HTML_FILE = Path("outputs/Collection2.html")  # dans 1 il y a les stopwords, dans 2 non
 
@@ -17,10 +28,8 @@ OUT_DIR = Path("Collection_porter")
 OUT_COLLECTION_LIST = OUT_DIR / "Collection"
 
 
-def extraire_texte_article(article) -> str:
-    """Même logique que dans scrape_cacm_html.py."""
-    texte = article.get_text(" ", strip=True)
-    return texte
+# Raciniseur du processus courant (un par processus, créé par initialiser_stemmer)
+STEMMER = None
 
 
 def tokenizer_simple(texte: str):
@@ -37,49 +46,61 @@ def tokenizer_simple(texte: str):
     return tokens
 
 
-def main() -> None:
-    if not HTML_FILE.is_file():
-        raise SystemExit(f"Fichier HTML introuvable : {HTML_FILE}")
+def initialiser_stemmer() -> None:
+    global STEMMER
+    STEMMER = Raciniseur()  # PorterStemmer().stem mémorisé par forme de surface
 
-    with HTML_FILE.open("r", encoding="utf-8") as f:
-        soup = BeautifulSoup(f, "html.parser")
 
-    corpus = soup.find_all("article", class_="cacm-doc")
+def raciniser_article(article) -> str | None:
+    """Écrit la version racinisée d'un article ; renvoie son identifiant (None si ignoré)."""
+    if not article.doc_id or not article.texte:
+        return None
 
-    OUT_DIR.mkdir(parents=True, exist_ok=True)
+    tokens = tokenizer_simple(article.texte)
 
-    stemmer = PorterStemmer()
-    ids_docs = []
+    # Enlever les # pour filtrer les stopwords
+    # from nltk.corpus import stopwords
+    # stops = set(stopwords.words("english"))
+    # tokens = [t for t in tokens if t not in stops]
 
-    for article in corpus:
-        doc_id = article.get("id")
-        if not doc_id:
-            continue
+    stems = STEMMER.tokens(tokens)
+    texte_stem = " ".join(stems)
 
-        texte = extraire_texte_article(article)
-        if not texte:
-            continue
+    out_file = OUT_DIR / f"{article.doc_id}.stp"
+    out_file.write_text(texte_stem + "\n", encoding="utf-8")
+    return article.doc_id
 
-        tokens = tokenizer_simple(texte)
 
-        # Enlever les # pour filtrer les stopwords
-        # from nltk.corpus import stopwords
-        # stops = set(stopwords.words("english"))
-        # tokens = [t for t in tokens if t not in stops]
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Racinisation (Porter) de la collection HTML.")
+    parser.add_argument("-j", "--processus", type=int, default=1,
+                        help="nombre de processus pour la racinisation des articles (défaut 1)")
+    args = parser.parse_args()
 
-        stems = [stemmer.stem(t) for t in tokens]
-        texte_stem = " ".join(stems)
+    if not HTML_FILE.is_file():
+        raise SystemExit(f"Fichier HTML introuvable : {HTML_FILE}")
+    try:
+        Raciniseur()
+    except ImportError as e:
+        raise SystemExit(str(e))
 
-        out_file = OUT_DIR / f"{doc_id}.stp"
-        out_file.write_text(texte_stem + "\n", encoding="utf-8")
+    OUT_DIR.mkdir(parents=True, exist_ok=True)
 
-        ids_docs.append(doc_id)
+    ids_docs = [
+        doc_id
+        for doc_id in map_ordonne(raciniser_article, articles_html(HTML_FILE), args.processus,
+                                  initialisation=initialiser_stemmer)
+        if doc_id is not None
+    ]
 
     with OUT_COLLECTION_LIST.open("w", encoding="utf-8") as f:
         for doc_id in ids_docs:
             f.write(doc_id + "\n")
 
     print(f"{len(ids_docs)} documents stemmés écrits dans {OUT_DIR}")
+    if STEMMER is not None:
+        # un seul processus : statistiques du cache
+        print(STEMMER.statistiques())
 
 
 if __name__ == "__main__":
@@ -4,10 +4,21 @@ Nom du fichier: scrape_cacm_html.py
 Objectif du programme:
     Extraire automatiquement le contenu des documents CACM
     à partir des fichiers HTML de la collection.
+    Les articles sont lus au fil du fichier (ri.articles_html) : la mémoire
+    ne dépend pas de la taille de la collection.
+Usage :
+  python scrape_cacm_html.py            # un seul processus
+  python scrape_cacm_html.py -j 4       # écriture des documents dans 4 processus
 """
 
 from pathlib import Path
-from bs4 import BeautifulSoup
+import argparse
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # accès au paquet ri
+
+from ri.articles_html import articles_html
+from ri.parallele import map_ordonne
 
 # Fichier HTML source
 HTML_FILE = Path("outputs/Collection2.html")
@@ -17,48 +28,35 @@ OUT_DIR = Path("Collection_html")
 OUT_COLLECTION_LIST = OUT_DIR / "Collection"
 
 
-def extraire_texte_article(article) -> str:
-    """
-    À adapter à la structure exacte de ton HTML.
-    Approche générique :
-      - on enlève les balises de mise en forme
-      - on récupère le texte brut avec get_text()
-    """
-    texte = article.get_text(" ", strip=True)
-    return texte
+def ecrire_article(article) -> str | None:
+    """Écrit le texte d'un article dans OUT_DIR ; renvoie son identifiant (None si ignoré)."""
+    if not article.doc_id or not article.texte:
+        return None
+
+    # Fichier de sortie pour ce document
+    out_file = OUT_DIR / f"{article.doc_id}.txt"
+    out_file.write_text(article.texte + "\n", encoding="utf-8")
+    return article.doc_id
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Extrait les documents de la collection HTML.")
+    parser.add_argument("-j", "--processus", type=int, default=1,
+                        help="nombre de processus pour le traitement des articles (défaut 1)")
+    args = parser.parse_args()
+
     if not HTML_FILE.is_file():
         raise SystemExit(f"Fichier HTML introuvable : {HTML_FILE}")
 
-    # Lecture du HTML avec BeautifulSoup
-    with HTML_FILE.open("r", encoding="utf-8") as f:
-        soup = BeautifulSoup(f, "html.parser")
-
-    # Tous les articles CACM
-    corpus = soup.find_all("article", class_="cacm-doc")
-
     # Création du dossier de sortie
     OUT_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Liste des IDs pour la nouvelle Collection
-    ids_docs = []
-
-    for article in corpus:
-        doc_id = article.get("id")
-        if not doc_id:
-            continue
-
-        texte = extraire_texte_article(article)
-        if not texte:
-            continue
-
-        # Fichier de sortie pour ce document
-        out_file = OUT_DIR / f"{doc_id}.txt"
-        out_file.write_text(texte + "\n", encoding="utf-8")
-
-        ids_docs.append(doc_id)
+    # Liste des IDs pour la nouvelle Collection, dans l'ordre du fichier HTML
+    ids_docs = [
+        doc_id
+        for doc_id in map_ordonne(ecrire_article, articles_html(HTML_FILE), args.processus)
+        if doc_id is not None
+    ]
 
     # Fichier liste de documents, style "Collection"
     with OUT_COLLECTION_LIST.open("w", encoding="utf-8") as f:
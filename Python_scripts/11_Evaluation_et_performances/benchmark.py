@@ -0,0 +1,334 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: benchmark.py
+Objectif du programme:
+    Banc d'essai des performances, à plusieurs tailles de collection (CACM,
+    puis CACM rééchantillonnée 10 ou 100 fois, ri.corpus, ou collections
+    synthétiques de même taille, ri.synthetique) :
+    - construction du vocabulaire, des df, de l'index inversé et des vecteurs
+      TF et TF-IDF par les fonctions des scripts du TP (vocabulary.py, df.py,
+      indexInverse.py, vecteurTF.py, vecteurTFIDF.py) : temps et pic de
+      mémoire, chaque étape dans un processus séparé ;
+    - requêtes tf.idf et à proximité floue : temps de chargement, p50 / p95 /
+      p99 des temps de réponse et débit (requêtes par seconde).
+    Les résultats sont écrits en JSON et comparés à une référence enregistrée :
+    les mesures qui se dégradent de plus de la tolérance sont signalées.
+Usage :
+  python benchmark.py                          # CACM et CACM x10
+  python benchmark.py --echelles 1,10,100      # jusqu'à 100 fois CACM
+  python benchmark.py --requetes 10            # 10 premières requêtes seulement
+  python benchmark.py --synthetique --echelles 1,100,300   # loi de Zipf, jusqu'à ~1 M documents
+  python benchmark.py --enregistrer-reference  # ces mesures deviennent la référence
+  python benchmark.py --tolerance 0.3          # régression au-delà de +30 %
+Requêtes : celles de query.text s'il est présent (ri.requetes_cacm), sinon
+les requêtes d'exemple intégrées. Code de sortie 1 si une régression est signalée.
+"""
+
+from pathlib import Path
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # accès au paquet ri
+
+from ri import flux
+from ri.corpus import ecrire_corpus, parametres_corpus, reechantillonner
+from ri.index import Index
+from ri.performances import comparer, pic_memoire_mo, resume_latences
+from ri.requetes_cacm import requetes_de_test
+from ri.synthetique import generer_documents, modele_depuis_collection
+
+# Répertoires
+SCRIPT_DIR = Path(__file__).resolve().parent.parent
+RACINE = SCRIPT_DIR.parent
+CACM_FILE = SCRIPT_DIR / "5_Processus_en_python" / "cacm.all"
+COUNTER_FILE = RACINE / "outputs" / "counter.txt"
+BENCHMARK_DIR = RACINE / "outputs" / "benchmark"
+RESULTATS_FILE = RACINE / "outputs" / "benchmark.json"
+REFERENCE_FILE = RACINE / "outputs" / "benchmark_reference.json"
+
+ETAPES_CONSTRUCTION = ("vocabulaire", "df", "index", "tf", "tfidf")
+# Dossiers des scripts de construction, importés par le processus enfant
+DOSSIERS_SCRIPTS = ("6_Calcul_des_valeurs_classiques", "7_Analyse_de_la_collection",
+                    "8_Construction_de_fichier_inverse")
+
+
+def trouver_mots_vides() -> Path:
+    """Même recherche que remove.pl : Collection/common_words puis outputs/common_words."""
+    for path in (RACINE / "Collection" / "common_words", RACINE / "outputs" / "common_words"):
+        if path.is_file():
+            return path
+    raise SystemExit("Fichier common_words introuvable (Collection/ ou outputs/).")
+
+
+def preparer_corpus(nom: str, parametres: dict, regenerer: bool, documents) -> Path:
+    """
+    Dossier du corpus `nom`, écrit s'il n'existe pas avec les mêmes paramètres ;
+    documents() donne le flux de ses documents (appelé seulement si besoin).
+    """
+    dossier = BENCHMARK_DIR / nom
+    existants = parametres_corpus(dossier)
+    if not regenerer and existants is not None \
+            and all(existants.get(cle) == valeur for cle, valeur in parametres.items()):
+        return dossier
+
+    debut = time.perf_counter()
+    nb_docs = ecrire_corpus(dossier, documents(), parametres)
+    print(f"  corpus {nom} : {nb_docs} documents écrits en "
+          f"{time.perf_counter() - debut:.1f} s dans {dossier}")
+    return dossier
+
+
+def executer_enfant(*options: str) -> dict:
+    """
+    Relance ce script dans un processus séparé avec les options données :
+    les lignes qu'il affiche sont recopiées, la dernière (JSON) est renvoyée.
+    Chaque mesure a ainsi son propre pic de mémoire.
+    """
+    sortie = subprocess.run([sys.executable, str(Path(__file__).resolve()), *options],
+                            capture_output=True, text=True, check=True)
+    lignes = sortie.stdout.rstrip().splitlines()
+    for ligne in lignes[:-1]:
+        print(ligne)
+    return json.loads(lignes[-1])
+
+
+# ----------------------------------------------------------------------
+# Construction
+# ----------------------------------------------------------------------
+
+def fonction_etape(etape: str, dossier: Path, sortie_dir: Path):
+    """
+    Fonction sans argument qui refait l'étape demandée avec le script du TP
+    correspondant, sur le corpus `dossier` (sorties dans `sortie_dir`). Les
+    scripts ne sont importés qu'ici, dans le processus enfant. L'index et les
+    vecteurs lisent le vocabulaire et les df écrits avec le corpus.
+    """
+    for nom in DOSSIERS_SCRIPTS:
+        sys.path.insert(0, str(SCRIPT_DIR / nom))
+    collection_dir = dossier / "Collection"
+    vocab_file = dossier / "outputs" / "vocabulaire.txt"
+
+    if etape == "vocabulaire":
+        import vocabulary
+        return lambda: vocabulary.ecrire_vocabulaire(
+            vocabulary.construire_vocabulaire(collection_dir), sortie_dir / "vocabulaire.txt")
+    if etape == "df":
+        import df
+        return lambda: df.ecrire_df(df.calculer_df(collection_dir), sortie_dir / "df.txt")
+    if etape == "index":
+        import indexInverse
+        return lambda: indexInverse.construire_index(collection_dir, vocab_file,
+                                                     sortie_dir / "indexInverse.txt",
+                                                     sortie_dir / "indexPositionnel.txt")
+    if etape == "tf":
+        import vecteurTF
+        return lambda: vecteurTF.construire_vecteurs_tf(collection_dir, vocab_file,
+                                                        sortie_dir / "vecteurTF.txt", complet=True)
+    import vecteurTFIDF
+    return lambda: vecteurTFIDF.construire_vecteurs_tfidf(
+        collection_dir, vocab_file, dossier / "outputs" / "df.txt",
+        sortie_dir / "vecteurTFIDF.txt", complet=True)
+
+
+def construire(etape: str, dossier: Path) -> None:
+    """Exécuté dans le processus enfant : affiche {secondes, pic_memoire_mo} en JSON."""
+    sortie_dir = dossier / "construction"
+    sortie_dir.mkdir(parents=True, exist_ok=True)
+    fonction = fonction_etape(etape, dossier, sortie_dir)
+    debut = time.perf_counter()
+    fonction()
+    secondes = time.perf_counter() - debut
+    print(f"    {etape:10} {secondes:9.3f} s   pic mémoire {pic_memoire_mo()} Mo")
+    print(json.dumps({"secondes": round(secondes, 4), "pic_memoire_mo": pic_memoire_mo()}))
+
+
+# ----------------------------------------------------------------------
+# Requêtes
+# ----------------------------------------------------------------------
+
+def mesurer_requetes(index: Index, nom: str, rechercher, requetes: list) -> dict:
+    """
+    Temps de chargement (première requête, non comptée), puis temps de réponse
+    de chaque requête de la liste.
+    """
+    avant = dict(index.durees)
+    debut = time.perf_counter()
+    rechercher(requetes[0])
+    premiere = time.perf_counter() - debut
+    chargements = sum(d for cle, d in index.durees.items() if cle not in avant)
+
+    durees = []
+    for query in requetes:
+        debut = time.perf_counter()
+        rechercher(query)
+        durees.append(time.perf_counter() - debut)
+
+    resume = resume_latences(durees)
+    resume["chargement_s"] = round(chargements, 4)
+    print(f"    {nom:10} p50 {resume['p50_ms']:9.2f} ms   p95 {resume['p95_ms']:9.2f} ms   "
+          f"p99 {resume['p99_ms']:9.2f} ms   {resume['qps']:8.2f} req/s   "
+          f"(chargement {chargements:.2f} s, 1re requête {premiere:.2f} s)")
+    return resume
+
+
+def interroger(dossier: Path, requetes: list, k: int, exact: bool) -> None:
+    """
+    Exécuté dans le processus enfant : mesures des deux modèles, puis pic de
+    mémoire de l'ensemble (index chargé et requêtes), en JSON.
+    """
+    index = Index(dossier / "Collection", dossier / "outputs", exact=exact)
+    try:
+        mesures = {
+            "tfidf": mesurer_requetes(index, "tfidf", index.recherche_tfidf, requetes),
+            f"proximite_k{k}": mesurer_requetes(
+                index, f"prox. k={k}", lambda q: index.recherche_proximite(q, k), requetes),
+        }
+    finally:
+        index.fermer()
+    mesures["memoire"] = {"pic_memoire_mo": pic_memoire_mo()}
+    print(f"    {'mémoire':10} pic {mesures['memoire']['pic_memoire_mo']} Mo")
+    print(json.dumps(mesures))
+
+
+def mesurer_echelle(dossier: Path, nb_requetes: int | None, k: int, expansion: bool) -> dict:
+    construction = {etape: executer_enfant("--construire", etape, "--dossier", str(dossier))
+                    for etape in ETAPES_CONSTRUCTION}
+    options = ["--interroger", "--dossier", str(dossier), "--k", str(k)]
+    if nb_requetes is not None:
+        options += ["--requetes", str(nb_requetes)]
+    if expansion:
+        options.append("--expansion")
+    return {
+        "documents": parametres_corpus(dossier)["documents"],
+        "construction": construction,
+        "requetes": executer_enfant(*options),
+    }
+
+
+def afficher_regressions(regressions: list, tolerance: float) -> None:
+    if not regressions:
+        print(f"\nAucune régression (tolérance {tolerance:.0%}).")
+        return
+    print(f"\n{len(regressions)} régression(s) (tolérance {tolerance:.0%}) :")
+    for chemin, ref, valeur, ecart in regressions:
+        print(f"  {chemin:45} {ref:>10} -> {valeur:>10}  ({ecart:+.0%})")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Banc d'essai : construction et requêtes.")
+    parser.add_argument("--echelles", default="1,10",
+                        help="tailles de collection en multiples de CACM (défaut 1,10)")
+    parser.add_argument("--requetes", type=int, default=None,
+                        help="nombre de requêtes utilisées (défaut : toutes)")
+    parser.add_argument("--k", type=int, default=5, help="k du modèle à proximité (défaut 5)")
+    parser.add_argument("--expansion", action="store_true",
+                        help="correction des mots inconnus active (mesure aussi l'expansion)")
+    parser.add_argument("--synthetique", action="store_true",
+                        help="collections générées (loi de Zipf de counter.txt) au lieu de CACM "
+                             "rééchantillonnée")
+    parser.add_argument("--graine", type=int, default=0,
+                        help="graine du rééchantillonnage ou de la génération")
+    parser.add_argument("--regenerer", action="store_true",
+                        help="réécrit les corpus même s'ils existent déjà")
+    parser.add_argument("--sortie", type=Path, default=RESULTATS_FILE,
+                        help=f"fichier des résultats (défaut {RESULTATS_FILE})")
+    parser.add_argument("--reference", type=Path, default=REFERENCE_FILE,
+                        help=f"fichier de référence (défaut {REFERENCE_FILE})")
+    parser.add_argument("--enregistrer-reference", action="store_true",
+                        help="enregistre aussi les résultats comme nouvelle référence")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="dégradation relative tolérée avant de signaler une régression (défaut 0.2)")
+    # processus enfants : une étape de construction, ou les requêtes sur un corpus
+    parser.add_argument("--construire", choices=ETAPES_CONSTRUCTION, help=argparse.SUPPRESS)
+    parser.add_argument("--interroger", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--dossier", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.construire:
+        construire(args.construire, args.dossier)
+        return
+
+    try:
+        echelles = [int(e) for e in args.echelles.split(",") if e.strip()]
+    except ValueError:
+        raise SystemExit(f"Échelles invalides : {args.echelles}")
+    source = (COUNTER_FILE, RACINE / "Collection" / "Collection") if args.synthetique \
+        else (CACM_FILE,)
+    for path in source:
+        if not path.is_file():
+            raise SystemExit(f"Fichier introuvable : {path}")
+
+    source_requetes, requetes = requetes_de_test()
+    if args.requetes is not None:
+        requetes = requetes[:args.requetes]
+    if not requetes:
+        raise SystemExit("Aucune requête.")
+    if args.interroger:
+        interroger(args.dossier, requetes, args.k, exact=not args.expansion)
+        return
+    print(f"{len(requetes)} requêtes ({source_requetes})")
+
+    # CACM (ou le modèle de la collection synthétique) n'est lue que si un
+    # corpus est à écrire, une seule fois
+    cache = {}
+
+    def documents_cacm() -> list:
+        if "cacm" not in cache:
+            mots_vides = flux.charger_mots_vides(trouver_mots_vides())
+            cache["cacm"] = list(flux.flux_documents(CACM_FILE, mots_vides))
+        return cache["cacm"]
+
+    def modele():
+        if "modele" not in cache:
+            cache["modele"] = modele_depuis_collection(COUNTER_FILE, RACINE / "Collection")
+        return cache["modele"]
+
+    resultats = {
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "requetes": {"source": source_requetes, "nombre": len(requetes),
+                     "k": args.k, "expansion": args.expansion},
+        "echelles": {},
+    }
+    for facteur in echelles:
+        if args.synthetique:
+            nom = f"zipf_x{facteur}"
+            parametres = {"source": "zipf", "facteur": facteur, "graine": args.graine}
+            documents = lambda: generer_documents(modele(), facteur * len(modele().longueurs),
+                                                  args.graine)
+        else:
+            nom = f"x{facteur}"
+            parametres = {"source": "cacm", "facteur": facteur, "graine": args.graine}
+            documents = lambda: reechantillonner(documents_cacm(), facteur, args.graine)
+        print(f"\nÉchelle {nom}")
+        dossier = preparer_corpus(nom, parametres, args.regenerer, documents)
+        resultats["echelles"][nom] = mesurer_echelle(dossier, args.requetes, args.k,
+                                                     args.expansion)
+
+    args.sortie.parent.mkdir(parents=True, exist_ok=True)
+    args.sortie.write_text(json.dumps(resultats, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"\nRésultats écrits dans : {args.sortie}")
+
+    regressions = []
+    if args.reference.is_file():
+        reference = json.loads(args.reference.read_text(encoding="utf-8"))
+        regressions = comparer(resultats["echelles"], reference.get("echelles", {}), args.tolerance)
+        print(f"Référence : {args.reference} ({reference.get('date', '?')})")
+        afficher_regressions(regressions, args.tolerance)
+    else:
+        print(f"Pas de référence ({args.reference}) : relancer avec --enregistrer-reference.")
+
+    if args.enregistrer_reference:
+        args.reference.write_text(json.dumps(resultats, indent=2, ensure_ascii=False),
+                                  encoding="utf-8")
+        print(f"Référence enregistrée : {args.reference}")
+    elif regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
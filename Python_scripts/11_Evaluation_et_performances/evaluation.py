@@ -0,0 +1,266 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: evaluation.py
+Objectif du programme:
+    Évaluer la qualité des classements sur les requêtes de test de CACM
+    (query.text) et leurs jugements de pertinence (qrels.text) : MAP, nDCG@10
+    et P@10 (ri.evaluation), pour plusieurs configurations des moteurs
+    (tf.idf, proximité floue pour plusieurs k, BM25, tf.idf racinisé),
+    exécutées en parallèle (une configuration par processus).
+    La qualité est affichée à côté des temps de réponse de chaque
+    configuration, et comparée à une référence enregistrée : une optimisation
+    ne doit pas dégrader les classements.
+Usage :
+  python evaluation.py                           # toutes les configurations disponibles
+  python evaluation.py --configs tfidf,bm25      # seulement celles-ci
+  python evaluation.py --k 2,5,10,20             # valeurs de k du modèle à proximité
+  python evaluation.py -j 1                      # une configuration à la fois
+  python evaluation.py --enregistrer-reference   # ces mesures deviennent la référence
+Configurations ignorées (avec un message) si leurs fichiers manquent :
+bm25 (outputs/indexBM25.txt, indexBM25.py), tfidf_racinise (outputs/racinise/,
+pipeline_flux.py --racinisation, et NLTK).
+"""
+
+from pathlib import Path
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # accès au paquet ri
+
+from ri.evaluation import K_DEFAUT, evaluer
+from ri.flux import charger_mots_vides
+from ri.parallele import map_ordonne
+from ri.performances import comparer, resume_latences
+from ri.requetes_cacm import DOSSIERS_CACM, lire_qrels, lire_requetes_cacm, trouver_fichier_cacm
+
+# Répertoires
+SCRIPT_DIR = Path(__file__).resolve().parent.parent
+RACINE = SCRIPT_DIR.parent
+COLLECTION_DIR = RACINE / "Collection"
+OUTPUTS_DIR = RACINE / "outputs"
+RACINISE_DIR = OUTPUTS_DIR / "racinise"
+INDEX_BM25_FILE = OUTPUTS_DIR / "indexBM25.txt"
+RESULTATS_FILE = OUTPUTS_DIR / "evaluation.json"
+REFERENCE_FILE = OUTPUTS_DIR / "evaluation_reference.json"
+
+MODELES = ("tfidf", "proximite", "bm25", "tfidf_racinise")
+PROFONDEUR = 100  # documents classés par requête
+
+
+def trouver_mots_vides() -> Path:
+    """Même recherche que remove.pl : Collection/common_words puis outputs/common_words."""
+    for path in (COLLECTION_DIR / "common_words", OUTPUTS_DIR / "common_words"):
+        if path.is_file():
+            return path
+    raise SystemExit("Fichier common_words introuvable (Collection/ ou outputs/).")
+
+
+# ----------------------------------------------------------------------
+# Exécution d'une configuration (dans un processus de travail)
+# ----------------------------------------------------------------------
+
+def preparer_recherche(config: dict):
+    """Fonction requête -> [nom_doc, ...] (classement) de la configuration."""
+    modele, profondeur = config["modele"], config["profondeur"]
+    if modele == "bm25":
+        from ri.bm25 import charger_index_bm25, recherche_bm25
+        from ri.index import charger_liste_docs
+        docs = charger_liste_docs(COLLECTION_DIR / "Collection")
+        index_bm25, params = charger_index_bm25(INDEX_BM25_FILE)
+        echelle = params.get("echelle", 1.0)
+        return lambda q: [d for _, d in recherche_bm25(q, docs, index_bm25, echelle, profondeur)]
+
+    from ri.index import Index
+    if modele == "tfidf_racinise":
+        from ri.racinisation import Raciniseur
+        raciniseur = Raciniseur()
+        index = Index(COLLECTION_DIR, RACINISE_DIR, exact=True)
+        return lambda q: [d for _, d in index.recherche_tfidf(
+            " ".join(raciniseur.tokens(q.split())), max_resultats=profondeur)[0]]
+
+    index = Index(COLLECTION_DIR, OUTPUTS_DIR, exact=config["exact"])
+    if modele == "proximite":
+        return lambda q: [d for _, d in index.recherche_proximite(
+            q, config["k"], max_resultats=profondeur)[0]]
+    return lambda q: [d for _, d in index.recherche_tfidf(q, max_resultats=profondeur)[0]]
+
+
+def executer_configuration(config: dict) -> dict:
+    """
+    Classements et temps de réponse de toutes les requêtes. La première
+    requête (chargement de l'index) est mesurée à part puis refaite.
+    """
+    debut = time.perf_counter()
+    rechercher = preparer_recherche(config)
+    requetes = config["requetes"]
+    rechercher(requetes[0][1])
+    chargement = time.perf_counter() - debut
+
+    classements, durees = {}, []
+    for id_requete, texte in requetes:
+        debut = time.perf_counter()
+        classements[id_requete] = rechercher(texte)
+        durees.append(time.perf_counter() - debut)
+    return {"nom": config["nom"], "classements": classements, "durees": durees,
+            "chargement_s": round(chargement, 4)}
+
+
+# ----------------------------------------------------------------------
+# Préparation
+# ----------------------------------------------------------------------
+
+def charger_requetes() -> tuple:
+    """(requêtes [(id, texte sans mots vides)], jugements {id: documents pertinents})."""
+    fichiers = {nom: trouver_fichier_cacm(nom) for nom in ("query.text", "qrels.text")}
+    manquants = [nom for nom, path in fichiers.items() if path is None]
+    if manquants:
+        dossiers = ", ".join(str(d) for d in DOSSIERS_CACM)
+        raise SystemExit(f"Fichier introuvable : {', '.join(manquants)} (cherché dans {dossiers}) ; "
+                         "ces fichiers sont fournis avec cacm.all dans l'archive CACM.")
+    mots_vides = charger_mots_vides(trouver_mots_vides())
+    requetes = []
+    for id_requete, texte in sorted(lire_requetes_cacm(fichiers["query.text"]).items()):
+        mots = [m for m in texte.split() if m not in mots_vides]
+        if mots:
+            requetes.append((id_requete, " ".join(mots)))
+    return requetes, lire_qrels(fichiers["qrels.text"])
+
+
+def configurations_disponibles(noms: list, valeurs_k: list) -> tuple:
+    """(configurations [(nom, modele, k)], messages des configurations ignorées)."""
+    configs, ignorees = [], []
+    for modele in noms:
+        if modele == "bm25" and not INDEX_BM25_FILE.is_file():
+            ignorees.append(f"bm25 : {INDEX_BM25_FILE} introuvable (lancer indexBM25.py)")
+            continue
+        if modele == "tfidf_racinise":
+            if not (RACINISE_DIR / "vecteurTF.txt").is_file():
+                ignorees.append(f"tfidf_racinise : {RACINISE_DIR} introuvable "
+                                "(lancer pipeline_flux.py --racinisation)")
+                continue
+            try:
+                from ri.racinisation import stemmer_porter
+                stemmer_porter()
+            except ImportError as e:
+                ignorees.append(f"tfidf_racinise : {e}")
+                continue
+        if modele == "proximite":
+            configs.extend((f"proximite_k{k}", modele, k) for k in valeurs_k)
+        else:
+            configs.append((modele, modele, None))
+    return configs, ignorees
+
+
+def afficher_tableau(resultats: dict, k: int) -> None:
+    print(f"\n{'configuration':16} {'MAP':>7} {f'nDCG@{k}':>8} {f'P@{k}':>7} "
+          f"{'p50 ms':>9} {'p95 ms':>9} {'req/s':>8} {'charg. s':>9}")
+    for nom, r in resultats.items():
+        q, lat = r["qualite"], r["latence"]
+        print(f"{nom:16} {q['map']:7.4f} {q[f'ndcg_{k}']:8.4f} {q[f'p_{k}']:7.4f} "
+              f"{lat['p50_ms']:9.2f} {lat['p95_ms']:9.2f} {lat['qps']:8.2f} {lat['chargement_s']:9.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Évaluation des moteurs (MAP, nDCG, P@k) sur CACM.")
+    parser.add_argument("--configs", default=",".join(MODELES),
+                        help=f"modèles évalués, parmi : {','.join(MODELES)}")
+    parser.add_argument("--k", default="2,5,10",
+                        help="valeurs de k du modèle à proximité (défaut 2,5,10)")
+    parser.add_argument("--top", type=int, default=K_DEFAUT,
+                        help=f"rang de coupure de nDCG et de la précision (défaut {K_DEFAUT})")
+    parser.add_argument("--profondeur", type=int, default=PROFONDEUR,
+                        help=f"documents classés par requête, pour la MAP (défaut {PROFONDEUR})")
+    parser.add_argument("--expansion", action="store_true",
+                        help="tf.idf et proximité avec correction des mots inconnus")
+    parser.add_argument("-j", "--processus", type=int, default=None,
+                        help="configurations évaluées simultanément (défaut : une par cœur)")
+    parser.add_argument("--sortie", type=Path, default=RESULTATS_FILE,
+                        help=f"fichier des résultats (défaut {RESULTATS_FILE})")
+    parser.add_argument("--reference", type=Path, default=REFERENCE_FILE,
+                        help=f"fichier de référence (défaut {REFERENCE_FILE})")
+    parser.add_argument("--enregistrer-reference", action="store_true",
+                        help="enregistre aussi les résultats comme nouvelle référence")
+    parser.add_argument("--tolerance", type=float, default=0.01,
+                        help="baisse relative de qualité tolérée (défaut 0.01)")
+    args = parser.parse_args()
+
+    noms = [n.strip() for n in args.configs.split(",") if n.strip()]
+    inconnus = set(noms) - set(MODELES)
+    if inconnus:
+        raise SystemExit(f"Configurations inconnues : {', '.join(sorted(inconnus))}")
+    try:
+        valeurs_k = [int(k) for k in args.k.split(",") if k.strip()]
+    except ValueError:
+        raise SystemExit(f"Valeurs de k invalides : {args.k}")
+    for path in (COLLECTION_DIR / "Collection", OUTPUTS_DIR / "vocabulaire.txt"):
+        if not path.is_file():
+            raise SystemExit(f"Fichier introuvable : {path}")
+
+    requetes, jugements = charger_requetes()
+    configs, ignorees = configurations_disponibles(noms, valeurs_k)
+    for message in ignorees:
+        print(f"Configuration ignorée : {message}")
+    if not configs:
+        raise SystemExit("Aucune configuration à évaluer.")
+
+    nb_processus = args.processus or min(len(configs), os.cpu_count() or 1)
+    print(f"{len(requetes)} requêtes, {sum(1 for j in jugements.values() if j)} jugées ; "
+          f"{len(configs)} configurations, {nb_processus} processus")
+
+    taches = [{"nom": nom, "modele": modele, "k": k, "requetes": requetes,
+               "profondeur": args.profondeur, "exact": not args.expansion}
+              for nom, modele, k in configs]
+    debut = time.perf_counter()
+    resultats = {}
+    for execution in map_ordonne(executer_configuration, taches, nb_processus, taille_paquet=1):
+        latence = resume_latences(execution["durees"])
+        latence["chargement_s"] = execution["chargement_s"]
+        resultats[execution["nom"]] = {
+            "qualite": evaluer(execution["classements"], jugements, args.top),
+            "latence": latence,
+        }
+    duree = time.perf_counter() - debut
+
+    afficher_tableau(resultats, args.top)
+    print(f"\nDurée totale : {duree:.1f} s"
+          + (" (temps de réponse mesurés avec plusieurs configurations en parallèle)"
+             if nb_processus > 1 else ""))
+
+    sortie = {
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "requetes": len(requetes),
+        "top": args.top,
+        "profondeur": args.profondeur,
+        "configurations": resultats,
+    }
+    args.sortie.parent.mkdir(parents=True, exist_ok=True)
+    args.sortie.write_text(json.dumps(sortie, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"Résultats écrits dans : {args.sortie}")
+
+    # seule la qualité est comparée : les temps sont l'affaire de benchmark.py
+    regressions = []
+    if args.reference.is_file():
+        reference = json.loads(args.reference.read_text(encoding="utf-8"))
+        qualite_ref = {nom: r["qualite"] for nom, r in reference.get("configurations", {}).items()}
+        regressions = comparer({nom: r["qualite"] for nom, r in resultats.items()},
+                               qualite_ref, args.tolerance)
+        print(f"Référence : {args.reference} ({reference.get('date', '?')})")
+        if regressions:
+            print(f"{len(regressions)} baisse(s) de qualité (tolérance {args.tolerance:.0%}) :")
+            for chemin, ref, valeur, ecart in regressions:
+                print(f"  {chemin:30} {ref:>8} -> {valeur:>8}  ({ecart:+.1%})")
+        else:
+            print(f"Qualité conservée (tolérance {args.tolerance:.0%}).")
+
+    if args.enregistrer_reference:
+        args.reference.write_text(json.dumps(sortie, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"Référence enregistrée : {args.reference}")
+    elif regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
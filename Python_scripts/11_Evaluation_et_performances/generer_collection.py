@@ -0,0 +1,73 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: generer_collection.py
+Objectif du programme:
+    Générer une collection synthétique de la taille voulue (ri.synthetique) :
+    loi de Zipf ajustée sur outputs/counter.txt, longueurs des documents
+    tirées parmi celles de Collection/. La collection est écrite comme celle
+    de CACM (un fichier par document + liste Collection/Collection), en
+    collection compacte, avec le vocabulaire, les df et les vecteurs TF :
+    les moteurs peuvent l'interroger directement (ri.index.Index).
+Usage :
+  python generer_collection.py 100000                  # 100 000 documents
+  python generer_collection.py 1000000 --compacte-seulement
+  python generer_collection.py 50000 --graine 3 --dossier /tmp/synthetique
+  python generer_collection.py 50000 --vocabulaire 40000
+"""
+
+from pathlib import Path
+import argparse
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # accès au paquet ri
+
+from ri.corpus import ecrire_corpus
+from ri.synthetique import generer_documents, modele_depuis_collection, taille_vocabulaire
+
+# Répertoires
+SCRIPT_DIR = Path(__file__).resolve().parent.parent
+RACINE = SCRIPT_DIR.parent
+COUNTER_FILE = RACINE / "outputs" / "counter.txt"
+COLLECTION_DIR = RACINE / "Collection"
+SORTIE_DIR = RACINE / "outputs" / "synthetique"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Génère une collection synthétique (loi de Zipf).")
+    parser.add_argument("nb_docs", type=int, help="nombre de documents")
+    parser.add_argument("--graine", type=int, default=0, help="graine des tirages (défaut 0)")
+    parser.add_argument("--vocabulaire", type=int, default=None,
+                        help="taille du vocabulaire (défaut : celle de CACM × √(nb_docs / 3204))")
+    parser.add_argument("--dossier", type=Path, default=SORTIE_DIR,
+                        help=f"dossier de la collection (défaut {SORTIE_DIR})")
+    parser.add_argument("--compacte-seulement", action="store_true",
+                        help="pas de fichier par document (collection compacte et liste seulement)")
+    args = parser.parse_args()
+
+    if args.nb_docs <= 0:
+        raise SystemExit("Le nombre de documents doit être positif.")
+    for path in (COUNTER_FILE, COLLECTION_DIR / "Collection"):
+        if not path.is_file():
+            raise SystemExit(f"Fichier introuvable : {path}")
+
+    modele = modele_depuis_collection(COUNTER_FILE, COLLECTION_DIR)
+    taille = args.vocabulaire or taille_vocabulaire(modele, args.nb_docs)
+    longueur_moyenne = sum(modele.longueurs) / len(modele.longueurs)
+    print(f"Modèle : exposant de Zipf {modele.exposant:.3f}, {len(modele.termes)} termes et "
+          f"{len(modele.longueurs)} documents de référence ({longueur_moyenne:.1f} termes en moyenne)")
+    print(f"Génération de {args.nb_docs} documents, vocabulaire de {taille} termes, "
+          f"graine {args.graine}")
+
+    parametres = {"source": "zipf", "graine": args.graine, "exposant": round(modele.exposant, 6),
+                  "vocabulaire": taille}
+    debut = time.perf_counter()
+    nb_docs = ecrire_corpus(args.dossier,
+                            generer_documents(modele, args.nb_docs, args.graine, taille),
+                            parametres, fichiers=not args.compacte_seulement)
+    duree = time.perf_counter() - debut
+    print(f"{nb_docs} documents écrits en {duree:.1f} s dans {args.dossier}")
+
+
+if __name__ == "__main__":
+    main()
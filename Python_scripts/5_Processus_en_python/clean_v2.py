@@ -2,54 +2,57 @@
 Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
 Nom du fichier: clean_v2.py
 Objectif du programme: Prendre les fichiers avec l'extension .flt et créer à partir de ceux-ci un fichier HTML bien formaté
+Usage :
+  python clean_v2.py                          # un seul fichier HTML
+  python clean_v2.py -j 4                     # articles préparés dans 4 processus
+  python clean_v2.py --docs-par-fichier 500   # pages de 500 documents + index
 """
 
 from pathlib import Path
-import html
+import argparse
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # accès au paquet ri
+
+from ri.export_html import exporter_collection
 
 # Répertoire de base
 SCRIPT_DIR = Path(__file__).resolve().parent.parent
-BASE_DIR = SCRIPT_DIR.parent / "Collection" 
+BASE_DIR = SCRIPT_DIR.parent / "Collection"
 LIST_FILE = BASE_DIR / "Collection"
-OUTPUT_FILE = SCRIPT_DIR.parent /"outputs" / "Collection1.html"
-
-# Lecture de la liste des documents
-doc_ids = []
-with LIST_FILE.open(encoding="utf-8") as f:
-    for line in f:
-        line = line.strip()
-        if line:
-            doc_ids.append(line)
-
-# Ouverture du fichier HTML de sortie
-with OUTPUT_FILE.open("w", encoding="utf-8") as out:
-    out.write("<!DOCTYPE html>\n")
-    out.write("<html>\n<head>\n<meta charset=\"utf-8\">\n")
-    out.write("<title>Collection1 - CACM (version nettoyée)</title>\n</head>\n<body>\n")
-
-    for doc_id in doc_ids:
-
-        # Parcourt seulement les fichiers texte et non les fichiers HTML
-        if not doc_id.startswith("CACM"):
-            continue
-
-        text_path = BASE_DIR / f"{doc_id}.flt"
-        if not text_path.exists():
-            print(f"ATTENTION : fichier manquant {text_path}, ignoré.")
-            continue
-
-        # Lecture du texte .flt
-        text = text_path.read_text(encoding="utf-8")
-        text = html.escape(text)
-
-        # Ajout du numéro du document au début
-        texte_final = f"[{doc_id}] " + text
-
-        # Écriture dans un <article> avec classe cacm
-        out.write(f"<article class=\"cacm\" id=\"{doc_id}\">\n")
-        out.write(texte_final)
-        out.write("\n</article>\n\n")
-
-    out.write("</body>\n</html>\n")
-
-print("Créé :", OUTPUT_FILE)
+OUTPUT_FILE = SCRIPT_DIR.parent / "outputs" / "Collection1.html"
+EXTENSION = ".flt"
+TITRE = "Collection1 - CACM (version nettoyée)"
+
+
+def entier_positif(valeur: str) -> int:
+    """Type argparse : entier strictement positif."""
+    n = int(valeur)
+    if n <= 0:
+        raise argparse.ArgumentTypeError(f"entier strictement positif attendu : {valeur}")
+    return n
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Collection HTML des fichiers .flt (Collection1.html).")
+    parser.add_argument("-j", "--processus", type=int, default=1,
+                        help="nombre de processus pour lire et échapper les articles (défaut 1)")
+    parser.add_argument("--docs-par-fichier", type=entier_positif, default=None,
+                        help=f"découper en pages de N documents dans {OUTPUT_FILE.with_suffix('')}/")
+    args = parser.parse_args()
+
+    # Lecture de la liste des documents
+    doc_ids = []
+    with LIST_FILE.open(encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                doc_ids.append(line)
+
+    fichiers = exporter_collection(doc_ids, BASE_DIR, EXTENSION, OUTPUT_FILE, TITRE,
+                                   args.processus, args.docs_par_fichier)
+    print("Créé :", fichiers[-1] if len(fichiers) == 1 else f"{fichiers[-1]} ({len(fichiers) - 1} pages)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: compacter_collection.py
+Objectif du programme:
+    Regrouper les milliers de fichiers de Collection/ (CACM-N, .flt, .stp)
+    en un fichier de données par représentation, avec un index offset/longueur,
+    dans Collection_compacte/. Les scripts qui lisent les documents utilisent
+    ensuite automatiquement cette version compacte.
+Usage :
+  python compacter_collection.py                # brut, flt et stp
+  python compacter_collection.py stp flt        # seulement certaines représentations
+"""
+
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # accès au paquet ri
+
+from ri.collection_compacte import REPRESENTATIONS, ecrire_collection_compacte
+
+# Répertoires
+SCRIPT_DIR = Path(__file__).resolve().parent.parent
+COLLECTION_DIR = SCRIPT_DIR.parent / "Collection"
+LIST_FILE = COLLECTION_DIR / "Collection"
+COMPACTE_DIR = SCRIPT_DIR.parent / "Collection_compacte"
+
+
+def textes_documents(doc_ids: list, extension: str):
+    """Générateur (nom_doc, texte) sur les fichiers individuels présents."""
+    for doc_id in doc_ids:
+        path = COLLECTION_DIR / f"{doc_id}{extension}"
+        if not path.is_file():
+            print(f"ATTENTION : fichier manquant {path}, ignoré.")
+            continue
+        yield doc_id, path.read_text(encoding="utf-8", errors="ignore")
+
+
+def main() -> None:
+    if not LIST_FILE.is_file():
+        raise SystemExit(f"Fichier introuvable : {LIST_FILE}")
+
+    representations = sys.argv[1:] or list(REPRESENTATIONS)
+    for r in representations:
+        if r not in REPRESENTATIONS:
+            raise SystemExit(f"Représentation inconnue : {r} (choisir parmi {', '.join(REPRESENTATIONS)})")
+
+    doc_ids = [line.strip() for line in LIST_FILE.open(encoding="utf-8") if line.strip()]
+
+    for r in representations:
+        n = ecrire_collection_compacte(COMPACTE_DIR, r, textes_documents(doc_ids, REPRESENTATIONS[r]))
+        print(f"{r} : {n} documents écrits dans {COMPACTE_DIR}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: compresser_collection.py
+Objectif du programme:
+    Construire le magasin compressé Collection_compressee/ : les textes de
+    Collection/ (CACM-N, .flt, .stp) sont regroupés par blocs compressés
+    (zlib ou lzma), avec un petit index de blocs. Les scripts qui lisent les
+    documents l'utilisent automatiquement quand Collection_compacte/ est absente.
+    Affiche la taille obtenue et le coût moyen d'une lecture aléatoire.
+Usage :
+  python compresser_collection.py                  # zlib, représentations flt et stp
+  python compresser_collection.py lzma             # compression lzma
+  python compresser_collection.py zlib brut stp    # méthode puis représentations
+"""
+
+from pathlib import Path
+import random
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # accès au paquet ri
+
+from ri.collection_compacte import REPRESENTATIONS
+from ri.magasin_compresse import METHODES, MagasinCompresse, chemins, ecrire_magasin_compresse
+from compacter_collection import textes_documents
+
+# Répertoires
+SCRIPT_DIR = Path(__file__).resolve().parent.parent
+COLLECTION_DIR = SCRIPT_DIR.parent / "Collection"
+LIST_FILE = COLLECTION_DIR / "Collection"
+COMPRESSEE_DIR = SCRIPT_DIR.parent / "Collection_compressee"
+
+NB_LECTURES_TEST = 500
+
+
+def mesurer_acces(representation: str, doc_ids: list) -> float:
+    """Temps moyen (ms) d'une lecture de document dans un ordre aléatoire."""
+    tirage = random.Random(0).choices(doc_ids, k=NB_LECTURES_TEST)
+    with MagasinCompresse(COMPRESSEE_DIR, representation) as magasin:
+        debut = time.perf_counter()
+        for doc_id in tirage:
+            magasin.lire_texte(doc_id)
+        duree = time.perf_counter() - debut
+    return 1000 * duree / len(tirage)
+
+
+def main() -> None:
+    if not LIST_FILE.is_file():
+        raise SystemExit(f"Fichier introuvable : {LIST_FILE}")
+
+    args = sys.argv[1:]
+    methode = args.pop(0) if args and args[0] in METHODES else "zlib"
+    representations = args or ["flt", "stp"]
+    for r in representations:
+        if r not in REPRESENTATIONS:
+            raise SystemExit(f"Représentation inconnue : {r} (choisir parmi {', '.join(REPRESENTATIONS)})")
+
+    doc_ids = [line.strip() for line in LIST_FILE.open(encoding="utf-8") if line.strip()]
+
+    for r in representations:
+        taille_brute = 0
+
+        def textes():
+            nonlocal taille_brute
+            for doc_id, texte in textes_documents(doc_ids, REPRESENTATIONS[r]):
+                taille_brute += len(texte.encode("utf-8"))
+                yield doc_id, texte
+
+        n = ecrire_magasin_compresse(COMPRESSEE_DIR, r, textes(), methode)
+        path_blocs, path_idx = chemins(COMPRESSEE_DIR, r)
+        taille = path_blocs.stat().st_size + path_idx.stat().st_size
+        ratio = taille / taille_brute if taille_brute else 0.0
+        print(f"{r} ({methode}) : {n} documents, {taille_brute} -> {taille} octets "
+              f"({ratio:.1%}), lecture aléatoire {mesurer_acces(r, doc_ids):.3f} ms/doc")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: executer_pipeline.py
+Objectif du programme:
+    Enchaîner les scripts du TP (décodage, nettoyage, vocabulaire, df, vecteurs,
+    index, ...) sans les lancer à la main : chaque étape n'est relancée que si
+    le contenu de ses entrées, de son script ou des modules du paquet ri
+    (pour les scripts Python) a changé depuis la dernière exécution réussie,
+    ou si ses sorties ont disparu ou été modifiées.
+    Les étapes indépendantes (par exemple les trois vecteurs) tournent en parallèle.
+    L'état (empreintes SHA-256) est conservé dans outputs/.etat_pipeline.json.
+Usage :
+  python executer_pipeline.py                    # toutes les étapes
+  python executer_pipeline.py tfidf index        # ces étapes et leurs dépendances
+  python executer_pipeline.py --forcer tf        # relance même si tout est à jour
+  python executer_pipeline.py -j 2               # au plus 2 étapes simultanées
+  python executer_pipeline.py --liste            # affiche les étapes et leur état
+"""
+
+from pathlib import Path
+import argparse
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # accès au paquet ri
+
+from ri.taches import Etape, Pipeline
+
+# Répertoires
+SCRIPT_DIR = Path(__file__).resolve().parent.parent
+RACINE = SCRIPT_DIR.parent
+FICHIER_ETAT = RACINE / "outputs" / ".etat_pipeline.json"
+
+# Entrées communes (motifs relatifs à la racine du projet)
+DOCS_BRUTS = "Collection/CACM-*[0-9]"
+DOCS_FLT = "Collection/*.flt"
+DOCS_STP = "Collection/*.stp"
+LISTE_DOCS = "Collection/Collection"
+MOTS_VIDES = ("Collection/common_words", "outputs/common_words")
+# Les scripts qui lisent les .stp ou les .flt passent par SourceDocuments : les magasins groupés comptent aussi
+STP_GROUPES = ("Collection_compacte/stp.*", "Collection_compressee/stp.*")
+FLT_GROUPES = ("Collection_compacte/flt.*", "Collection_compressee/flt.*")
+# Les scripts Python importent le paquet ri : une modification de ses modules relance l'étape
+PAQUET_RI = ("Python_scripts/ri/*.py",)
+VOCAB = "outputs/vocabulaire.txt"
+DF = "outputs/df.txt"
+
+ETAPES = [
+    Etape("decodage", ("perl", "5_Processus_en_python/DecodeCACMXX.pl"),
+          ("Python_scripts/5_Processus_en_python/cacm.all",),
+          (DOCS_BRUTS, LISTE_DOCS)),
+    Etape("nettoyage", ("perl", "5_Processus_en_python/clean.pl"),
+          (DOCS_BRUTS, LISTE_DOCS), (DOCS_FLT,), ("decodage",)),
+    Etape("mots_vides", ("perl", "5_Processus_en_python/remove.pl"),
+          (DOCS_FLT, LISTE_DOCS) + MOTS_VIDES, (DOCS_STP,), ("nettoyage",)),
+    Etape("html_nettoye", ("python", "5_Processus_en_python/clean_v2.py"),
+          (DOCS_FLT, LISTE_DOCS) + PAQUET_RI, ("outputs/Collection1.html",), ("nettoyage",)),
+    Etape("html_sans_mots_vides", ("python", "5_Processus_en_python/remove_v2.py"),
+          (DOCS_STP, LISTE_DOCS) + PAQUET_RI, ("outputs/Collection2.html",), ("mots_vides",)),
+    Etape("vocabulaire", ("python", "6_Calcul_des_valeurs_classiques/vocabulary.py"),
+          (DOCS_FLT, LISTE_DOCS) + FLT_GROUPES + PAQUET_RI, (VOCAB, "outputs/vocabulaire.dict"), ("nettoyage",)),
+    Etape("df", ("python", "6_Calcul_des_valeurs_classiques/df.py"),
+          (DOCS_STP, LISTE_DOCS) + STP_GROUPES + PAQUET_RI, (DF,), ("mots_vides",)),
+    Etape("compteur", ("python", "7_Analyse_de_la_collection/count.py"),
+          (DOCS_STP,) + PAQUET_RI, ("outputs/counter.txt",), ("mots_vides",)),
+    Etape("termfreq", ("python", "7_Analyse_de_la_collection/TermFreq.py"),
+          (DOCS_STP,) + PAQUET_RI, ("outputs/termfreq.txt",), ("mots_vides",)),
+    Etape("zipf", ("python", "7_Analyse_de_la_collection/zipf_plot.py"),
+          ("outputs/counter.txt",) + PAQUET_RI, ("outputs/zipf_plot.png",), ("compteur",)),
+    Etape("binaire", ("python", "7_Analyse_de_la_collection/vecteurBinaire.py"),
+          (DOCS_STP, LISTE_DOCS, VOCAB) + STP_GROUPES + PAQUET_RI, ("outputs/vecteurBinaire.txt",),
+          ("mots_vides", "vocabulaire")),
+    Etape("tf", ("python", "7_Analyse_de_la_collection/vecteurTF.py"),
+          (DOCS_STP, LISTE_DOCS, VOCAB) + STP_GROUPES + PAQUET_RI, ("outputs/vecteurTF.txt",),
+          ("mots_vides", "vocabulaire")),
+    Etape("tfidf", ("python", "7_Analyse_de_la_collection/vecteurTFIDF.py"),
+          (DOCS_STP, LISTE_DOCS, VOCAB, DF) + STP_GROUPES + PAQUET_RI,
+          ("outputs/vecteurTFIDF.txt",),
+          ("mots_vides", "vocabulaire", "df")),
+    Etape("index", ("python", "8_Construction_de_fichier_inverse/indexInverse.py"),
+          (DOCS_STP, LISTE_DOCS, VOCAB) + STP_GROUPES + PAQUET_RI,
+          ("outputs/indexInverse.txt", "outputs/indexPositionnel.txt"),
+          ("mots_vides", "vocabulaire")),
+    Etape("bm25", ("python", "8_Construction_de_fichier_inverse/indexBM25.py"),
+          (DOCS_STP, LISTE_DOCS, VOCAB) + STP_GROUPES + PAQUET_RI,
+          ("outputs/indexBM25.txt", "outputs/longueursDocs.txt"),
+          ("mots_vides", "vocabulaire")),
+    Etape("impacts", ("python", "8_Construction_de_fichier_inverse/indexImpacts.py"),
+          (DOCS_STP, LISTE_DOCS, VOCAB) + STP_GROUPES + PAQUET_RI, ("outputs/indexImpacts.txt",),
+          ("mots_vides", "vocabulaire")),
+]
+
+
+def afficher_liste(pipeline: Pipeline) -> None:
+    """Affiche chaque étape, ses dépendances et si elle serait relancée."""
+    for nom in pipeline.ordre:
+        etape = pipeline.etapes[nom]
+        etat = "à jour" if pipeline.a_jour(etape, pipeline.empreinte_entrees(etape)) else "à relancer"
+        deps = ", ".join(etape.dependances) or "-"
+        print(f"{nom:22} {etat:11} (dépend de : {deps})")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Exécution incrémentale des étapes du TP.")
+    parser.add_argument("etapes", nargs="*", help="étapes à exécuter (défaut : toutes)")
+    parser.add_argument("--forcer", action="store_true", help="relancer même les étapes à jour")
+    parser.add_argument("-j", "--taches", type=int, default=4, help="étapes simultanées au maximum")
+    parser.add_argument("--liste", action="store_true", help="afficher les étapes sans rien exécuter")
+    args = parser.parse_args()
+
+    pipeline = Pipeline(ETAPES, RACINE, SCRIPT_DIR, FICHIER_ETAT)
+
+    if args.liste:
+        afficher_liste(pipeline)
+        return
+
+    try:
+        demandees = pipeline.fermeture(args.etapes or pipeline.ordre)
+    except ValueError as e:
+        raise SystemExit(f"{e} (choisir parmi : {', '.join(pipeline.ordre)})")
+
+    debut = time.perf_counter()
+    statut = pipeline.executer(demandees, forcer=args.forcer, nb_taches=args.taches)
+    duree = time.perf_counter() - debut
+
+    bilan = {s: sum(1 for v in statut.values() if v == s) for s in ("executee", "a jour", "echec", "annulee")}
+    print(f"\n{len(statut)} étapes en {duree:.2f} s : {bilan['executee']} exécutées, "
+          f"{bilan['a jour']} à jour, {bilan['echec']} en échec, {bilan['annulee']} annulées")
+    if bilan["echec"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
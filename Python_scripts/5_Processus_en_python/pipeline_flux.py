@@ -0,0 +1,154 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: pipeline_flux.py
+Objectif du programme:
+    Remplacer l'enchaînement DecodeCACMXX.pl -> clean.pl -> remove.pl -> scripts
+    Python par un seul passage en flux sur cacm.all : chaque document est décodé,
+    nettoyé, filtré, puis transmis directement au calcul du vocabulaire, des df,
+    des occurrences, de l'index inversé et des vecteurs.
+    Les fichiers de Collection/ ne sont écrits que sur demande (--collection).
+Usage :
+  python pipeline_flux.py                                 # toutes les sorties de outputs/
+  python pipeline_flux.py --collection                    # écrit aussi Collection/
+  python pipeline_flux.py --compacte                      # écrit Collection_compacte/
+  python pipeline_flux.py --compressee                    # écrit Collection_compressee/
+  python pipeline_flux.py --npz                           # vecteurs aussi au format binaire .npz
+  python pipeline_flux.py --racinisation                  # aussi les sorties racinisées (Porter)
+                                                          # dans outputs/racinise/
+  python pipeline_flux.py --sorties vocabulaire,df,index  # sous-ensemble des sorties
+"""
+
+from pathlib import Path
+import argparse
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # accès au paquet ri
+
+from ri import flux
+from ri.collection_compacte import EcrivainCollectionCompacte
+from ri.magasin_compresse import EcrivainMagasinCompresse
+from ri.racinisation import Raciniseur
+
+# Répertoires
+SCRIPT_DIR = Path(__file__).resolve().parent.parent
+CACM_FILE = Path(__file__).resolve().parent / "cacm.all"
+COLLECTION_DIR = SCRIPT_DIR.parent / "Collection"
+OUTPUT_DIR = SCRIPT_DIR.parent / "outputs"
+COMPACTE_DIR = SCRIPT_DIR.parent / "Collection_compacte"
+COMPRESSEE_DIR = SCRIPT_DIR.parent / "Collection_compressee"
+RACINISE_DIR = OUTPUT_DIR / "racinise"
+
+SORTIES = ("vocabulaire", "df", "counter", "index", "binaire", "tf", "tfidf")
+
+
+def trouver_mots_vides() -> Path:
+    """Même recherche que remove.pl : Collection/common_words puis outputs/common_words."""
+    for path in (COLLECTION_DIR / "common_words", OUTPUT_DIR / "common_words"):
+        if path.is_file():
+            return path
+    raise SystemExit("Fichier common_words introuvable (Collection/ ou outputs/).")
+
+
+def consommateurs_sorties(sorties: set, dossier: Path, vecteurs_npz: bool = False) -> list:
+    """Consommateurs (dans l'ordre) qui écrivent les sorties demandées dans `dossier`."""
+    def chemin(nom_sortie: str, nom_fichier: str):
+        return dossier / nom_fichier if nom_sortie in sorties else None
+
+    # Le vocabulaire et les df sont toujours calculés : l'index et les vecteurs en dépendent
+    vocabulaire = flux.Vocabulaire(chemin("vocabulaire", "vocabulaire.txt"))
+    df = flux.FrequencesDocumentaires(chemin("df", "df.txt"))
+    consommateurs = [vocabulaire, df]
+
+    if "counter" in sorties:
+        consommateurs.append(flux.Compteur(dossier / "counter.txt"))
+    if "index" in sorties:
+        consommateurs.append(flux.IndexInverse(
+            vocabulaire,
+            dossier / "indexInverse.txt",
+            dossier / "indexPositionnel.txt",
+        ))
+    if sorties & {"binaire", "tf", "tfidf"}:
+        consommateurs.append(flux.Vecteurs(
+            vocabulaire, df,
+            binaire_file=chemin("binaire", "vecteurBinaire.txt"),
+            tf_file=chemin("tf", "vecteurTF.txt"),
+            tfidf_file=chemin("tfidf", "vecteurTFIDF.txt"),
+            npz=vecteurs_npz,
+        ))
+    return consommateurs
+
+
+def construire_consommateurs(sorties: set, ecrire_collection: bool,
+                             ecrire_compacte: bool = False,
+                             ecrire_compressee: bool = False,
+                             vecteurs_npz: bool = False,
+                             raciniseur: Raciniseur | None = None) -> list:
+    """Construit la liste ordonnée des consommateurs correspondant aux sorties demandées."""
+    consommateurs = consommateurs_sorties(sorties, OUTPUT_DIR, vecteurs_npz)
+    if raciniseur is not None:
+        # mêmes sorties sur les textes racinisés, dans le même passage
+        RACINISE_DIR.mkdir(parents=True, exist_ok=True)
+        consommateurs.append(flux.Racinisation(
+            raciniseur, consommateurs_sorties(sorties, RACINISE_DIR, vecteurs_npz)))
+    if ecrire_collection:
+        consommateurs.append(flux.EcrivainCollection(COLLECTION_DIR))
+    if ecrire_compacte:
+        consommateurs.append(EcrivainCollectionCompacte(COMPACTE_DIR))
+    if ecrire_compressee:
+        consommateurs.append(EcrivainMagasinCompresse(COMPRESSEE_DIR))
+
+    return consommateurs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Préparation de la collection CACM en un seul passage.")
+    parser.add_argument("--sorties", default=",".join(SORTIES),
+                        help=f"sorties à écrire dans outputs/, parmi : {','.join(SORTIES)}")
+    parser.add_argument("--collection", action="store_true",
+                        help="écrire aussi les fichiers CACM-N, .flt et .stp dans Collection/")
+    parser.add_argument("--compacte", action="store_true",
+                        help="écrire la collection compacte (un fichier par représentation)")
+    parser.add_argument("--compressee", action="store_true",
+                        help="écrire le magasin compressé par blocs (flt et stp)")
+    parser.add_argument("--npz", action="store_true",
+                        help="écrire aussi les vecteurs au format binaire CSR (.npz)")
+    parser.add_argument("--racinisation", action="store_true",
+                        help=f"écrire aussi les sorties racinisées (Porter, NLTK) dans {RACINISE_DIR}")
+    args = parser.parse_args()
+
+    sorties = {s.strip() for s in args.sorties.split(",") if s.strip()}
+    inconnues = sorties - set(SORTIES)
+    if inconnues:
+        raise SystemExit(f"Sorties inconnues : {', '.join(sorted(inconnues))}")
+
+    if not CACM_FILE.is_file():
+        raise SystemExit(f"Fichier introuvable : {CACM_FILE}")
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+    raciniseur = None
+    if args.racinisation:
+        try:
+            raciniseur = Raciniseur()
+        except ImportError as e:
+            raise SystemExit(str(e))
+
+    mots_vides = flux.charger_mots_vides(trouver_mots_vides())
+    consommateurs = construire_consommateurs(sorties, args.collection, args.compacte,
+                                             args.compressee, args.npz, raciniseur)
+
+    debut = time.perf_counter()
+    nb_docs = flux.executer(flux.flux_documents(CACM_FILE, mots_vides), consommateurs)
+    duree = time.perf_counter() - debut
+
+    print(f"{nb_docs} documents traités en {duree:.2f} s ; sorties : {', '.join(sorted(sorties))}"
+          + (" + Collection/" if args.collection else "")
+          + (" + Collection_compacte/" if args.compacte else "")
+          + (" + Collection_compressee/" if args.compressee else "")
+          + (" + outputs/racinise/" if raciniseur is not None else ""))
+    if raciniseur is not None:
+        print(raciniseur.statistiques())
+
+
+if __name__ == "__main__":
+    main()
@@ -4,48 +4,63 @@ Nom du fichier: df.py
 Objectif du programme:
     Calculer la fréquence documentaire (DF) de chaque terme du vocabulaire,
     c’est-à-dire le nombre de documents dans lesquels il apparaît.
+    Les textes sont lus par SourceDocuments (collection compacte si elle
+    existe, sinon un fichier par document), dans l'ordre de Collection/Collection.
 """
 
 from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # accès au paquet ri
+
+from ri.collection_compacte import SourceDocuments
+from ri.incremental import documents_source
 
 SCRIPT_DIR = Path(__file__).resolve().parent.parent
 BASE_DIR = SCRIPT_DIR.parent / "Collection"
 OUTPUT_FILE = SCRIPT_DIR.parent/"outputs"/"df.txt"
-INPUT_FILE_TYPE = ".stp" # Choisir entre ".stp" et ".flt"
-df = {}
+REPRESENTATION = "stp" # Choisir entre "stp" et "flt"
+
+
+def calculer_df(collection_dir: Path, representation: str = REPRESENTATION) -> dict:
+    """{mot: nombre de documents de `collection_dir` qui le contiennent}."""
+    df = {}
+    source = SourceDocuments(collection_dir, representation)
+
+    for _, contenu in documents_source(collection_dir / "Collection", source):
+        # Extraire les mots du document
+        mots = contenu.split()
 
-for fichier in BASE_DIR.iterdir():
+        # Conserver chaque mot une seule fois par document
+        mots_uniques = set(mots)
 
-    if not fichier.name.startswith("CACM"):
-        continue
-    if not fichier.name.endswith(INPUT_FILE_TYPE):
-        continue
+        # Mettre à jour le dictionnaire df
+        for mot in mots_uniques:
+            if mot not in df:
+                df[mot] = 1
+            else:
+                df[mot] += 1
 
-    with fichier.open(encoding="utf-8") as f:
-        contenu = f.read()
+    if representation == "stp":
+        df.pop("cacm", None)
+    return df
 
-    # Extraire les mots du document
-    mots = contenu.split()
 
-    # Conserver chaque mot une seule fois par document
-    mots_uniques = set(mots)
+def ecrire_df(df: dict, output_file: Path) -> None:
+    # Trier par fréquence documentaire décroissante
+    df_tries = sorted(df.items(), key=lambda x: x[1], reverse=True)
 
-    # Mettre à jour le dictionnaire df
-    for mot in mots_uniques:
-        if mot not in df:
-            df[mot] = 1
-        else:
-            df[mot] += 1
+    # Écrire les résultats TRIÉS dans df.txt
+    with output_file.open("w", encoding="utf-8") as out:
+        for mot, freq in df_tries:
+            out.write(f"{mot} {freq}\n")
 
-if INPUT_FILE_TYPE == ".stp":
-    df.pop("cacm")
 
-# Trier par fréquence documentaire décroissante
-df_tries = sorted(df.items(), key=lambda x: x[1], reverse=True)
+def main() -> None:
+    df = calculer_df(BASE_DIR)
+    ecrire_df(df, OUTPUT_FILE)
+    print("Fichier df.txt créé avec", len(df), "mots.")
 
-# Écrire les résultats TRIÉS dans df.txt
-with OUTPUT_FILE.open("w", encoding="utf-8") as out:
-    for mot, freq in df_tries:
-        out.write(f"{mot} {freq}\n")
 
-print("Fichier df.txt créé avec", len(df), "mots.")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
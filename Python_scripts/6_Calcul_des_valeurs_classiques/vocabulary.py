@@ -4,41 +4,64 @@ Nom du fichier: vocabulary.py
 Objectif du programme:
     Construire le vocabulaire de la collection en extrayant l’ensemble des mots distincts
     à partir des documents textuels.
+    Les textes .flt sont lus par SourceDocuments (collection compacte si elle
+    existe, sinon un fichier par document), dans l'ordre de Collection/Collection.
 """
 
 from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # accès au paquet ri
+
+from ri.collection_compacte import SourceDocuments
+from ri.dictionnaire import ecrire_dictionnaire
+from ri.incremental import documents_source
 
-vocabulaire = []
 SCRIPT_DIR = Path(__file__).resolve().parent.parent
 BASE_DIR = SCRIPT_DIR.parent / "Collection"
 OUTPUT_FILE = SCRIPT_DIR.parent/"outputs"/"vocabulaire.txt"
 
-# Parcourir uniquement les fichiers .flt
-for fichier in BASE_DIR.iterdir():
-    # Parcourt seulement les fichiers texte et non les fichiers HTML
-    if not fichier.name.startswith("CACM"):
-        continue
 
-    if not fichier.name.endswith(".flt"):
-        continue
+def construire_vocabulaire(collection_dir: Path) -> list:
+    """Mots distincts des .flt des documents de `collection_dir`, triés."""
+    vocabulaire = []
+    deja_vus = set()  # test d'appartenance en temps constant (la liste garde l'ordre)
+    source = SourceDocuments(collection_dir, "flt")
 
-    with fichier.open(encoding="utf-8") as f:
-        for ligne in f:
+    # Parcourir uniquement les textes .flt
+    for _, texte in documents_source(collection_dir / "Collection", source):
+        for ligne in texte.splitlines():
             ligne = ligne.strip()
             mots = ligne.split(" ")
 
             for mot in mots:
                 if mot == "":
                     continue
-                if mot not in vocabulaire:
+                if mot not in deja_vus:
+                    deja_vus.add(mot)
                     vocabulaire.append(mot)
 
-# Trier le vocabulaire en ordre alphabétique
-vocabulaire.sort()
+    # Trier le vocabulaire en ordre alphabétique
+    vocabulaire.sort()
+    return vocabulaire
+
+
+def ecrire_vocabulaire(vocabulaire: list, output_file: Path) -> None:
+    """vocabulaire.txt, puis le dictionnaire des termes vocabulaire.dict (ri.dictionnaire)."""
+    with output_file.open("w", encoding="utf-8") as out:
+        for mot in vocabulaire:
+            out.write(mot + "\n")
+    ecrire_dictionnaire(output_file, vocabulaire)
+
+
+def main() -> None:
+    vocabulaire = construire_vocabulaire(BASE_DIR)
+
+    # Écrire dans vocabulaire.txt
+    ecrire_vocabulaire(vocabulaire, OUTPUT_FILE)
+
+    print("Fichier vocabulaire.txt créé avec", len(vocabulaire), "mots.")
 
-# Écrire dans vocabulaire.txt
-with OUTPUT_FILE.open("w", encoding="utf-8") as out:
-    for mot in vocabulaire:
-        out.write(mot + "\n")
 
-print("Fichier vocabulaire.txt créé avec", len(vocabulaire), "mots.")
+if __name__ == "__main__":
+    main()
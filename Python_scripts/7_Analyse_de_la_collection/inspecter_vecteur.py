@@ -0,0 +1,75 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: inspecter_vecteur.py
+Objectif du programme:
+    Afficher le vecteur d'un ou plusieurs documents (termes et poids), en lisant
+    uniquement leurs lignes dans outputs/vecteur*.txt grâce à l'index des
+    débuts de ligne (outputs/vecteur*.off, construit au premier usage).
+    Utile pour déboguer ou ré-ordonner quelques documents sans charger toute
+    la collection.
+Usage :
+  python inspecter_vecteur.py CACM-123                # vecteur TF-IDF
+  python inspecter_vecteur.py CACM-123 CACM-7 --tf    # vecteurs TF
+  python inspecter_vecteur.py CACM-123 --binaire
+"""
+
+from pathlib import Path
+import argparse
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # accès au paquet ri
+
+from ri.dictionnaire import ouvrir_dictionnaire
+from ri.vecteurs import LecteurVecteurs
+
+# Chemins
+DOC_LIST_FILE = Path("Collection/Collection")
+VOCAB_FILE = Path("outputs/vocabulaire.txt")
+FICHIERS = {
+    "binaire": Path("outputs/vecteurBinaire.txt"),
+    "tf": Path("outputs/vecteurTF.txt"),
+    "tfidf": Path("outputs/vecteurTFIDF.txt"),
+}
+
+NB_TERMES_AFFICHES = 15
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Affiche le vecteur de quelques documents.")
+    parser.add_argument("documents", nargs="+", help="identifiants, ex. CACM-123")
+    groupe = parser.add_mutually_exclusive_group()
+    groupe.add_argument("--tf", dest="representation", action="store_const", const="tf")
+    groupe.add_argument("--binaire", dest="representation", action="store_const", const="binaire")
+    parser.set_defaults(representation="tfidf")
+    args = parser.parse_args()
+
+    path_vecteurs = FICHIERS[args.representation]
+    for path in (DOC_LIST_FILE, VOCAB_FILE, path_vecteurs):
+        if not path.is_file():
+            raise SystemExit(f"Fichier introuvable : {path}")
+
+    # La ligne i du fichier de vecteurs correspond au i-ème document de la liste
+    with DOC_LIST_FILE.open("r", encoding="utf-8") as f:
+        position = {nom: i for i, nom in enumerate(line.strip() for line in f if line.strip())}
+    termes = ouvrir_dictionnaire(VOCAB_FILE)
+
+    demandes = {}
+    for nom in args.documents:
+        if nom not in position:
+            print(f"{nom} : document inconnu")
+        else:
+            demandes[position[nom]] = nom
+
+    lecteur = LecteurVecteurs(path_vecteurs, entiers=args.representation != "tfidf")
+    for doc_idx, ids, poids in lecteur.parcourir(demandes):
+        couples = sorted(zip(poids, ids), reverse=True)
+        print(f"\n{demandes[doc_idx]} (ligne {doc_idx + 1}) : {len(ids)} termes")
+        for valeur, idx in couples[:NB_TERMES_AFFICHES]:
+            mot = termes.mot(idx) if 1 <= idx <= len(termes) else "?"
+            print(f"  {mot:20} {valeur:g}")
+        if len(couples) > NB_TERMES_AFFICHES:
+            print(f"  ... ({len(couples) - NB_TERMES_AFFICHES} autres)")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,25 @@ Nom du fichier: vecteurBinaire.py
 Objectif du programme:
     Construire les vecteurs binaires des documents indiquant
     la présence ou l’absence de chaque terme du vocabulaire.
+    Régénération incrémentale : seules les lignes des documents modifiés
+    depuis l'exécution précédente sont recalculées (voir ri/incremental.py).
+Usage :
+  python vecteurBinaire.py            # incrémental
+  python vecteurBinaire.py --complet  # tout recalculer
+  python vecteurBinaire.py --npz      # écrit aussi outputs/vecteurBinaire.npz
 """
 
 
 from pathlib import Path
+import argparse
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # accès au paquet ri
+
+from ri.collection_compacte import SourceDocuments
+from ri.incremental import SortieSegmentee, documents_source, empreinte_fichier
+from ri.index import charger_ids_termes
+from ri.vecteurs import convertir_en_npz, formater_ligne
 
 # Constantes de chemins
 COLLECTION_DIR = Path("Collection")
@@ -16,31 +31,12 @@ VOCAB_FILE = Path("outputs/vocabulaire.txt")
 OUTPUT_FILE = Path("outputs/vecteurBinaire.txt")
 
 
-def charger_vocabulaire(path_vocab: Path) -> dict:
-    """
-    Charge le vocabulaire depuis 'vocabulaire.txt' et
-    renvoie un dictionnaire {mot: idTerme}, avec idTerme à partir de 1.
+def vecteur_binaire_pour_document(texte: str, index_vocab: dict) -> str:
     """
-    mots = []
-
-    with path_vocab.open("r", encoding="utf-8") as f:
-        for line in f:
-            mot = line.strip()
-            if mot:
-                mots.append(mot)
-
-    # numérotation des termes à partir de 1
-    index_vocab = {mot: i + 1 for i, mot in enumerate(mots)}
-    return index_vocab
-
-
-def vecteur_binaire_pour_document(doc_path: Path, index_vocab: dict) -> str:
-    """
-    Construit la représentation binaire pour un document donné.
+    Construit la représentation binaire pour un document donné (texte du .stp).
 
     Retourne une chaîne de la forme "id1:1 id2:1 id3:1 ..."
     """
-    texte = doc_path.read_text(encoding="utf-8", errors="ignore")
     mots = texte.split()
 
     # Ensemble des mots uniques dans le document
@@ -57,42 +53,52 @@ def vecteur_binaire_pour_document(doc_path: Path, index_vocab: dict) -> str:
     indices_tries = sorted(indices_doc)
 
     # Construction de la ligne "id:1 id:1 ..."
-    couples = [f"{idx}:1" for idx in indices_tries]
-    return " ".join(couples)
+    return formater_ligne(indices_tries, [1] * len(indices_tries), entiers=True)
+
+
+def construire_vecteurs_binaires(collection_dir: Path, vocab_file: Path, output_file: Path,
+                                 complet: bool = False) -> dict:
+    """
+    Vecteurs binaires des documents de `collection_dir` dans `output_file`
+    (incrémental, sauf `complet`). Renvoie les statistiques de la régénération.
+    """
+    index_vocab = charger_ids_termes(vocab_file)
+    # Texte filtré : "Collection/<nom>.stp" ou collection compacte ; les documents
+    # manquants sont sautés, les lignes des documents inchangés sont reprises
+    source = SourceDocuments(collection_dir, "stp")
+    sortie = SortieSegmentee(output_file)
+    return sortie.regenerer(
+        documents_source(collection_dir / "Collection", source),
+        lambda texte: vecteur_binaire_pour_document(texte, index_vocab),
+        contexte=empreinte_fichier(vocab_file),
+        complet=complet,
+    )
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Vecteurs binaires des documents.")
+    parser.add_argument("--complet", action="store_true",
+                        help="tout recalculer sans tenir compte du manifeste")
+    parser.add_argument("--npz", action="store_true",
+                        help="écrire aussi la version binaire CSR (.npz) à côté du texte")
+    args = parser.parse_args()
+
     # Vérification de l'existence du dossier Collection
     if not COLLECTION_DIR.is_dir():
         raise SystemExit(f"Dossier introuvable : {COLLECTION_DIR}")
 
-    # Chargement du vocabulaire
     if not VOCAB_FILE.is_file():
         raise SystemExit(f"Fichier vocabulaire introuvable : {VOCAB_FILE}")
-    index_vocab = charger_vocabulaire(VOCAB_FILE)
-
-    # Ouverture des fichiers de liste de docs et de sortie
     if not DOC_LIST_FILE.is_file():
         raise SystemExit(f"Fichier de liste de documents introuvable : {DOC_LIST_FILE}")
 
-    with DOC_LIST_FILE.open("r", encoding="utf-8") as f_docs, \
-         OUTPUT_FILE.open("w", encoding="utf-8") as f_out:
-
-        for line in f_docs:
-            nom_doc = line.strip()
-            if not nom_doc:
-                continue
-
-            # On suppose que le texte filtré est dans "Collection/<nom>.stp"
-            doc_path = COLLECTION_DIR / f"{nom_doc}.stp"
-
-            if not doc_path.is_file():
-                # On peut choisir de sauter ou d'afficher un avertissement
-                # Ici on saute silencieusement
-                continue
+    stats = construire_vecteurs_binaires(COLLECTION_DIR, VOCAB_FILE, OUTPUT_FILE, args.complet)
+    print(f"{stats['recalcules']}/{stats['documents']} documents recalculés, "
+          f"{stats['segments_ecrits']}/{stats['segments']} segments réécrits")
 
-            vecteur = vecteur_binaire_pour_document(doc_path, index_vocab)
-            f_out.write(vecteur + "\n")
+    if args.npz:
+        path_npz = convertir_en_npz(OUTPUT_FILE, entiers=True, type_valeurs="B")
+        print(f"Version binaire écrite : {path_npz}")
 
 
 if __name__ == "__main__":
@@ -4,10 +4,25 @@ Nom du fichier: vecteurTF.py
 Objectif du programme:
     Construire les vecteurs de fréquence des termes (TF)
     pour chaque document de la collection.
+    Régénération incrémentale : seules les lignes des documents modifiés
+    depuis l'exécution précédente sont recalculées (voir ri/incremental.py).
+Usage :
+  python vecteurTF.py            # incrémental
+  python vecteurTF.py --complet  # tout recalculer
+  python vecteurTF.py --npz      # écrit aussi outputs/vecteurTF.npz
 """
 
 
 from pathlib import Path
+import argparse
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # accès au paquet ri
+
+from ri.collection_compacte import SourceDocuments
+from ri.incremental import SortieSegmentee, documents_source, empreinte_fichier
+from ri.index import charger_ids_termes
+from ri.vecteurs import convertir_en_npz, formater_ligne
 
 COLLECTION_DIR = Path("Collection")
 DOC_LIST_FILE = COLLECTION_DIR / "Collection"
@@ -15,23 +30,11 @@ VOCAB_FILE = Path("outputs/vocabulaire.txt")
 OUTPUT_FILE = Path("outputs/vecteurTF.txt")
 
 
-def charger_vocabulaire(path_vocab: Path) -> dict:
-    """Retourne un dict {mot: idTerme} avec idTerme à partir de 1."""
-    mots = []
-    with path_vocab.open("r", encoding="utf-8") as f:
-        for line in f:
-            mot = line.strip()
-            if mot:
-                mots.append(mot)
-    return {mot: i + 1 for i, mot in enumerate(mots)}
-
-
-def vecteur_tf_pour_document(doc_path: Path, index_vocab: dict) -> str:
+def vecteur_tf_pour_document(texte: str, index_vocab: dict) -> str:
     """
-    Construit la représentation TF pour un document :
+    Construit la représentation TF pour un document (texte du .stp) :
     renvoie une chaîne "id1:tf1 id2:tf2 ..."
     """
-    texte = doc_path.read_text(encoding="utf-8", errors="ignore")
     mots = texte.split()
 
     # compteur idTerme -> fréquence dans ce document
@@ -44,11 +47,37 @@ def vecteur_tf_pour_document(doc_path: Path, index_vocab: dict) -> str:
 
     # indices triés pour une sortie déterministe
     indices_tries = sorted(counter.keys())
-    couples = [f"{idx}:{counter[idx]}" for idx in indices_tries]
-    return " ".join(couples)
+    return formater_ligne(indices_tries, [counter[idx] for idx in indices_tries], entiers=True)
+
+
+def construire_vecteurs_tf(collection_dir: Path, vocab_file: Path, output_file: Path,
+                           complet: bool = False) -> dict:
+    """
+    Vecteurs TF des documents de `collection_dir` dans `output_file`
+    (incrémental, sauf `complet`). Renvoie les statistiques de la régénération.
+    """
+    index_vocab = charger_ids_termes(vocab_file)
+    # Collection_compacte/ si elle existe, sinon un fichier .stp par document
+    source = SourceDocuments(collection_dir, "stp")
+
+    # Les documents manquants sont sautés ; les lignes des documents inchangés sont reprises
+    sortie = SortieSegmentee(output_file)
+    return sortie.regenerer(
+        documents_source(collection_dir / "Collection", source),
+        lambda texte: vecteur_tf_pour_document(texte, index_vocab),
+        contexte=empreinte_fichier(vocab_file),
+        complet=complet,
+    )
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Vecteurs TF des documents.")
+    parser.add_argument("--complet", action="store_true",
+                        help="tout recalculer sans tenir compte du manifeste")
+    parser.add_argument("--npz", action="store_true",
+                        help="écrire aussi la version binaire CSR (.npz) à côté du texte")
+    args = parser.parse_args()
+
     if not COLLECTION_DIR.is_dir():
         raise SystemExit(f"Dossier introuvable : {COLLECTION_DIR}")
     if not VOCAB_FILE.is_file():
@@ -56,23 +85,13 @@ def main() -> None:
     if not DOC_LIST_FILE.is_file():
         raise SystemExit(f"Fichier de liste de documents introuvable : {DOC_LIST_FILE}")
 
-    index_vocab = charger_vocabulaire(VOCAB_FILE)
-
-    with DOC_LIST_FILE.open("r", encoding="utf-8") as f_docs, \
-         OUTPUT_FILE.open("w", encoding="utf-8") as f_out:
-
-        for line in f_docs:
-            nom_doc = line.strip()
-            if not nom_doc:
-                continue
-
-            doc_path = COLLECTION_DIR / f"{nom_doc}.stp"
-            if not doc_path.is_file():
-                # Document filtré manquant -> on saute
-                continue
+    stats = construire_vecteurs_tf(COLLECTION_DIR, VOCAB_FILE, OUTPUT_FILE, args.complet)
+    print(f"{stats['recalcules']}/{stats['documents']} documents recalculés, "
+          f"{stats['segments_ecrits']}/{stats['segments']} segments réécrits")
 
-            vecteur = vecteur_tf_pour_document(doc_path, index_vocab)
-            f_out.write(vecteur + "\n")
+    if args.npz:
+        path_npz = convertir_en_npz(OUTPUT_FILE, entiers=True, type_valeurs="i")
+        print(f"Version binaire écrite : {path_npz}")
 
 
 if __name__ == "__main__":
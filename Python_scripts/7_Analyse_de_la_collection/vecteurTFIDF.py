@@ -4,11 +4,29 @@ Nom du fichier: vecteurTFIDF.py
 Objectif du programme:
     Construire les vecteurs TF-IDF des documents en combinant
     la fréquence des termes et la fréquence documentaire.
+    Régénération incrémentale (voir ri/incremental.py) : une ligne n'est
+    recalculée que si le document a changé ou si l'idf d'un de ses termes
+    s'est écarté de plus de --tolerance de la valeur utilisée pour l'écrire.
+Usage :
+  python vecteurTFIDF.py                   # incrémental, tolérance par défaut
+  python vecteurTFIDF.py --tolerance 0     # idf exacts (toute variation recalcule)
+  python vecteurTFIDF.py --complet         # tout recalculer
+  python vecteurTFIDF.py --npz             # écrit aussi outputs/vecteurTFIDF.npz
+  python vecteurTFIDF.py --npz --poids q8  # .npz aux poids quantifiés sur 8 bits
 """
 
 
 from pathlib import Path
+import argparse
 import math
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # accès au paquet ri
+
+from ri.collection_compacte import SourceDocuments
+from ri.incremental import SortieSegmentee, documents_source, empreinte_fichier
+from ri.index import charger_df, charger_ids_termes
+from ri.vecteurs import FORMATS_POIDS, convertir_en_npz, formater_ligne
 
 # Chemins
 COLLECTION_DIR = Path("Collection")
@@ -16,43 +34,9 @@ DOC_LIST_FILE = COLLECTION_DIR / "Collection"
 VOCAB_FILE = Path("outputs/vocabulaire.txt")
 DF_FILE = Path("outputs/df.txt")
 OUTPUT_FILE = Path("outputs/vecteurTFIDF.txt")
-
-
-def charger_vocabulaire(path_vocab: Path) -> dict:
-    """
-    Charge le vocabulaire et retourne un dict {mot: idTerme}
-    avec idTerme numéroté à partir de 1.
-    """
-    mots = []
-    with path_vocab.open("r", encoding="utf-8") as f:
-        for line in f:
-            mot = line.strip()
-            if mot:
-                mots.append(mot)
-    return {mot: i + 1 for i, mot in enumerate(mots)}
-
-
-def charger_df(path_df: Path) -> dict:
-    """
-    Charge le fichier df.txt et retourne un dict {mot: df}.
-    On suppose des lignes "mot df".
-    """
-    df_mot = {}
-    with path_df.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            parts = line.split()
-            if len(parts) < 2:
-                continue
-            mot = parts[0]
-            try:
-                valeur_df = int(parts[1])
-            except ValueError:
-                continue
-            df_mot[mot] = valeur_df
-    return df_mot
+# Écart d'idf en dessous duquel les lignes déjà écrites sont conservées
+# (ajouter un document à ~3200 décale tous les idf d'environ 3e-4)
+TOLERANCE_IDF = 1e-3
 
 
 def compter_documents(path_doc_list: Path) -> int:
@@ -83,12 +67,35 @@ def construire_idf(index_vocab: dict, df_mot: dict, nb_docs: int) -> dict:
     return idf_par_id
 
 
-def tfidf_pour_document(doc_path: Path, index_vocab: dict, idf_par_id: dict) -> str:
+def idf_de_reference(idf_par_id: dict, idf_precedents: list, tolerance: float) -> tuple:
     """
-    Construit la représentation tf.idf pour un document :
+    Compare les idf actuels à ceux utilisés lors de l'exécution précédente
+    (liste indexée par idTerme - 1). Renvoie (idf de référence, termes décalés) :
+    les termes dont l'idf s'est écarté de plus de `tolerance` prennent leur
+    nouvelle valeur, les autres gardent l'ancienne pour rester cohérents avec
+    les lignes conservées.
+    """
+    reference = {}
+    decales = set()
+    for idx, idf in idf_par_id.items():
+        if idx <= len(idf_precedents) and abs(idf - idf_precedents[idx - 1]) <= tolerance:
+            reference[idx] = idf_precedents[idx - 1]
+        else:
+            reference[idx] = idf
+            decales.add(idx)
+    return reference, decales
+
+
+def contient_terme(ligne: str, termes: set) -> bool:
+    """Vrai si la ligne "id:valeur ..." contient l'un des idTermes donnés."""
+    return any(int(couple.split(":", 1)[0]) in termes for couple in ligne.split())
+
+
+def tfidf_pour_document(texte: str, index_vocab: dict, idf_par_id: dict) -> str:
+    """
+    Construit la représentation tf.idf pour un document (texte du .stp) :
     renvoie une chaîne "id1:tfidf1 id2:tfidf2 ..."
     """
-    texte = doc_path.read_text(encoding="utf-8", errors="ignore")
     mots = texte.split()
 
     # compteur idTerme -> tf dans ce document
@@ -108,12 +115,58 @@ def tfidf_pour_document(doc_path: Path, index_vocab: dict, idf_par_id: dict) ->
     # indices triés pour sortie déterministe
     indices_tries = sorted(valeurs.keys())
 
-    # formatage des valeurs (par ex. 6 décimales)
-    couples = [f"{idx}:{valeurs[idx]:.6f}" for idx in indices_tries]
-    return " ".join(couples)
+    # formatage des valeurs (6 décimales), en une opération pour toute la ligne
+    return formater_ligne(indices_tries, [valeurs[idx] for idx in indices_tries])
+
+
+def construire_vecteurs_tfidf(collection_dir: Path, vocab_file: Path, df_file: Path,
+                              output_file: Path, complet: bool = False,
+                              tolerance: float = TOLERANCE_IDF) -> tuple:
+    """
+    Vecteurs TF-IDF des documents de `collection_dir` dans `output_file`
+    (incrémental, sauf `complet`). Renvoie (statistiques de la régénération,
+    nombre d'idf décalés de plus de `tolerance`).
+    """
+    # Chargements
+    index_vocab = charger_ids_termes(vocab_file)
+    df_mot = charger_df(df_file)
+    nb_docs = compter_documents(collection_dir / "Collection")
+    idf_par_id = construire_idf(index_vocab, df_mot, nb_docs)
+    # Collection_compacte/ si elle existe, sinon un fichier .stp par document
+    source = SourceDocuments(collection_dir, "stp")
+
+    # idf utilisés par les lignes existantes (si le vocabulaire n'a pas changé)
+    sortie = SortieSegmentee(output_file)
+    contexte = empreinte_fichier(vocab_file)
+    idf_precedents = []
+    if not complet and sortie.manifeste.get("contexte") == contexte:
+        idf_precedents = sortie.annexe.get("idf", [])
+    idf_ref, decales = idf_de_reference(idf_par_id, idf_precedents, tolerance)
+
+    stats = sortie.regenerer(
+        documents_source(collection_dir / "Collection", source),
+        lambda texte: tfidf_pour_document(texte, index_vocab, idf_ref),
+        contexte=contexte,
+        a_recalculer=(lambda ligne: contient_terme(ligne, decales)) if decales else None,
+        annexe={"idf": [idf_ref[idx] for idx in range(1, len(idf_ref) + 1)]},
+        complet=complet,
+    )
+    return stats, len(decales)
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Vecteurs TF-IDF des documents.")
+    parser.add_argument("--complet", action="store_true",
+                        help="tout recalculer sans tenir compte du manifeste")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE_IDF,
+                        help=f"écart d'idf toléré avant recalcul (défaut {TOLERANCE_IDF})")
+    parser.add_argument("--npz", action="store_true",
+                        help="écrire aussi la version binaire CSR (.npz) à côté du texte")
+    parser.add_argument("--poids", choices=[f for f in FORMATS_POIDS if f != "f64"], default="f32",
+                        help="stockage des poids dans le .npz : f32, ou q16 / q8 "
+                             "(entiers + échelle par terme)")
+    args = parser.parse_args()
+
     # Vérifications de base
     if not COLLECTION_DIR.is_dir():
         raise SystemExit(f"Dossier introuvable : {COLLECTION_DIR}")
@@ -124,27 +177,16 @@ def main() -> None:
     if not DOC_LIST_FILE.is_file():
         raise SystemExit(f"Fichier de liste de documents introuvable : {DOC_LIST_FILE}")
 
-    # Chargements
-    index_vocab = charger_vocabulaire(VOCAB_FILE)
-    df_mot = charger_df(DF_FILE)
-    nb_docs = compter_documents(DOC_LIST_FILE)
-    idf_par_id = construire_idf(index_vocab, df_mot, nb_docs)
-
-    # Construction du fichier tf.idf
-    with DOC_LIST_FILE.open("r", encoding="utf-8") as f_docs, \
-         OUTPUT_FILE.open("w", encoding="utf-8") as f_out:
-
-        for line in f_docs:
-            nom_doc = line.strip()
-            if not nom_doc:
-                continue
-
-            doc_path = COLLECTION_DIR / f"{nom_doc}.stp"
-            if not doc_path.is_file():
-                continue
+    stats, nb_decales = construire_vecteurs_tfidf(COLLECTION_DIR, VOCAB_FILE, DF_FILE, OUTPUT_FILE,
+                                                  args.complet, args.tolerance)
+    print(f"{stats['recalcules']}/{stats['documents']} documents recalculés "
+          f"({nb_decales} idf décalés), "
+          f"{stats['segments_ecrits']}/{stats['segments']} segments réécrits")
 
-            vecteur = tfidf_pour_document(doc_path, index_vocab, idf_par_id)
-            f_out.write(vecteur + "\n")
+    if args.npz:
+        path_npz = convertir_en_npz(OUTPUT_FILE, entiers=False,
+                                    type_valeurs=FORMATS_POIDS[args.poids])
+        print(f"Version binaire écrite : {path_npz}")
 
 
 if __name__ == "__main__":
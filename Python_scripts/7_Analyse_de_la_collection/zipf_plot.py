@@ -4,20 +4,28 @@ Nom du fichier: zipf_plot.py
 Objectif du programme:
     Générer un graphique illustrant la loi de Zipf en représentant
     la fréquence des mots en fonction de leur rang.
+    NumPy et matplotlib ne sont importés qu'au moment du calcul et du tracé :
+    lire_counter() et l'estimation de la pente (ri.zipf, partagés avec le
+    générateur de collections ri.synthetique) n'en dépendent pas.
 """
 
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Tuple
+from typing import TYPE_CHECKING, List, Tuple
+import sys
 
-import matplotlib.pyplot as plt
-import matplotlib.patheffects as pe
-import numpy as np
 from itertools import cycle
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # accès au paquet ri
+
+from ri.zipf import (RANG_MAX_AJUSTEMENT, RANG_MIN_AJUSTEMENT, WordStat, ajuster_zipf,
+                     lire_counter)
+
+if TYPE_CHECKING:
+    import numpy as np
+
 
 # Répertoires
 SCRIPT_DIR = Path(__file__).resolve().parent.parent
@@ -26,60 +34,14 @@ COUNTER_FILE = BASE_DIR / "outputs" / "counter.txt"
 OUTPUT_PNG = BASE_DIR / "outputs" / "zipf_plot.png"
 
 
-@dataclass
-class WordStat:
-    """Représente une ligne de counter.txt."""
-    rank: int
-    freq: int
-    word: str
-
-
-def lire_counter(path: Path) -> List[WordStat]:
-    """
-    Lit le fichier counter.txt et renvoie une liste de WordStat.
-
-    On suppose un format par ligne :
-        rang freq mot
-    où 'mot' peut éventuellement contenir des espaces (on recolle tout après la 2ᵉ colonne).
-
-    Les lignes non parseables (en-têtes, vides, etc.) sont ignorées.
-    """
-    stats: List[WordStat] = []
-
-    if not path.exists():
-        raise FileNotFoundError(f"Fichier introuvable : {path}")
-
-    with path.open(encoding="utf-8") as f:
-        for raw_line in f:
-            line = raw_line.strip()
-            if not line:
-                continue
-
-            parts = line.split()
-            if len(parts) < 3:
-                continue
-
-            try:
-                rank = int(parts[0])
-                freq = int(parts[1])
-            except ValueError:
-                # Probable ligne d'en-tête ou format invalide
-                continue
-
-            word = " ".join(parts[2:])
-            stats.append(WordStat(rank=rank, freq=freq, word=word))
-
-    # On s'assure que les données sont triées par rang croissant
-    stats.sort(key=lambda s: s.rank)
-    return stats
-
-
 def extraire_rang_freq(stats: List[WordStat]) -> Tuple[np.ndarray, np.ndarray]:
     """
     À partir d'une liste de WordStat, construit deux tableaux NumPy :
     - ranks : rangs
     - freqs : fréquences
     """
+    import numpy as np
+
     ranks = np.array([s.rank for s in stats], dtype=float)
     freqs = np.array([s.freq for s in stats], dtype=float)
     return ranks, freqs
@@ -99,6 +61,8 @@ def choisir_indices_a_annoter(stats: List[WordStat], nb_labels: int = 10) -> Lis
 
     nb_labels = min(nb_labels, n)
 
+    import numpy as np
+
     ranks = np.array([s.rank for s in stats], dtype=float)
     log_ranks = np.log10(ranks)
 
@@ -124,6 +88,8 @@ def annoter_mots_no_overlap(ax, stats: List[WordStat], indices: List[int]) -> No
     - stats : liste de WordStat triée
     - indices : indices des mots à annoter dans stats
     """
+    import matplotlib.patheffects as pe
+
     # Offsets alternés (en pixels) pour éviter le chevauchement
     offsets = cycle([
         (8, 8), (8, -8),
@@ -171,25 +137,24 @@ def tracer_zipf(ranks: np.ndarray,
     if ranks.size == 0 or freqs.size == 0:
         raise ValueError("Aucune donnée à tracer (ranks ou freqs vide).")
 
+    import matplotlib.pyplot as plt
+    import numpy as np
+
     plt.figure(figsize=(8, 6))
 
     # Nuage de points en échelle log-log
     plt.loglog(ranks, freqs, ".", alpha=0.5)
 
-    # Régression linéaire sur log10(rang) et log10(freq),
-    # en ignorant éventuellement les tout premiers et tout derniers rangs
-    log_r = np.log10(ranks)
-    log_f = np.log10(freqs)
+    # Régression linéaire sur log10(rang) et log10(freq), en ignorant
+    # les tout premiers et tout derniers rangs (ri.zipf.ajuster_zipf)
+    ajustement = ajuster_zipf(ranks, freqs)
 
-    # Petit filtrage pour exclure les extrêmes (optionnel mais souvent plus propre)
-    # Ici on garde les rangs entre 5 et 5000 si possible
-    mask = (ranks >= 5) & (ranks <= 5000)
-    mask &= np.isfinite(log_r) & np.isfinite(log_f)
+    if ajustement is not None:
+        slope, intercept = ajustement
 
-    if mask.sum() > 2:
-        slope, intercept = np.polyfit(log_r[mask], log_f[mask], 1)
-
-        # Ligne de tendance
+        # Ligne de tendance, sur les rangs retenus pour l'ajustement
+        log_r = np.log10(ranks)
+        mask = (ranks >= RANG_MIN_AJUSTEMENT) & (ranks <= RANG_MAX_AJUSTEMENT)
         log_r_sorted = np.linspace(log_r[mask].min(), log_r[mask].max(), 200)
         log_f_fit = slope * log_r_sorted + intercept
         plt.plot(10 ** log_r_sorted, 10 ** log_f_fit, linewidth=1)
@@ -243,6 +208,8 @@ def main() -> None:
     tracer_zipf(ranks, freqs, stats, nb_labels=10)
 
     # Sauvegarde
+    import matplotlib.pyplot as plt
+
     OUTPUT_PNG.parent.mkdir(parents=True, exist_ok=True)
     plt.savefig(OUTPUT_PNG, dpi=300)
     print(f"[OK] Figure sauvegardée dans : {OUTPUT_PNG}")
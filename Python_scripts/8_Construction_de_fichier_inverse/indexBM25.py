@@ -0,0 +1,184 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: indexBM25.py
+Objectif du programme:
+    Construire un index inversé « à impacts » pour le modèle BM25 (ou BM25+) :
+    chaque posting stocke directement la contribution quantifiée du terme
+    au score du document, de sorte qu'à l'interrogation il ne reste qu'à sommer.
+Usage :
+  python indexBM25.py                    # k1 = 1.2, b = 0.75, delta = 0 (BM25)
+  python indexBM25.py 1.5 0.8            # k1 = 1.5, b = 0.8
+  python indexBM25.py 1.2 0.75 1.0       # BM25+ avec delta = 1.0
+"""
+
+from pathlib import Path
+import math
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # accès au paquet ri
+
+from ri.collection_compacte import SourceDocuments
+from ri.index import charger_liste_docs, charger_vocabulaire
+
+# Chemins
+COLLECTION_DIR = Path("Collection")
+DOC_LIST_FILE = COLLECTION_DIR / "Collection"
+# Collection_compacte/ si elle existe, sinon un fichier .stp par document
+SOURCE_DOCS = SourceDocuments(COLLECTION_DIR, "stp")
+VOCAB_FILE = Path("outputs/vocabulaire.txt")
+OUTPUT_FILE = Path("outputs/indexBM25.txt")
+LONGUEURS_FILE = Path("outputs/longueursDocs.txt")
+
+# Nombre de bits des impacts quantifiés (1 .. 2^BITS - 1)
+BITS_IMPACT = 8
+
+
+def compter_tf_et_longueurs(termes, noms_docs: list):
+    """
+    Parcourt une seule fois les fichiers .stp et renvoie :
+      - tf_termes : dict {idTerme: [(docID, tf), ...]} (docIDs croissants)
+      - longueurs : liste des longueurs (nombre de mots du .stp) par docID - 1
+    """
+    tf_termes = {}
+    longueurs = []
+
+    for id_doc, nom_doc in enumerate(noms_docs, start=1):
+        texte = SOURCE_DOCS.lire_texte(nom_doc)
+        if texte is None:
+            longueurs.append(0)
+            continue
+
+        mots = texte.split()
+        longueurs.append(len(mots))
+
+        # une recherche dans le dictionnaire par mot distinct du document
+        ids = {mot: termes.get(mot) for mot in set(mots)}
+        tf = {}
+        for mot in mots:
+            idx = ids[mot]
+            if idx is not None:
+                tf[idx] = tf.get(idx, 0) + 1
+
+        for idx, freq in tf.items():
+            tf_termes.setdefault(idx, []).append((id_doc, freq))
+
+    return tf_termes, longueurs
+
+
+def idf_bm25(nb_docs: int, df: int) -> float:
+    """idf de Robertson-Spärck Jones, avec +1 pour rester positif sur les termes fréquents."""
+    return math.log((nb_docs - df + 0.5) / (df + 0.5) + 1.0)
+
+
+def poids_bm25(tf: int, longueur: int, longueur_moy: float, idf: float,
+               k1: float, b: float, delta: float) -> float:
+    """
+    Contribution BM25 d'un terme à un document.
+    Avec delta > 0 on obtient BM25+ (borne inférieure pour les documents longs).
+    """
+    norme = k1 * (1.0 - b + b * longueur / longueur_moy)
+    return idf * ((tf * (k1 + 1.0)) / (tf + norme) + delta)
+
+
+def calculer_poids_bm25(tf_termes: dict, longueurs: list,
+                       k1: float, b: float, delta: float):
+    """
+    Calcule les poids BM25 (non quantifiés) de tous les postings.
+
+    Retourne (poids, longueur_moy) avec
+    poids : dict {idTerme: [(docID, poids), ...]}.
+    """
+    nb_docs = len(longueurs)
+    longueur_moy = sum(longueurs) / nb_docs if nb_docs else 1.0
+
+    poids = {}
+    for idx, postings in tf_termes.items():
+        idf = idf_bm25(nb_docs, len(postings))
+        poids[idx] = [
+            (id_doc, poids_bm25(tf, longueurs[id_doc - 1], longueur_moy, idf, k1, b, delta))
+            for id_doc, tf in postings
+        ]
+
+    return poids, longueur_moy
+
+
+def quantifier(poids: dict, niveaux: int):
+    """
+    Quantifie linéairement les poids sur les entiers 1 .. niveaux
+    avec une échelle globale (poids ≈ impact * echelle).
+
+    Retourne (index_impacts, echelle) avec
+    index_impacts : dict {idTerme: [(docID, impact), ...]}.
+    """
+    poids_max = max((w for liste in poids.values() for _, w in liste), default=0.0)
+    echelle = poids_max / niveaux if poids_max > 0 else 1.0
+
+    index_impacts = {}
+    for idx, liste in poids.items():
+        # un posting présent garde au moins l'impact 1
+        index_impacts[idx] = [(id_doc, max(1, round(w / echelle))) for id_doc, w in liste]
+
+    return index_impacts, echelle
+
+
+def construire_index_bm25(tf_termes: dict, longueurs: list,
+                          k1: float, b: float, delta: float):
+    """
+    Calcule les poids BM25 de tous les postings puis les quantifie
+    sur BITS_IMPACT bits avec une échelle globale.
+
+    Retourne (index_impacts, echelle, longueur_moy) avec
+    index_impacts : dict {idTerme: [(docID, impact), ...]}.
+    """
+    poids, longueur_moy = calculer_poids_bm25(tf_termes, longueurs, k1, b, delta)
+    index_impacts, echelle = quantifier(poids, (1 << BITS_IMPACT) - 1)
+    return index_impacts, echelle, longueur_moy
+
+
+def main() -> None:
+    if not COLLECTION_DIR.is_dir():
+        raise SystemExit(f"Dossier introuvable : {COLLECTION_DIR}")
+    if not VOCAB_FILE.is_file():
+        raise SystemExit(f"Fichier vocabulaire introuvable : {VOCAB_FILE}")
+    if not DOC_LIST_FILE.is_file():
+        raise SystemExit(f"Fichier de liste de documents introuvable : {DOC_LIST_FILE}")
+
+    # Paramètres k1, b, delta
+    try:
+        k1 = float(sys.argv[1]) if len(sys.argv) >= 2 else 1.2
+        b = float(sys.argv[2]) if len(sys.argv) >= 3 else 0.75
+        delta = float(sys.argv[3]) if len(sys.argv) >= 4 else 0.0
+    except ValueError:
+        raise SystemExit("Usage : python indexBM25.py [k1] [b] [delta]")
+
+    termes = charger_vocabulaire(VOCAB_FILE)
+    noms_docs = charger_liste_docs(DOC_LIST_FILE)
+
+    tf_termes, longueurs = compter_tf_et_longueurs(termes, noms_docs)
+    index_impacts, echelle, longueur_moy = construire_index_bm25(tf_termes, longueurs, k1, b, delta)
+
+    # Longueurs des documents (réutilisables par d'autres modèles)
+    with LONGUEURS_FILE.open("w", encoding="utf-8") as f_out:
+        for id_doc, (nom_doc, longueur) in enumerate(zip(noms_docs, longueurs), start=1):
+            f_out.write(f"{id_doc} {nom_doc} {longueur}\n")
+
+    # Index à impacts : en-tête de paramètres puis "idTerme mot doc:impact ..."
+    with OUTPUT_FILE.open("w", encoding="utf-8") as f_out:
+        f_out.write(
+            f"# k1={k1} b={b} delta={delta} bits={BITS_IMPACT} "
+            f"echelle={echelle!r} N={len(noms_docs)} avgdl={longueur_moy:.4f}\n"
+        )
+        for id_terme, mot in termes.items():
+            postings = index_impacts.get(id_terme)
+            if not postings:
+                continue
+            postings_str = " ".join(f"{d}:{i}" for d, i in postings)
+            f_out.write(f"{id_terme} {mot} {postings_str}\n")
+
+    modele = "BM25+" if delta > 0 else "BM25"
+    print(f"Index {modele} créé ({OUTPUT_FILE}) : k1={k1}, b={b}, delta={delta}, "
+          f"{len(index_impacts)} termes indexés.")
+
+
+if __name__ == "__main__":
+    main()
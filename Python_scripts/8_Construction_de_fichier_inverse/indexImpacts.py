@@ -0,0 +1,124 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: indexImpacts.py
+Objectif du programme:
+    Construire un index inversé « ordonné par impact » : les poids des postings
+    (TF-IDF normalisé cosinus, ou BM25) sont quantifiés sur un petit nombre de
+    niveaux, et les postings de chaque terme sont regroupés par niveau décroissant.
+    Un moteur « score-at-a-time » peut alors traiter d'abord les contributions
+    les plus fortes et s'arrêter avant la fin des listes.
+Usage :
+  python indexImpacts.py                 # poids TF-IDF, 16 niveaux
+  python indexImpacts.py bm25            # poids BM25 (k1 = 1.2, b = 0.75)
+  python indexImpacts.py tfidf 32        # 32 niveaux
+"""
+
+from pathlib import Path
+import math
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # accès au paquet ri
+
+from indexBM25 import (
+    compter_tf_et_longueurs,
+    calculer_poids_bm25,
+    quantifier,
+)
+from ri.index import charger_liste_docs, charger_vocabulaire
+
+# Chemins
+COLLECTION_DIR = Path("Collection")
+DOC_LIST_FILE = COLLECTION_DIR / "Collection"
+VOCAB_FILE = Path("outputs/vocabulaire.txt")
+OUTPUT_FILE = Path("outputs/indexImpacts.txt")
+
+MODELES = ("tfidf", "bm25")
+
+
+def calculer_poids_tfidf(tf_termes: dict, nb_docs: int) -> dict:
+    """
+    Poids tf.idf normalisés par la norme L2 du document, de sorte que
+    la somme des contributions donne directement le cosinus (au facteur |q| près).
+
+    Retourne dict {idTerme: [(docID, poids), ...]}.
+    """
+    poids_bruts = {}
+    norme_sq = {}
+    for idx, postings in tf_termes.items():
+        idf = math.log(nb_docs / len(postings))
+        liste = []
+        for id_doc, tf in postings:
+            w = tf * idf
+            liste.append((id_doc, w))
+            norme_sq[id_doc] = norme_sq.get(id_doc, 0.0) + w * w
+        poids_bruts[idx] = liste
+
+    poids = {}
+    for idx, liste in poids_bruts.items():
+        poids[idx] = [
+            (id_doc, w / math.sqrt(norme_sq[id_doc]))
+            for id_doc, w in liste
+            if w > 0 and norme_sq[id_doc] > 0
+        ]
+    return poids
+
+
+def regrouper_par_impact(postings: list) -> list:
+    """
+    Regroupe [(docID, impact), ...] en segments [(impact, [docIDs triés]), ...]
+    par impact décroissant.
+    """
+    segments = {}
+    for id_doc, impact in postings:
+        segments.setdefault(impact, []).append(id_doc)
+    return [(impact, sorted(segments[impact])) for impact in sorted(segments, reverse=True)]
+
+
+def main() -> None:
+    if not COLLECTION_DIR.is_dir():
+        raise SystemExit(f"Dossier introuvable : {COLLECTION_DIR}")
+    if not VOCAB_FILE.is_file():
+        raise SystemExit(f"Fichier vocabulaire introuvable : {VOCAB_FILE}")
+    if not DOC_LIST_FILE.is_file():
+        raise SystemExit(f"Fichier de liste de documents introuvable : {DOC_LIST_FILE}")
+
+    modele = sys.argv[1] if len(sys.argv) >= 2 else "tfidf"
+    try:
+        niveaux = int(sys.argv[2]) if len(sys.argv) >= 3 else 16
+    except ValueError:
+        niveaux = 0
+    if modele not in MODELES or niveaux < 1:
+        raise SystemExit("Usage : python indexImpacts.py [tfidf|bm25] [niveaux]")
+
+    termes = charger_vocabulaire(VOCAB_FILE)
+    noms_docs = charger_liste_docs(DOC_LIST_FILE)
+    nb_docs = len(noms_docs)
+
+    tf_termes, longueurs = compter_tf_et_longueurs(termes, noms_docs)
+
+    if modele == "tfidf":
+        poids = calculer_poids_tfidf(tf_termes, nb_docs)
+    else:
+        poids, _ = calculer_poids_bm25(tf_termes, longueurs, k1=1.2, b=0.75, delta=0.0)
+
+    index_impacts, echelle = quantifier(poids, niveaux)
+
+    # En-tête puis "idTerme mot df impact:doc,doc impact:doc ..." (impacts décroissants)
+    with OUTPUT_FILE.open("w", encoding="utf-8") as f_out:
+        f_out.write(f"# modele={modele} niveaux={niveaux} echelle={echelle!r} N={nb_docs}\n")
+        for id_terme, mot in termes.items():
+            postings = index_impacts.get(id_terme)
+            if not postings:
+                continue
+            df = len(tf_termes[id_terme])
+            segments_str = " ".join(
+                f"{impact}:{','.join(str(d) for d in docs)}"
+                for impact, docs in regrouper_par_impact(postings)
+            )
+            f_out.write(f"{id_terme} {mot} {df} {segments_str}\n")
+
+    print(f"Index ordonné par impact créé ({OUTPUT_FILE}) : modèle {modele}, {niveaux} niveaux.")
+
+
+if __name__ == "__main__":
+    main()
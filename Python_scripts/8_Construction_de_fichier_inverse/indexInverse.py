@@ -3,72 +3,51 @@ Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
 Nom du fichier: indexInverse.py
 Objectif du programme:
     Construire un index inversé associant chaque terme du vocabulaire
-    à la liste des documents dans lesquels il apparaît.
+    à la liste des documents dans lesquels il apparaît, ainsi qu'un index
+    positionnel (positions de chaque occurrence) pour les requêtes d'expression.
 """
 
 
 from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # accès au paquet ri
+
+from ri.collection_compacte import SourceDocuments
+from ri.index import charger_liste_docs, charger_vocabulaire
 
 # Chemins
 COLLECTION_DIR = Path("Collection")
 DOC_LIST_FILE = COLLECTION_DIR / "Collection"
+# Collection_compacte/ si elle existe, sinon un fichier .stp par document
+SOURCE_DOCS = SourceDocuments(COLLECTION_DIR, "stp")
 VOCAB_FILE = Path("outputs/vocabulaire.txt")
 OUTPUT_FILE = Path("outputs/indexInverse.txt")
+OUTPUT_POS_FILE = Path("outputs/indexPositionnel.txt")
 
 
-def charger_vocabulaire(path_vocab: Path):
-    """
-    Charge le vocabulaire et retourne :
-      - index_vocab : dict {mot: idTerme}
-      - id_to_mot   : dict {idTerme: mot}
-    """
-    mots = []
-    with path_vocab.open("r", encoding="utf-8") as f:
-        for line in f:
-            mot = line.strip()
-            if mot:
-                mots.append(mot)
-
-    index_vocab = {mot: i + 1 for i, mot in enumerate(mots)}
-    id_to_mot = {i + 1: mot for i, mot in enumerate(mots)}
-    return index_vocab, id_to_mot
-
-
-def charger_liste_docs(path_doc_list: Path):
-    """
-    Retourne une liste de noms de documents (sans suffixe .stp),
-    dans l'ordre où ils apparaissent dans Collection/Collection.
-    """
-    noms_docs = []
-    with path_doc_list.open("r", encoding="utf-8") as f:
-        for line in f:
-            nom = line.strip()
-            if nom:
-                noms_docs.append(nom)
-    return noms_docs
-
-
-def construire_paires(index_vocab: dict, noms_docs: list):
+def construire_triplets(termes, noms_docs: list, source: SourceDocuments = SOURCE_DOCS):
     """
-    Phase 1 : extraction des paires (idTerme, idDoc)
-    en parcourant tous les documents.
+    Variante positionnelle de la phase 1 : extraction des triplets
+    (idTerme, idDoc, position), la position étant le rang du mot
+    (à partir de 0) dans le fichier .stp.
     """
-    paires = []  # liste de tuples (idTerme, idDoc)
+    triplets = []  # liste de tuples (idTerme, idDoc, position)
 
     for id_doc, nom_doc in enumerate(noms_docs, start=1):
-        doc_path = COLLECTION_DIR / f"{nom_doc}.stp"
-        if not doc_path.is_file():
+        texte = source.lire_texte(nom_doc)
+        if texte is None:
             continue
 
-        texte = doc_path.read_text(encoding="utf-8", errors="ignore")
         mots = texte.split()
+        ids = {mot: termes.get(mot) for mot in set(mots)}
 
-        for mot in mots:
-            if mot in index_vocab:
-                id_terme = index_vocab[mot]
-                paires.append((id_terme, id_doc))
+        for pos, mot in enumerate(mots):
+            id_terme = ids[mot]
+            if id_terme is not None:
+                triplets.append((id_terme, id_doc, pos))
 
-    return paires
+    return triplets
 
 
 def construire_index_inverse(paires: list, nb_termes: int):
@@ -99,30 +78,48 @@ def construire_index_inverse(paires: list, nb_termes: int):
     return index_inv
 
 
-def main() -> None:
-    # Vérifications de base
-    if not COLLECTION_DIR.is_dir():
-        raise SystemExit(f"Dossier introuvable : {COLLECTION_DIR}")
-    if not VOCAB_FILE.is_file():
-        raise SystemExit(f"Fichier vocabulaire introuvable : {VOCAB_FILE}")
-    if not DOC_LIST_FILE.is_file():
-        raise SystemExit(f"Fichier de liste de documents introuvable : {DOC_LIST_FILE}")
+def construire_index_positionnel(triplets: list, nb_termes: int):
+    """
+    Tri des triplets (idTerme, idDoc, position) puis regroupement.
 
+    Retourne un dict {idTerme: [(docID, [positions triées]), ...]}
+    avec les docIDs triés.
+    """
+    triplets.sort()
+
+    index_pos = {i: [] for i in range(1, nb_termes + 1)}
+
+    for id_terme, id_doc, pos in triplets:
+        postings = index_pos[id_terme]
+        if postings and postings[-1][0] == id_doc:
+            postings[-1][1].append(pos)
+        else:
+            postings.append((id_doc, [pos]))
+
+    return index_pos
+
+
+def construire_index(collection_dir: Path, vocab_file: Path, output_file: Path,
+                     output_pos_file: Path) -> None:
+    """Index inversé et positionnel des documents de `collection_dir`, écrits dans les deux fichiers."""
     # Chargement vocabulaire et docs
-    index_vocab, id_to_mot = charger_vocabulaire(VOCAB_FILE)
-    noms_docs = charger_liste_docs(DOC_LIST_FILE)
-    nb_termes = len(id_to_mot)
+    termes = charger_vocabulaire(vocab_file)
+    noms_docs = charger_liste_docs(collection_dir / "Collection")
+    nb_termes = len(termes)
+    source = SourceDocuments(collection_dir, "stp")
 
-    # 1. Extraction des paires (idTerme, idDoc)
-    paires = construire_paires(index_vocab, noms_docs)
+    # 1. Extraction des triplets (idTerme, idDoc, position),
+    #    dont on déduit les paires (idTerme, idDoc) en un seul parcours
+    triplets = construire_triplets(termes, noms_docs, source)
+    paires = [(id_terme, id_doc) for id_terme, id_doc, _ in triplets]
 
     # 2–3. Tri + regroupement
     index_inv = construire_index_inverse(paires, nb_termes)
+    index_pos = construire_index_positionnel(triplets, nb_termes)
 
     # Écriture du fichier inversé
-    with OUTPUT_FILE.open("w", encoding="utf-8") as f_out:
-        for id_terme in range(1, nb_termes + 1):
-            mot = id_to_mot[id_terme]
+    with output_file.open("w", encoding="utf-8") as f_out:
+        for id_terme, mot in termes.items():
             docs = index_inv.get(id_terme, [])
             # ligne : idTerme mot doc1 doc2 doc3 ...
             if docs:
@@ -132,6 +129,32 @@ def main() -> None:
                 # terme sans occurrences (optionnel)
                 f_out.write(f"{id_terme} {mot}\n")
 
+    # Écriture de l'index positionnel
+    with output_pos_file.open("w", encoding="utf-8") as f_out:
+        for id_terme, mot in termes.items():
+            postings = index_pos.get(id_terme, [])
+            # ligne : idTerme mot doc1:p1,p2 doc2:p1 ...
+            if postings:
+                postings_str = " ".join(
+                    f"{id_doc}:{','.join(str(p) for p in positions)}"
+                    for id_doc, positions in postings
+                )
+                f_out.write(f"{id_terme} {mot} {postings_str}\n")
+            else:
+                f_out.write(f"{id_terme} {mot}\n")
+
+
+def main() -> None:
+    # Vérifications de base
+    if not COLLECTION_DIR.is_dir():
+        raise SystemExit(f"Dossier introuvable : {COLLECTION_DIR}")
+    if not VOCAB_FILE.is_file():
+        raise SystemExit(f"Fichier vocabulaire introuvable : {VOCAB_FILE}")
+    if not DOC_LIST_FILE.is_file():
+        raise SystemExit(f"Fichier de liste de documents introuvable : {DOC_LIST_FILE}")
+
+    construire_index(COLLECTION_DIR, VOCAB_FILE, OUTPUT_FILE, OUTPUT_POS_FILE)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,82 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: fidelite_poids.py
+Objectif du programme:
+    Mesurer l'effet du stockage des poids tf.idf (f32, q16, q8) sur les
+    classements de moteur_tfidf.py, par rapport à la référence en double
+    précision (f64) : place mémoire des poids, recouvrement du top-10,
+    premier document identique, écart maximal de score et temps par requête.
+Usage :
+  python fidelite_poids.py                       # requêtes d'exemple intégrées
+  python fidelite_poids.py mes_requetes.txt      # une requête par ligne
+"""
+
+from pathlib import Path
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # accès au paquet ri
+
+from ri.index import Index
+from ri.requetes_cacm import REQUETES_EXEMPLE
+
+FORMATS = ("f64", "f32", "q16", "q8")
+TOP_K = 10
+
+
+def lire_requetes(path: Path) -> list:
+    with path.open("r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def main() -> None:
+    # mots exacts et jokers seulement, comme recherche_tfidf sans expansion
+    index = Index(exact=True)
+    manquants = index.fichiers_manquants(index.collection_dir, index.doc_list_file,
+                                         index.vocab_file, index.df_file, index.vect_tf_file)
+    if manquants:
+        raise SystemExit(f"Fichier introuvable : {manquants[0]}")
+
+    requetes = lire_requetes(Path(sys.argv[1])) if len(sys.argv) >= 2 else REQUETES_EXEMPLE
+
+    reference = None
+    print(f"{len(requetes)} requêtes, comparaison du top-{TOP_K} avec f64\n")
+    print(f"{'format':7} {'poids (Ko)':>10} {'recouvr.':>9} {'1er égal':>9} "
+          f"{'écart max':>10} {'ms/req':>7}")
+
+    for fmt in FORMATS:
+        doc_vectors, doc_norms = index.vecteurs_tfidf(fmt)
+        taille = doc_vectors.data.itemsize * len(doc_vectors.data)
+        if doc_vectors.echelles is not None:
+            taille += doc_vectors.echelles.itemsize * len(doc_vectors.echelles)
+
+        debut = time.perf_counter()
+        classements = [
+            index.recherche_tfidf(q, max_resultats=TOP_K, format_poids=fmt)[0]
+            for q in requetes
+        ]
+        ms = 1000 * (time.perf_counter() - debut) / len(requetes)
+
+        if reference is None:
+            reference = classements
+
+        recouvrement = premier = 0.0
+        ecart = 0.0
+        for res, ref in zip(classements, reference):
+            if not ref:
+                recouvrement += 1.0
+                premier += 1.0
+                continue
+            docs_res = {d for _, d in res}
+            recouvrement += len(docs_res & {d for _, d in ref}) / len(ref)
+            premier += 1.0 if res and res[0][1] == ref[0][1] else 0.0
+            scores_ref = {d: s for s, d in ref}
+            ecart = max([ecart] + [abs(s - scores_ref[d]) for s, d in res if d in scores_ref])
+
+        n = len(requetes)
+        print(f"{fmt:7} {taille / 1024:10.1f} {recouvrement / n:9.1%} {premier / n:9.1%} "
+              f"{ecart:10.2e} {ms:7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: moteur_bm25.py
+Objectif du programme:
+    Implémenter un moteur de recherche BM25 / BM25+ à partir de l'index
+    à impacts produit par indexBM25.py : le score d'un document est la
+    simple somme des impacts quantifiés des termes de la requête.
+    Le chargement de l'index et le classement sont dans ri.bm25 ; ce script
+    n'est que l'interface en ligne de commande.
+Usage :
+  python moteur_bm25.py
+  (les paramètres k1, b et delta sont fixés à la construction de l'index)
+"""
+
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # accès au paquet ri
+
+from ri.bm25 import charger_index_bm25, recherche_bm25
+from ri.extraits import calculer_extraits, source_extraits, termes_requete
+from ri.index import charger_liste_docs
+from ri.resultats import RESULTS_DIR, afficher_resultats, ecrire_resultats_html
+
+# Chemins
+COLLECTION_DIR = Path("Collection")
+DOC_LIST_FILE = COLLECTION_DIR / "Collection"
+INDEX_BM25_FILE = Path("outputs/indexBM25.txt")
+
+
+def main():
+    if not DOC_LIST_FILE.is_file():
+        raise SystemExit(f"Fichier introuvable : {DOC_LIST_FILE}")
+    if not INDEX_BM25_FILE.is_file():
+        raise SystemExit(f"Fichier introuvable : {INDEX_BM25_FILE} (lancer indexBM25.py)")
+
+    docs = charger_liste_docs(DOC_LIST_FILE)
+    index, params = charger_index_bm25(INDEX_BM25_FILE)
+    echelle = params.get("echelle", 1.0)
+    modele = "BM25+" if params.get("delta", 0.0) > 0 else "BM25"
+    reglages = f"k1={params.get('k1')}, b={params.get('b')}"
+    if modele == "BM25+":
+        reglages += f", delta={params.get('delta')}"
+
+    # extraits : textes .flt, lus seulement pour les documents affichés
+    source_textes = source_extraits(COLLECTION_DIR)
+    couleur = sys.stdout.isatty()
+
+    print(f"Moteur {modele} ({reglages}). Tapez une requête, ou ligne vide pour quitter.")
+    while True:
+        try:
+            query = input("\nRequête > ").strip()
+        except (EOFError, KeyboardInterrupt):
+            print("\nFin.")
+            break
+
+        if not query:
+            print("Fin.")
+            break
+
+        res = recherche_bm25(query, docs, index, echelle, max_resultats=20)
+
+        if not res:
+            print("Aucun document trouvé.")
+            continue
+
+        extraits = calculer_extraits(source_textes, [nom_doc for _, nom_doc in res],
+                                     termes_requete(query, termes_indexes=index))
+
+        print("\nTop documents :")
+        afficher_resultats(res, extraits, couleur)
+
+        out_html = RESULTS_DIR / "resultats_bm25.html"
+        ecrire_resultats_html(
+            moteur_nom=f"{modele} ({reglages})",
+            query=query,
+            resultats=res,
+            output_path=out_html,
+            collection_dir=COLLECTION_DIR,
+            extension=".stp",
+            extraits=extraits,
+        )
+        print(f"\nRésultats HTML écrits dans : {out_html}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: moteur_booleen.py
+Objectif du programme:
+    Implémenter un moteur de recherche booléen (AND / OR / NOT) qui s'appuie
+    directement sur l'index inversé et renvoie l'ensemble des documents qui
+    satisfont la requête, sans aucun calcul de score.
+Usage :
+  python moteur_booleen.py
+Syntaxe des requêtes :
+  parallel AND algorithm
+  (sorting OR searching) AND NOT tape
+  Les opérateurs ET / OU / NON sont aussi acceptés, et deux termes
+  juxtaposés sont reliés par un AND implicite.
+"""
+
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # accès au paquet ri
+
+from ri.index import charger_liste_docs
+from ri.postings import difference, intersection_multiple, union
+
+# Chemins
+COLLECTION_DIR = Path("Collection")
+DOC_LIST_FILE = COLLECTION_DIR / "Collection"
+INDEX_FILE = Path("outputs/indexInverse.txt")
+
+# Opérateurs reconnus (en majuscules uniquement, pour ne pas confondre avec des termes)
+OPERATEURS_ET = {"AND", "ET"}
+OPERATEURS_OU = {"OR", "OU"}
+OPERATEURS_NON = {"NOT", "NON"}
+
+
+def charger_index_inverse(path_index: Path) -> dict:
+    """
+    Charge indexInverse.txt (lignes "idTerme mot doc1 doc2 ...")
+    et renvoie un dict {mot: [docIDs triés]}.
+    Les docIDs sont les rangs (à partir de 1) dans Collection/Collection.
+    """
+    index_inv = {}
+    with path_index.open("r", encoding="utf-8") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) < 3:
+                # terme sans occurrence
+                continue
+            try:
+                index_inv[parts[1]] = [int(d) for d in parts[2:]]
+            except ValueError:
+                continue
+    return index_inv
+
+
+# ----------------------------------------------------------------------
+# Analyse de la requête
+# ----------------------------------------------------------------------
+
+def decouper_requete(query: str) -> list:
+    """Sépare la requête en jetons : parenthèses, opérateurs et termes."""
+    query = query.replace("(", " ( ").replace(")", " ) ")
+    return query.split()
+
+
+def analyser_requete(query: str):
+    """
+    Construit l'arbre de la requête par descente récursive :
+      ou  := et (OR et)*
+      et  := non ((AND)? non)*
+      non := NOT non | atome
+      atome := "(" ou ")" | terme
+    Les noeuds sont des tuples ("ou", [...]), ("et", [...]), ("non", x), ("terme", mot).
+    """
+    jetons = decouper_requete(query)
+    pos = 0
+
+    def courant():
+        return jetons[pos] if pos < len(jetons) else None
+
+    def lire_ou():
+        nonlocal pos
+        enfants = [lire_et()]
+        while courant() in OPERATEURS_OU:
+            pos += 1
+            enfants.append(lire_et())
+        return enfants[0] if len(enfants) == 1 else ("ou", enfants)
+
+    def lire_et():
+        nonlocal pos
+        enfants = [lire_non()]
+        while True:
+            jeton = courant()
+            if jeton in OPERATEURS_ET:
+                pos += 1
+                enfants.append(lire_non())
+            elif jeton is not None and jeton != ")" and jeton not in OPERATEURS_OU:
+                # AND implicite entre deux opérandes juxtaposés
+                enfants.append(lire_non())
+            else:
+                break
+        return enfants[0] if len(enfants) == 1 else ("et", enfants)
+
+    def lire_non():
+        nonlocal pos
+        if courant() in OPERATEURS_NON:
+            pos += 1
+            return ("non", lire_non())
+        return lire_atome()
+
+    def lire_atome():
+        nonlocal pos
+        jeton = courant()
+        if jeton is None:
+            raise ValueError("Requête incomplète.")
+        if jeton == "(":
+            pos += 1
+            noeud = lire_ou()
+            if courant() != ")":
+                raise ValueError("Parenthèse fermante manquante.")
+            pos += 1
+            return noeud
+        if jeton == ")" or jeton in OPERATEURS_ET or jeton in OPERATEURS_OU:
+            raise ValueError(f"Jeton inattendu : {jeton}")
+        pos += 1
+        return ("terme", jeton.lower())
+
+    if not jetons:
+        raise ValueError("Requête vide.")
+    arbre = lire_ou()
+    if pos != len(jetons):
+        raise ValueError(f"Jeton inattendu : {jetons[pos]}")
+    return arbre
+
+
+# ----------------------------------------------------------------------
+# Évaluation
+# ----------------------------------------------------------------------
+
+def evaluer(noeud, index_inv: dict, nb_docs: int) -> list:
+    """Évalue un noeud de l'arbre et renvoie la liste triée des docIDs."""
+    genre = noeud[0]
+
+    if genre == "terme":
+        return index_inv.get(noeud[1], [])
+
+    if genre == "ou":
+        resultat = []
+        for enfant in noeud[1]:
+            resultat = union(resultat, evaluer(enfant, index_inv, nb_docs))
+        return resultat
+
+    if genre == "et":
+        # On sépare les opérandes positifs des négations : on intersecte
+        # d'abord les positifs (plus petits en premier), puis on retire les négatifs.
+        positifs = [e for e in noeud[1] if e[0] != "non"]
+        negatifs = [e[1] for e in noeud[1] if e[0] == "non"]
+
+        if positifs:
+            resultat = intersection_multiple(
+                [evaluer(e, index_inv, nb_docs) for e in positifs]
+            )
+        else:
+            resultat = list(range(1, nb_docs + 1))
+
+        for e in negatifs:
+            if not resultat:
+                break
+            resultat = difference(resultat, evaluer(e, index_inv, nb_docs))
+        return resultat
+
+    if genre == "non":
+        # NOT isolé : complément par rapport à toute la collection
+        return difference(list(range(1, nb_docs + 1)),
+                          evaluer(noeud[1], index_inv, nb_docs))
+
+    raise ValueError(f"Noeud inconnu : {genre}")
+
+
+def recherche_booleenne(query: str, index_inv: dict, nb_docs: int) -> list:
+    """
+    Renvoie la liste triée des docIDs (rangs à partir de 1 dans Collection/Collection)
+    qui satisfont la requête booléenne.
+    """
+    arbre = analyser_requete(query)
+    return evaluer(arbre, index_inv, nb_docs)
+
+
+def main():
+    if not DOC_LIST_FILE.is_file():
+        raise SystemExit(f"Fichier introuvable : {DOC_LIST_FILE}")
+    if not INDEX_FILE.is_file():
+        raise SystemExit(f"Fichier introuvable : {INDEX_FILE}")
+
+    docs = charger_liste_docs(DOC_LIST_FILE)
+    index_inv = charger_index_inverse(INDEX_FILE)
+
+    print("Moteur booléen (AND / OR / NOT). Tapez une requête, ou ligne vide pour quitter.")
+    while True:
+        try:
+            query = input("\nRequête > ").strip()
+        except (EOFError, KeyboardInterrupt):
+            print("\nFin.")
+            break
+
+        if not query:
+            print("Fin.")
+            break
+
+        try:
+            res = recherche_booleenne(query, index_inv, len(docs))
+        except ValueError as e:
+            print(f"Requête invalide : {e}")
+            continue
+
+        if not res:
+            print("Aucun document trouvé.")
+            continue
+
+        print(f"\n{len(res)} document(s) trouvé(s) :")
+        for id_doc in res[:20]:
+            nom_doc = docs[id_doc - 1]
+            print(f"- {nom_doc}  -> Collection/{nom_doc}.stp")
+        if len(res) > 20:
+            print(f"... ({len(res) - 20} autres)")
+
+
+if __name__ == "__main__":
+    main()
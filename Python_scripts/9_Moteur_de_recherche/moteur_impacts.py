@@ -0,0 +1,286 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: moteur_impacts.py
+Objectif du programme:
+    Moteur « score-at-a-time » sur l'index ordonné par impact (indexImpacts.py) :
+    les segments de postings sont traités par contribution décroissante, et la
+    recherche s'arrête dès que le top-k ne peut plus changer ou que le budget
+    de temps est épuisé. Mode à latence bornée pour le modèle TF-IDF (ou BM25).
+Usage :
+  python moteur_impacts.py              # pas de budget de temps
+  python moteur_impacts.py 5            # budget de 5 ms par requête
+"""
+
+from bisect import bisect_left
+from pathlib import Path
+import heapq
+import math
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # accès au paquet ri
+
+from ri.echeance import Echeance, enregistrer, resume_statistiques
+from ri.extraits import calculer_extraits, source_extraits, termes_requete
+from ri.index import charger_liste_docs
+from ri.resultats import RESULTS_DIR, afficher_resultats, ecrire_resultats_html
+
+# Chemins
+COLLECTION_DIR = Path("Collection")
+DOC_LIST_FILE = COLLECTION_DIR / "Collection"
+INDEX_IMPACTS_FILE = Path("outputs/indexImpacts.txt")
+
+
+def charger_index_impacts(path_index: Path):
+    """
+    Charge indexImpacts.txt.
+    Renvoie (index, params) avec :
+      - index  : dict {mot: (df, [(impact, [docIDs]), ...])}, impacts décroissants
+      - params : paramètres de l'en-tête (modele, niveaux, echelle, N)
+    """
+    index = {}
+    params = {}
+    with path_index.open("r", encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("#"):
+                for chunk in line[1:].split():
+                    cle, valeur = chunk.split("=", 1)
+                    params[cle] = valeur if cle == "modele" else float(valeur)
+                continue
+            parts = line.split()
+            if len(parts) < 4:
+                continue
+            segments = []
+            for chunk in parts[3:]:
+                impact_str, docs_str = chunk.split(":", 1)
+                segments.append((int(impact_str), [int(d) for d in docs_str.split(",")]))
+            index[parts[1]] = (int(parts[2]), segments)
+    return index, params
+
+
+def poids_requete(query: str, index: dict, params: dict) -> dict:
+    """
+    Poids des termes de la requête :
+      - tfidf : tf_q * log(N / df) (normalisé ensuite par |q| pour le cosinus),
+      - bm25  : tf_q.
+    """
+    tf_q = {}
+    for mot in query.lower().split():
+        if mot in index:
+            tf_q[mot] = tf_q.get(mot, 0) + 1
+
+    if params.get("modele") == "bm25":
+        return {mot: float(tf) for mot, tf in tf_q.items()}
+
+    n_docs = params["N"]
+    poids = {}
+    for mot, tf in tf_q.items():
+        df = index[mot][0]
+        w = tf * math.log(n_docs / df)
+        if w > 0:
+            poids[mot] = w
+    return poids
+
+
+class MeilleursScores:
+    """
+    Les `taille` plus grands accumulateurs, tenus à jour à chaque ajout
+    (tas min borné) : le test d'arrêt anticipé coûte O(taille) par segment
+    au lieu d'un parcours de tous les accumulateurs.
+    Les scores ne font que croître : un document sorti du tas n'y revient
+    que si son score dépasse le plus petit score gardé.
+    """
+
+    def __init__(self, taille: int):
+        self.taille = taille
+        self.scores = {}  # id_doc -> score, pour les documents gardés
+        self.tas = []     # (score, id_doc), entrées périmées retirées à la demande
+
+    def _nettoyer(self) -> None:
+        tas, scores = self.tas, self.scores
+        while tas and scores.get(tas[0][1]) != tas[0][0]:
+            heapq.heappop(tas)
+
+    def mettre_a_jour(self, id_doc: int, score: float) -> None:
+        scores = self.scores
+        if id_doc in scores or len(scores) < self.taille:
+            scores[id_doc] = score
+            heapq.heappush(self.tas, (score, id_doc))
+            if len(self.tas) > 4 * self.taille:
+                # trop d'entrées périmées : reconstruction
+                self.tas = [(v, d) for d, v in scores.items()]
+                heapq.heapify(self.tas)
+            return
+        self._nettoyer()
+        plus_petit, id_min = self.tas[0]
+        if score > plus_petit:
+            heapq.heappop(self.tas)
+            del scores[id_min]
+            scores[id_doc] = score
+            heapq.heappush(self.tas, (score, id_doc))
+
+    def deux_derniers(self) -> tuple:
+        """(k-ième score, (k+1)-ième score), 0.0 pour les places vides."""
+        valeurs = heapq.nlargest(self.taille, self.scores.values())
+        valeurs += [0.0] * (self.taille - len(valeurs))
+        return valeurs[-2], valeurs[-1]
+
+
+def completer_scores(top: list, segments_restants: list) -> list:
+    """
+    Scores exacts des documents de `top` [(id_doc, score partiel)] : les
+    segments non parcourus leur sont ajoutés, dans le même ordre que lors du
+    parcours (mêmes sommes qu'un calcul exhaustif). Les docIDs d'un segment
+    sont triés : une dichotomie par document suffit.
+    """
+    scores = dict(top)
+    for contribution, _, _, docs_seg in segments_restants:
+        for id_doc in scores:
+            pos = bisect_left(docs_seg, id_doc)
+            if pos < len(docs_seg) and docs_seg[pos] == id_doc:
+                scores[id_doc] += contribution
+    return heapq.nlargest(len(scores), scores.items(), key=lambda x: x[1])
+
+
+def recherche_impacts(query: str,
+                      docs,
+                      index: dict,
+                      params: dict,
+                      max_resultats: int = 20,
+                      budget_ms: float | None = None):
+    """
+    Traitement « score-at-a-time ».
+
+    Renvoie (resultats, partiel) :
+      - resultats : liste [(score, nom_doc), ...] triée par score décroissant,
+      - partiel   : True si le budget de temps a interrompu la recherche.
+
+    Arrêt anticipé : après chaque segment, la borne `reste` majore ce que
+    n'importe quel document peut encore gagner. Si le k-ième score dépasse
+    le (k+1)-ième de plus de `reste`, l'ensemble du top-k est définitif ;
+    seuls ses k documents reçoivent ensuite les segments restants
+    (completer_scores), ce qui donne leurs scores exacts et leur ordre.
+    Le top-(k+1) est suivi au fil des ajouts (MeilleursScores) : le test ne
+    parcourt pas tous les accumulateurs.
+    """
+    echeance = Echeance(budget_ms)
+    q_poids = poids_requete(query, index, params)
+    if not q_poids:
+        enregistrer(False)
+        return [], False
+
+    termes = list(q_poids)
+    # file de tous les segments, par contribution décroissante
+    file_segments = []
+    for i, mot in enumerate(termes):
+        for rang, (impact, docs_seg) in enumerate(index[mot][1]):
+            file_segments.append((q_poids[mot] * impact, i, rang, docs_seg))
+    file_segments.sort(key=lambda s: s[0], reverse=True)
+
+    # contribution maximale restante pour chaque terme
+    reste_terme = [q_poids[mot] * index[mot][1][0][0] for mot in termes]
+
+    accumulateurs = {}
+    meilleurs = MeilleursScores(max_resultats + 1)
+    restants = []
+    for n, (contribution, i, rang, docs_seg) in enumerate(file_segments):
+        for id_doc in docs_seg:
+            score = accumulateurs.get(id_doc, 0.0) + contribution
+            accumulateurs[id_doc] = score
+            meilleurs.mettre_a_jour(id_doc, score)
+
+        segments_terme = index[termes[i]][1]
+        if rang + 1 < len(segments_terme):
+            reste_terme[i] = q_poids[termes[i]] * segments_terme[rang + 1][0]
+        else:
+            reste_terme[i] = 0.0
+        reste = sum(reste_terme)
+
+        if reste == 0.0:
+            break
+        if echeance.verifier_maintenant():
+            break
+
+        k_ieme, suivant = meilleurs.deux_derniers()
+        if k_ieme > suivant + reste:
+            restants = file_segments[n + 1:]
+            break
+
+    # mise à l'échelle : impacts -> poids, puis cosinus pour tf.idf
+    facteur = params.get("echelle", 1.0)
+    if params.get("modele") != "bm25":
+        facteur /= math.sqrt(sum(w * w for w in q_poids.values()))
+
+    top = heapq.nlargest(max_resultats, accumulateurs.items(), key=lambda x: x[1])
+    if restants:
+        top = completer_scores(top, restants)
+    enregistrer(echeance.depassee)
+    return [(total * facteur, docs[id_doc - 1]) for id_doc, total in top], echeance.depassee
+
+
+def main():
+    if not DOC_LIST_FILE.is_file():
+        raise SystemExit(f"Fichier introuvable : {DOC_LIST_FILE}")
+    if not INDEX_IMPACTS_FILE.is_file():
+        raise SystemExit(f"Fichier introuvable : {INDEX_IMPACTS_FILE} (lancer indexImpacts.py)")
+
+    # Budget de temps optionnel (en millisecondes)
+    budget_ms = None
+    if len(sys.argv) >= 2:
+        try:
+            budget_ms = float(sys.argv[1])
+        except ValueError:
+            raise SystemExit("Usage : python moteur_impacts.py [budget_ms]")
+
+    docs = charger_liste_docs(DOC_LIST_FILE)
+    index, params = charger_index_impacts(INDEX_IMPACTS_FILE)
+    modele = params.get("modele", "tfidf")
+
+    budget_txt = f"budget {budget_ms:g} ms" if budget_ms is not None else "sans budget"
+    # extraits : textes .flt, lus seulement pour les documents affichés
+    source_textes = source_extraits(COLLECTION_DIR)
+    couleur = sys.stdout.isatty()
+
+    print(f"Moteur score-at-a-time ({modele}, {budget_txt}). "
+          "Tapez une requête, ou ligne vide pour quitter.")
+    while True:
+        try:
+            query = input("\nRequête > ").strip()
+        except (EOFError, KeyboardInterrupt):
+            print("\nFin.")
+            break
+
+        if not query:
+            print("Fin.")
+            break
+
+        res, partiel = recherche_impacts(query, docs, index, params,
+                                         max_resultats=20, budget_ms=budget_ms)
+
+        if not res:
+            print("Aucun document trouvé.")
+            continue
+
+        extraits = calculer_extraits(source_textes, [nom_doc for _, nom_doc in res],
+                                     termes_requete(query, termes_indexes=index))
+
+        print("\nTop documents (budget épuisé, résultats partiels) :" if partiel else "\nTop documents :")
+        afficher_resultats(res, extraits, couleur)
+
+        out_html = RESULTS_DIR / "resultats_impacts.html"
+        ecrire_resultats_html(
+            moteur_nom=f"Score-at-a-time ({modele})",
+            query=query,
+            resultats=res,
+            output_path=out_html,
+            collection_dir=COLLECTION_DIR,
+            extension=".stp",
+            extraits=extraits,
+        )
+        print(f"\nRésultats HTML écrits dans : {out_html}")
+
+    if budget_ms is not None:
+        print(resume_statistiques())
+
+
+if __name__ == "__main__":
+    main()
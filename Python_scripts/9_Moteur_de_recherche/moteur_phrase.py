@@ -0,0 +1,211 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: moteur_phrase.py
+Objectif du programme:
+    Répondre aux requêtes d'expression exacte ("parallel algorithm") et de
+    fenêtre ("parallel algorithm"~5 : tous les termes dans une fenêtre de 5 mots)
+    à partir de l'index positionnel, sans relire les fichiers .stp.
+Usage :
+  python moteur_phrase.py
+Syntaxe des requêtes :
+  "parallel algorithm"            expression exacte
+  "parallel algorithm"~5          termes présents dans une fenêtre de 5 mots
+  "matrix inversion" gauss        clauses combinées par un AND implicite
+Remarque :
+  les positions sont celles des fichiers .stp : les mots vides de la requête
+  sont donc retirés avant l'évaluation, comme ils l'ont été des documents.
+"""
+
+from pathlib import Path
+from bisect import bisect_left
+import re
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # accès au paquet ri
+
+from ri.index import charger_liste_docs
+from ri.postings import intersection_multiple
+
+# Chemins
+COLLECTION_DIR = Path("Collection")
+DOC_LIST_FILE = COLLECTION_DIR / "Collection"
+INDEX_POS_FILE = Path("outputs/indexPositionnel.txt")
+STOPWORDS_FILE = Path("outputs/common_words")
+
+# "expression"~N, ou terme isolé
+MOTIF_CLAUSE = re.compile(r'"([^"]*)"(?:~(\d+))?|(\S+)')
+
+
+def charger_index_positionnel(path_index: Path) -> dict:
+    """
+    Charge indexPositionnel.txt (lignes "idTerme mot doc:p1,p2 doc:p1 ...").
+    Renvoie un dict {mot: (docIDs triés, positions)} où positions[i]
+    est la liste triée des positions du mot dans docIDs[i].
+    """
+    index_pos = {}
+    with path_index.open("r", encoding="utf-8") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) < 3:
+                continue
+            docs = []
+            positions = []
+            for chunk in parts[2:]:
+                id_str, pos_str = chunk.split(":", 1)
+                docs.append(int(id_str))
+                positions.append([int(p) for p in pos_str.split(",")])
+            index_pos[parts[1]] = (docs, positions)
+    return index_pos
+
+
+def charger_mots_vides(path_stop: Path) -> set:
+    """Charge la stoplist utilisée par remove.pl (un mot par ligne)."""
+    if not path_stop.is_file():
+        return set()
+    with path_stop.open("r", encoding="utf-8") as f:
+        return {line.strip() for line in f if line.strip()}
+
+
+def analyser_requete(query: str, mots_vides: set) -> list:
+    """
+    Découpe la requête en clauses (termes, fenetre) :
+      - fenetre = 0 pour une expression exacte,
+      - fenetre = N pour "..."~N,
+      - un terme isolé devient une expression d'un seul mot.
+    """
+    clauses = []
+    for m in MOTIF_CLAUSE.finditer(query.lower()):
+        expression, fenetre, terme = m.groups()
+        texte = expression if expression is not None else terme
+        termes = [t for t in texte.split() if t not in mots_vides]
+        if not termes:
+            continue
+        clauses.append((termes, int(fenetre) if fenetre else 0))
+    return clauses
+
+
+def positions_dans_doc(index_pos: dict, mot: str, id_doc: int) -> list:
+    """Positions du mot dans le document (recherche dichotomique dans les docIDs)."""
+    docs, positions = index_pos[mot]
+    i = bisect_left(docs, id_doc)
+    if i < len(docs) and docs[i] == id_doc:
+        return positions[i]
+    return []
+
+
+def verifier_expression(listes_positions: list) -> bool:
+    """
+    Expression exacte : il existe p tel que le i-ème terme est en position p + i.
+    On décale chaque liste de -i puis on intersecte les listes décalées.
+    """
+    decalees = [[p - i for p in pos] for i, pos in enumerate(listes_positions)]
+    return bool(intersection_multiple(decalees))
+
+
+def verifier_fenetre(listes_positions: list, fenetre: int) -> bool:
+    """
+    Fenêtre : tous les termes apparaissent dans un intervalle de `fenetre` mots
+    consécutifs, dans n'importe quel ordre. Fusion des listes puis
+    fenêtre glissante à deux pointeurs.
+    """
+    nb_termes = len(listes_positions)
+    fusion = sorted(
+        (p, i) for i, positions in enumerate(listes_positions) for p in positions
+    )
+
+    compte = [0] * nb_termes
+    couverts = 0
+    gauche = 0
+    for p, i in fusion:
+        if compte[i] == 0:
+            couverts += 1
+        compte[i] += 1
+
+        # on resserre la fenêtre par la gauche
+        while fusion[gauche][0] <= p - fenetre:
+            j = fusion[gauche][1]
+            compte[j] -= 1
+            if compte[j] == 0:
+                couverts -= 1
+            gauche += 1
+
+        if couverts == nb_termes:
+            return True
+    return False
+
+
+def recherche_phrase(query: str, index_pos: dict, mots_vides: set) -> list:
+    """
+    Renvoie la liste triée des docIDs qui satisfont toutes les clauses.
+    Les candidats sont d'abord filtrés par intersection des docIDs,
+    puis seules leurs positions sont fusionnées.
+    """
+    clauses = analyser_requete(query, mots_vides)
+    if not clauses:
+        return []
+
+    termes = {t for termes_clause, _ in clauses for t in termes_clause}
+    if any(t not in index_pos for t in termes):
+        return []
+
+    candidats = intersection_multiple([index_pos[t][0] for t in termes])
+
+    resultats = []
+    for id_doc in candidats:
+        ok = True
+        for termes_clause, fenetre in clauses:
+            if len(termes_clause) == 1:
+                continue
+            # on dédoublonne les termes pour la fenêtre (l'ordre n'y compte pas)
+            distincts = termes_clause if fenetre == 0 else list(dict.fromkeys(termes_clause))
+            listes = [positions_dans_doc(index_pos, t, id_doc) for t in distincts]
+            if fenetre == 0:
+                ok = verifier_expression(listes)
+            else:
+                ok = verifier_fenetre(listes, fenetre)
+            if not ok:
+                break
+        if ok:
+            resultats.append(id_doc)
+
+    return resultats
+
+
+def main():
+    if not DOC_LIST_FILE.is_file():
+        raise SystemExit(f"Fichier introuvable : {DOC_LIST_FILE}")
+    if not INDEX_POS_FILE.is_file():
+        raise SystemExit(f"Fichier introuvable : {INDEX_POS_FILE} (lancer indexInverse.py)")
+
+    docs = charger_liste_docs(DOC_LIST_FILE)
+    index_pos = charger_index_positionnel(INDEX_POS_FILE)
+    mots_vides = charger_mots_vides(STOPWORDS_FILE)
+
+    print('Moteur d\'expressions ("a b" ou "a b"~N). Tapez une requête, ou ligne vide pour quitter.')
+    while True:
+        try:
+            query = input("\nRequête > ").strip()
+        except (EOFError, KeyboardInterrupt):
+            print("\nFin.")
+            break
+
+        if not query:
+            print("Fin.")
+            break
+
+        res = recherche_phrase(query, index_pos, mots_vides)
+
+        if not res:
+            print("Aucun document trouvé.")
+            continue
+
+        print(f"\n{len(res)} document(s) trouvé(s) :")
+        for id_doc in res[:20]:
+            nom_doc = docs[id_doc - 1]
+            print(f"- {nom_doc}  -> Collection/{nom_doc}.stp")
+        if len(res) > 20:
+            print(f"... ({len(res) - 20} autres)")
+
+
+if __name__ == "__main__":
+    main()
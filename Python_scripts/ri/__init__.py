@@ -0,0 +1,10 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: __init__.py
+Objectif du programme:
+    Paquet `ri` : code partagé entre les scripts des différentes étapes du TP
+    (préparation de la collection, indexation, moteurs de recherche).
+
+Les scripts des dossiers numérotés ne sont pas des modules importables ;
+ils ajoutent le dossier Python_scripts/ à sys.path pour accéder à ce paquet.
+"""
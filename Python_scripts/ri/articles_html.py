@@ -0,0 +1,98 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: articles_html.py
+Objectif du programme:
+    Extraire les documents (<article>) des collections HTML produites par
+    clean_v2.py et remove_v2.py (outputs/Collection1.html, Collection2.html)
+    au fil de la lecture : le fichier est lu par blocs et analysé par
+    html.parser.HTMLParser, événement par événement ; chaque article est
+    rendu dès sa balise fermante. Aucun arbre du document n'est construit :
+    la mémoire utilisée ne dépend pas de la taille de la collection.
+
+Le texte d'un article est celui qu'en donne BeautifulSoup avec
+get_text(" ", strip=True) : morceaux de texte débarrassés de leurs blancs
+de bord, joints par une espace.
+"""
+
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+# clean_v2.py écrit class="cacm" ; "cacm-doc" est accepté pour les anciens fichiers
+CLASSES_ARTICLE = ("cacm", "cacm-doc")
+TAILLE_LECTURE = 64 * 1024
+
+
+class Article(NamedTuple):
+    doc_id: str | None  # attribut id de la balise, ex. "CACM-123"
+    texte: str
+
+
+class AnalyseurArticles(HTMLParser):
+    """Accumule dans `termines` les articles dont la balise fermante a été lue."""
+
+    def __init__(self, classes=CLASSES_ARTICLE):
+        super().__init__(convert_charrefs=True)
+        self.classes = set(classes)
+        self.profondeur = 0  # > 0 à l'intérieur d'un article retenu
+        self.doc_id = None
+        self.morceaux = []  # textes entre deux balises
+        self.texte = []     # texte en cours, reçu éventuellement en plusieurs fois
+        self.termines = []
+
+    def _fin_texte(self):
+        # HTMLParser peut découper un même texte en plusieurs appels à
+        # handle_data (fin d'un bloc lu) : ils sont recollés avant de le retenir
+        if self.texte:
+            self.morceaux.append("".join(self.texte))
+            self.texte = []
+
+    def handle_starttag(self, tag, attrs):
+        if self.profondeur:
+            self._fin_texte()
+        if tag != "article":
+            return
+        if self.profondeur:
+            self.profondeur += 1
+            return
+        attributs = dict(attrs)
+        if self.classes.intersection((attributs.get("class") or "").split()):
+            self.profondeur = 1
+            self.doc_id = attributs.get("id")
+            self.morceaux = []
+
+    def handle_endtag(self, tag):
+        if self.profondeur:
+            self._fin_texte()
+        if tag != "article" or not self.profondeur:
+            return
+        self.profondeur -= 1
+        if self.profondeur == 0:
+            texte = " ".join(m for m in (morceau.strip() for morceau in self.morceaux) if m)
+            self.termines.append(Article(self.doc_id, texte))
+            self.morceaux = []
+
+    def handle_comment(self, data):
+        if self.profondeur:
+            self._fin_texte()
+
+    def handle_data(self, data):
+        if self.profondeur:
+            self.texte.append(data)
+
+
+def articles_html(path: Path, classes=CLASSES_ARTICLE,
+                  taille_lecture: int = TAILLE_LECTURE) -> Iterator[Article]:
+    """Générateur des articles de `path` (dans l'ordre du fichier) dont la classe est dans `classes`."""
+    analyseur = AnalyseurArticles(classes)
+    with path.open("r", encoding="utf-8") as f:
+        while True:
+            bloc = f.read(taille_lecture)
+            if bloc:
+                analyseur.feed(bloc)
+            else:
+                analyseur.close()
+            termines, analyseur.termines = analyseur.termines, []
+            yield from termines
+            if not bloc:
+                return
@@ -0,0 +1,65 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: bm25.py
+Objectif du programme:
+    Modèle BM25 / BM25+ sur l'index à impacts de indexBM25.py : chargement
+    de l'index et classement des documents par somme des impacts.
+    Utilisé par moteur_bm25.py et par l'évaluation (étape 11).
+"""
+
+from pathlib import Path
+import heapq
+
+
+def charger_index_bm25(path_index: Path):
+    """
+    Charge indexBM25.txt.
+    Renvoie (index, params) avec :
+      - index  : dict {mot: (docIDs, impacts)} (deux listes parallèles)
+      - params : dict des paramètres de l'en-tête (k1, b, delta, echelle, ...)
+    """
+    index = {}
+    params = {}
+    with path_index.open("r", encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("#"):
+                for chunk in line[1:].split():
+                    cle, valeur = chunk.split("=", 1)
+                    params[cle] = float(valeur)
+                continue
+            parts = line.split()
+            if len(parts) < 3:
+                continue
+            docs = []
+            impacts = []
+            for chunk in parts[2:]:
+                id_str, impact_str = chunk.split(":", 1)
+                docs.append(int(id_str))
+                impacts.append(int(impact_str))
+            index[parts[1]] = (docs, impacts)
+    return index, params
+
+
+def recherche_bm25(query: str,
+                   docs,
+                   index: dict,
+                   echelle: float,
+                   max_resultats: int = 20):
+    """
+    Renvoie une liste [(score, nom_doc), ...] triée par score décroissant.
+    Accumulation terme par terme : seuls les postings des termes de la requête sont lus.
+    """
+    # tf dans la requête : un terme répété compte plusieurs fois
+    tf_q = {}
+    for mot in query.lower().split():
+        if mot in index:
+            tf_q[mot] = tf_q.get(mot, 0) + 1
+
+    accumulateurs = {}
+    for mot, tf in tf_q.items():
+        docs_terme, impacts = index[mot]
+        for id_doc, impact in zip(docs_terme, impacts):
+            accumulateurs[id_doc] = accumulateurs.get(id_doc, 0) + tf * impact
+
+    meilleurs = heapq.nlargest(max_resultats, accumulateurs.items(), key=lambda x: x[1])
+    return [(total * echelle, docs[id_doc - 1]) for id_doc, total in meilleurs]
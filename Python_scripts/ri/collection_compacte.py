@@ -0,0 +1,253 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: collection_compacte.py
+Objectif du programme:
+    Stocker la collection dans un seul fichier de données par représentation
+    (brut, .flt, .stp) au lieu d'un fichier par document, avec un index
+    (nom, offset, longueur) et un accès direct aux documents par mmap.
+    Les scripts passent par SourceDocuments, qui utilise la collection compacte
+    si elle existe, sinon le magasin compressé (magasin_compresse.py), et
+    retombe enfin sur les fichiers Collection/<doc><ext>. Un stockage groupé
+    plus ancien que l'un de ces fichiers (par exemple après une nouvelle
+    exécution de remove.pl) est ignoré, avec un avertissement.
+
+Organisation sur disque (dossier Collection_compacte/) :
+    stp.dat   textes .stp concaténés (UTF-8)
+    stp.idx   une ligne "nom offset longueur" par document, dans l'ordre de Collection
+    (idem flt.dat / flt.idx et brut.dat / brut.idx)
+"""
+
+from pathlib import Path
+from typing import Iterable
+import mmap
+import os
+import sys
+
+from ri.magasin_compresse import MagasinCompresse, chemins as chemins_compresses
+
+# Représentation -> extension des fichiers individuels correspondants
+REPRESENTATIONS = {"brut": "", "flt": ".flt", "stp": ".stp"}
+
+
+def chemins(dossier: Path, representation: str):
+    """Renvoie (fichier de données, fichier d'index) d'une représentation."""
+    if representation not in REPRESENTATIONS:
+        raise ValueError(f"Représentation inconnue : {representation}")
+    return dossier / f"{representation}.dat", dossier / f"{representation}.idx"
+
+
+class EcrivainCompact:
+    """Écriture incrémentale d'une représentation : un document à la fois."""
+
+    def __init__(self, dossier: Path, representation: str):
+        dossier.mkdir(parents=True, exist_ok=True)
+        path_dat, path_idx = chemins(dossier, representation)
+        self.f_dat = path_dat.open("wb")
+        self.f_idx = path_idx.open("w", encoding="utf-8")
+        self.offset = 0
+        self.n = 0
+
+    def ajouter(self, nom_doc: str, texte: str) -> None:
+        donnees = texte.encode("utf-8")
+        self.f_dat.write(donnees)
+        self.f_idx.write(f"{nom_doc} {self.offset} {len(donnees)}\n")
+        self.offset += len(donnees)
+        self.n += 1
+
+    def fermer(self) -> None:
+        self.f_dat.close()
+        self.f_idx.close()
+
+
+def ecrire_collection_compacte(dossier: Path, representation: str,
+                               documents: Iterable[tuple]) -> int:
+    """
+    Écrit une représentation à partir d'un itérable de (nom_doc, texte).
+    Renvoie le nombre de documents écrits.
+    """
+    ecrivain = EcrivainCompact(dossier, representation)
+    try:
+        for nom_doc, texte in documents:
+            ecrivain.ajouter(nom_doc, texte)
+    finally:
+        ecrivain.fermer()
+    return ecrivain.n
+
+
+class CollectionCompacte:
+    """
+    Lecteur d'une représentation compacte. Le fichier de données est projeté
+    en mémoire (mmap) à la première lecture : seul le système lit les pages
+    réellement consultées.
+    """
+
+    def __init__(self, dossier: Path, representation: str = "stp"):
+        self.path_dat, self.path_idx = chemins(dossier, representation)
+        self.positions = {}  # nom -> (offset, longueur)
+        self.noms = []
+        with self.path_idx.open("r", encoding="utf-8") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) != 3:
+                    continue
+                nom, offset, longueur = parts[0], int(parts[1]), int(parts[2])
+                self.positions[nom] = (offset, longueur)
+                self.noms.append(nom)
+        self._fichier = None
+        self._mmap = None
+
+    def _ouvrir(self) -> None:
+        self._fichier = self.path_dat.open("rb")
+        if self.path_dat.stat().st_size > 0:
+            self._mmap = mmap.mmap(self._fichier.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._mmap = b""
+
+    def __len__(self) -> int:
+        return len(self.noms)
+
+    def __contains__(self, nom_doc: str) -> bool:
+        return nom_doc in self.positions
+
+    def lire_texte(self, nom_doc: str) -> str | None:
+        """Texte du document, ou None s'il est absent de la collection."""
+        position = self.positions.get(nom_doc)
+        if position is None:
+            return None
+        if self._mmap is None:
+            self._ouvrir()
+        offset, longueur = position
+        return self._mmap[offset:offset + longueur].decode("utf-8", errors="ignore")
+
+    def lire_tokens(self, nom_doc: str) -> list:
+        texte = self.lire_texte(nom_doc)
+        return texte.split() if texte else []
+
+    def fermer(self) -> None:
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
+        if self._fichier is not None:
+            self._fichier.close()
+        self._fichier = None
+        self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.fermer()
+
+
+class SourceDocuments:
+    """
+    Accès uniforme aux textes des documents : collection compacte si elle
+    existe pour cette représentation, sinon magasin compressé, sinon un
+    fichier par document.
+    """
+
+    def __init__(self, collection_dir: Path, representation: str = "stp",
+                 compacte_dir: Path | None = None,
+                 compressee_dir: Path | None = None):
+        self.collection_dir = collection_dir
+        self.representation = representation
+        self.extension = REPRESENTATIONS[representation]
+        if compacte_dir is None:
+            compacte_dir = collection_dir.parent / "Collection_compacte"
+        if compressee_dir is None:
+            compressee_dir = collection_dir.parent / "Collection_compressee"
+        self.compacte_dir = compacte_dir
+        self.compressee_dir = compressee_dir
+        self._magasin = None
+        self._magasin_cherche = False
+
+    @property
+    def magasin(self) -> CollectionCompacte | MagasinCompresse | None:
+        """
+        Stockage groupé ouvert à la première utilisation (None si absent ou
+        périmé : les fichiers par document sont alors lus directement).
+        """
+        if not self._magasin_cherche:
+            self._magasin_cherche = True
+            candidats = (
+                (chemins(self.compacte_dir, self.representation), CollectionCompacte, self.compacte_dir),
+                (chemins_compresses(self.compressee_dir, self.representation),
+                 MagasinCompresse, self.compressee_dir),
+            )
+            for paths, classe, dossier in candidats:
+                if not all(path.is_file() for path in paths):
+                    continue
+                magasin = classe(dossier, self.representation)
+                perime = self._document_plus_recent(magasin, min(p.stat().st_mtime for p in paths))
+                if perime is None:
+                    self._magasin = magasin
+                    break
+                print(f"Attention : {dossier} est plus ancien que {perime}, "
+                      f"lecture des fichiers de {self.collection_dir}", file=sys.stderr)
+                magasin.fermer()
+        return self._magasin
+
+    def _document_plus_recent(self, magasin, date: float) -> str | None:
+        """
+        Nom d'un fichier modifié après `date` : la liste Collection/Collection
+        (documents ajoutés ou retirés depuis l'écriture du magasin) ou le
+        fichier Collection/<doc><ext> d'un document du magasin ; None si le
+        magasin est à jour. Un seul parcours du dossier (os.scandir) : pas
+        d'appel par document absent, ce qui compte pour les corpus écrits sans
+        fichier par document.
+        """
+        if not self.collection_dir.is_dir():
+            return None
+        liste = self.collection_dir / "Collection"
+        if liste.is_file() and liste.stat().st_mtime > date:
+            return liste.name
+        n = len(self.extension)
+        with os.scandir(self.collection_dir) as entrees:
+            for entree in entrees:
+                nom = entree.name
+                if not nom.endswith(self.extension):
+                    continue
+                nom_doc = nom[:-n] if n else nom
+                if nom_doc in magasin and entree.stat().st_mtime > date:
+                    return nom
+        return None
+
+    def lire_texte(self, nom_doc: str) -> str | None:
+        """
+        Texte du document, ou None s'il est introuvable. Un document absent du
+        magasin est cherché dans son fichier Collection/<doc><ext>.
+        """
+        if self.magasin is not None and nom_doc in self.magasin:
+            return self.magasin.lire_texte(nom_doc)
+        path = self.collection_dir / f"{nom_doc}{self.extension}"
+        try:
+            return path.read_text(encoding="utf-8", errors="ignore")
+        except FileNotFoundError:
+            return None
+
+    def lire_tokens(self, nom_doc: str) -> list:
+        texte = self.lire_texte(nom_doc)
+        return texte.split() if texte else []
+
+
+class EcrivainCollectionCompacte:
+    """
+    Consommateur pour ri.flux.executer : écrit les représentations demandées
+    directement au format compact, pendant le même passage que les autres sorties.
+    """
+
+    def __init__(self, dossier: Path, representations=("brut", "flt", "stp")):
+        self.ecrivains = {r: EcrivainCompact(dossier, r) for r in representations}
+
+    def traiter(self, id_doc: int, doc) -> None:
+        for r, ecrivain in self.ecrivains.items():
+            if r == "brut":
+                texte = doc.texte
+            elif r == "flt":
+                texte = " ".join(doc.mots)
+            else:
+                texte = " ".join(doc.tokens)
+            ecrivain.ajouter(doc.doc_id, texte)
+
+    def terminer(self, nb_docs: int) -> None:
+        for ecrivain in self.ecrivains.values():
+            ecrivain.fermer()
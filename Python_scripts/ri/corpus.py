@@ -0,0 +1,122 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: corpus.py
+Objectif du programme:
+    Corpus de test de taille choisie, pour mesurer les performances au-delà
+    des 3204 documents de CACM : la collection est rééchantillonnée (les
+    documents d'origine, puis des documents tirés au hasard parmi eux, avec
+    une graine fixe), et écrite dans un dossier séparé avec tout ce que les
+    moteurs lisent.
+
+    Les documents peuvent aussi venir du générateur ri.synthetique.
+
+Organisation d'un corpus (dossier donné, par exemple outputs/benchmark/x10) :
+    Collection/Collection          liste des documents
+    Collection/<doc>, .flt, .stp   un fichier par document (si fichiers=True)
+    Collection_compacte/           textes .flt et .stp (ri.collection_compacte)
+    outputs/vocabulaire.txt, df.txt, vecteurTF.txt (+ .npz)
+    corpus.json                    paramètres et nombre de documents
+Les vecteurs TF sont écrits lors d'un second passage sur la collection
+compacte, document par document : la mémoire ne dépend que du vocabulaire
+et de la taille du .npz, pas du nombre de dictionnaires tf.
+"""
+
+from pathlib import Path
+from typing import Iterable, Iterator
+import json
+import random
+
+from ri import flux
+from ri.collection_compacte import CollectionCompacte, EcrivainCollectionCompacte
+from ri.vecteurs import EcrivainVecteurs
+
+FICHIER_PARAMETRES = "corpus.json"
+
+
+def reechantillonner(documents: list, facteur: float, graine: int = 0) -> Iterator[flux.Document]:
+    """
+    round(facteur × len(documents)) documents : ceux de la liste d'abord, puis
+    des tirages avec remise (random.Random(graine)), renommés SYN-<n>.
+    Avec facteur = 1, la collection est rendue telle quelle.
+    """
+    nb_docs = round(facteur * len(documents))
+    rng = random.Random(graine)
+    for n in range(nb_docs):
+        if n < len(documents):
+            yield documents[n]
+        else:
+            doc = rng.choice(documents)
+            yield doc._replace(doc_id=f"SYN-{n + 1}")
+
+
+class ListeDocuments:
+    """Consommateur pour ri.flux.executer : écrit la liste Collection/Collection."""
+
+    def __init__(self, collection_dir: Path):
+        collection_dir.mkdir(parents=True, exist_ok=True)
+        self.f = (collection_dir / "Collection").open("w", encoding="utf-8")
+
+    def traiter(self, id_doc: int, doc: flux.Document) -> None:
+        self.f.write(doc.doc_id + "\n")
+
+    def terminer(self, nb_docs: int) -> None:
+        self.f.close()
+
+
+def ecrire_corpus(dossier: Path, documents: Iterable[flux.Document], parametres: dict,
+                  fichiers: bool = False) -> int:
+    """
+    Écrit un corpus complet dans `dossier` (liste, collection compacte, un
+    fichier par document si `fichiers`, vocabulaire, df, vecteurs TF) puis
+    corpus.json. Renvoie le nombre de documents.
+    """
+    outputs_dir = dossier / "outputs"
+    outputs_dir.mkdir(parents=True, exist_ok=True)
+    vocabulaire = flux.Vocabulaire(outputs_dir / "vocabulaire.txt")
+    consommateurs = [
+        flux.EcrivainCollection(dossier / "Collection") if fichiers
+        else ListeDocuments(dossier / "Collection"),
+        EcrivainCollectionCompacte(dossier / "Collection_compacte", ("flt", "stp")),
+        vocabulaire,
+        flux.FrequencesDocumentaires(outputs_dir / "df.txt"),
+    ]
+    nb_docs = flux.executer(documents, consommateurs)
+    ecrire_vecteurs_tf(dossier, vocabulaire.mot2id)
+    parametres = dict(parametres, documents=nb_docs)
+    (dossier / FICHIER_PARAMETRES).write_text(json.dumps(parametres, indent=2), encoding="utf-8")
+    return nb_docs
+
+
+def ecrire_vecteurs_tf(dossier: Path, mot2id: dict) -> None:
+    """
+    outputs/vecteurTF.txt et .npz du corpus (même contenu que le consommateur
+    flux.Vecteurs), en relisant la collection compacte document par document.
+    """
+    path_tf = dossier / "outputs" / "vecteurTF.txt"
+    with EcrivainVecteurs(path_tf, path_tf.with_suffix(".npz"), "i", len(mot2id)) as ecrivain:
+        for doc in documents_corpus(dossier):
+            tf = {}
+            for mot in doc.tokens:
+                tf[mot] = tf.get(mot, 0) + 1
+            couples = sorted((mot2id[mot], n) for mot, n in tf.items() if mot in mot2id)
+            ecrivain.ajouter([idx for idx, _ in couples], [n for _, n in couples])
+
+
+def parametres_corpus(dossier: Path) -> dict | None:
+    """Contenu de corpus.json, ou None si le corpus n'a pas été écrit."""
+    path = dossier / FICHIER_PARAMETRES
+    if not path.is_file():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def documents_corpus(dossier: Path) -> Iterator[flux.Document]:
+    """
+    Relit un corpus écrit par ecrire_corpus, dans l'ordre de sa liste, sous
+    forme de flux de Document (le texte brut n'est pas conservé : texte = .flt).
+    """
+    compacte_dir = dossier / "Collection_compacte"
+    with CollectionCompacte(compacte_dir, "flt") as flt, CollectionCompacte(compacte_dir, "stp") as stp:
+        for nom in flt.noms:
+            texte = flt.lire_texte(nom)
+            yield flux.Document(nom, texte, texte.split(), stp.lire_tokens(nom))
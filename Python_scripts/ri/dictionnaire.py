@@ -0,0 +1,332 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: dictionnaire.py
+Objectif du programme:
+    Dictionnaire des termes compact, à la place des deux dict mot->idTerme et
+    idTerme->mot construits à partir de vocabulaire.txt.
+    - Les termes (triés, encodés en UTF-8) sont rangés dans un seul tampon
+      d'octets, par blocs de TAILLE_BLOC termes avec codage par préfixe
+      commun (« front coding ») : le premier terme du bloc est écrit en entier,
+      les suivants sous la forme (longueur du préfixe partagé avec le terme
+      précédent, suffixe).
+    - Un tableau donne la position du début de chaque bloc : la recherche d'un
+      terme est une dichotomie sur les têtes de bloc, puis le décodage d'un
+      seul bloc.
+    - L'idTerme est le rang du terme (à partir de 1), comme la ligne de
+      vocabulaire.txt ; les termes d'un même préfixe forment une plage
+      contiguë d'idTermes, ce qui donne les requêtes à joker `algo*`.
+    - Sur disque (outputs/vocabulaire.dict, écrit avec vocabulaire.txt par
+      vocabulary.py ou ri.flux), le même contenu est projeté en mémoire
+      (mmap) : rien n'est décodé au chargement.
+
+Organisation du fichier .dict (entiers uint32 petit-boutistes) :
+    MAGIQUE, nb_termes, taille_bloc, nb_blocs,
+    debuts[nb_blocs] (positions dans les données), données des blocs.
+    Dans un bloc : tête = varint(longueur) + octets ;
+    suivants = varint(préfixe commun) + varint(longueur du suffixe) + suffixe.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+import mmap
+import os
+import struct
+import sys
+import tempfile
+
+TAILLE_BLOC = 16
+MAGIQUE = b"RIDICT01"
+EN_TETE = struct.Struct("<8sIII")
+
+
+def _ecrire_varint(tampon: bytearray, n: int) -> None:
+    while n >= 0x80:
+        tampon.append((n & 0x7F) | 0x80)
+        n >>= 7
+    tampon.append(n)
+
+
+def _lire_varint(donnees, pos: int) -> tuple:
+    n = decalage = 0
+    while True:
+        octet = donnees[pos]
+        pos += 1
+        n |= (octet & 0x7F) << decalage
+        if octet < 0x80:
+            return n, pos
+        decalage += 7
+
+
+def _prefixe_commun(a: bytes, b: bytes) -> int:
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+
+def _successeur(prefixe: bytes) -> bytes | None:
+    """Plus petite chaîne d'octets supérieure à toutes celles qui commencent par `prefixe`."""
+    prefixe = prefixe.rstrip(b"\xff")
+    if not prefixe:
+        return None
+    return prefixe[:-1] + bytes([prefixe[-1] + 1])
+
+
+class DictionnaireTermes:
+    """
+    Termes triés, codés par préfixe commun dans un seul tampon.
+
+        termes = DictionnaireTermes.construire(["algebra", "algol", "algorithm"])
+        termes["algol"]           -> 2      (KeyError si absent ; get() -> None)
+        "algol" in termes         -> True
+        termes.mot(3)             -> "algorithm"
+        termes.plage_prefixe("algo")  -> range(2, 4)   (idTermes de algo*)
+        list(termes.prefixe("algo"))  -> [(2, "algol"), (3, "algorithm")]
+    """
+
+    def __init__(self, donnees, debuts, nb_termes: int, taille_bloc: int = TAILLE_BLOC):
+        self.donnees = donnees  # bytes, ou vue sur le fichier projeté en mémoire
+        self.debuts = debuts    # position du début de chaque bloc
+        self.nb_termes = nb_termes
+        self.taille_bloc = taille_bloc
+        self._tetes = None
+        self._projection = None
+
+    # -- construction et fichier ------------------------------------------
+
+    @classmethod
+    def construire(cls, mots, taille_bloc: int = TAILLE_BLOC) -> "DictionnaireTermes":
+        """`mots` : termes distincts, triés (ordre de vocabulaire.txt)."""
+        donnees = bytearray()
+        debuts = array("I")
+        precedent = None
+        n = 0
+        for mot in mots:
+            courant = mot.encode("utf-8")
+            if precedent is not None and courant <= precedent:
+                raise ValueError(f"termes non triés ou en double : {mot!r}")
+            if n % taille_bloc == 0:
+                debuts.append(len(donnees))
+                _ecrire_varint(donnees, len(courant))
+                donnees += courant
+            else:
+                commun = _prefixe_commun(precedent, courant)
+                _ecrire_varint(donnees, commun)
+                _ecrire_varint(donnees, len(courant) - commun)
+                donnees += courant[commun:]
+            precedent = courant
+            n += 1
+        return cls(bytes(donnees), debuts, n, taille_bloc)
+
+    @classmethod
+    def depuis_vocabulaire(cls, path_vocab: Path, taille_bloc: int = TAILLE_BLOC):
+        with path_vocab.open("r", encoding="utf-8") as f:
+            return cls.construire((mot for mot in (line.strip() for line in f) if mot),
+                                  taille_bloc)
+
+    def ecrire(self, path: Path) -> None:
+        debuts = array("I", self.debuts)
+        if sys.byteorder == "big":
+            debuts.byteswap()
+        # fichier temporaire propre à cet appel, dans le même dossier : deux
+        # processus qui écrivent le même .dict ne se gênent pas
+        with tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name, suffix=".tmp",
+                                         delete=False) as f:
+            f.write(EN_TETE.pack(MAGIQUE, self.nb_termes, self.taille_bloc, len(self.debuts)))
+            f.write(debuts.tobytes())
+            f.write(self.donnees)
+        os.chmod(f.name, 0o644)  # NamedTemporaryFile crée le fichier en 0600
+        os.replace(f.name, path)
+
+    @classmethod
+    def charger(cls, path: Path) -> "DictionnaireTermes":
+        """Projette le fichier .dict en mémoire ; les blocs sont décodés à la demande."""
+        with path.open("rb") as f:
+            projection = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magique, nb_termes, taille_bloc, nb_blocs = EN_TETE.unpack_from(projection, 0)
+        if magique != MAGIQUE:
+            projection.close()
+            raise ValueError(f"{path} n'est pas un dictionnaire de termes")
+        vue = memoryview(projection)
+        fin_debuts = EN_TETE.size + 4 * nb_blocs
+        if sys.byteorder == "little":
+            debuts = vue[EN_TETE.size:fin_debuts].cast("I")
+        else:
+            debuts = array("I", vue[EN_TETE.size:fin_debuts].tobytes())
+            debuts.byteswap()
+        dico = cls(vue[fin_debuts:], debuts, nb_termes, taille_bloc)
+        dico._projection = (projection, vue)
+        return dico
+
+    def fermer(self) -> None:
+        if self._projection is not None:
+            projection, vue = self._projection
+            if isinstance(self.debuts, memoryview):
+                self.debuts.release()
+            self.donnees.release()
+            vue.release()
+            projection.close()
+            self._projection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.fermer()
+
+    def octets(self) -> int:
+        """Place occupée par les termes (tampon + débuts de bloc)."""
+        return len(self.donnees) + 4 * len(self.debuts)
+
+    # -- décodage ----------------------------------------------------------
+
+    def _tete(self, bloc: int) -> bytes:
+        longueur, pos = _lire_varint(self.donnees, self.debuts[bloc])
+        return bytes(self.donnees[pos:pos + longueur])
+
+    def _bloc(self, bloc: int, jusqua: bytes | None = None) -> list:
+        """
+        Termes (en octets) du bloc, décodés ; si `jusqua` est donné, le décodage
+        s'arrête au premier terme >= jusqua (dernier élément de la liste).
+        """
+        donnees = self.donnees
+        debut = self.debuts[bloc]
+        fin = self.debuts[bloc + 1] if bloc + 1 < len(self.debuts) else len(donnees)
+        brut = bytes(donnees[debut:fin])
+        longueur, pos = _lire_varint(brut, 0)
+        courant = brut[pos:pos + longueur]
+        pos += longueur
+        termes = [courant]
+        n = len(brut)
+        while pos < n and (jusqua is None or courant < jusqua):
+            # longueurs < 128 (cas courant) : varint d'un seul octet
+            commun = brut[pos]
+            if commun < 0x80:
+                pos += 1
+            else:
+                commun, pos = _lire_varint(brut, pos)
+            longueur = brut[pos]
+            if longueur < 0x80:
+                pos += 1
+            else:
+                longueur, pos = _lire_varint(brut, pos)
+            courant = courant[:commun] + brut[pos:pos + longueur]
+            pos += longueur
+            termes.append(courant)
+        return termes
+
+    def _localiser(self, cle: bytes) -> tuple:
+        """
+        (bloc, termes du bloc jusqu'au premier >= cle) pour le dernier bloc dont
+        la tête est <= cle ; (-1, []) si cle précède le premier terme.
+        """
+        if self._tetes is None:
+            # têtes de bloc gardées décodées : la dichotomie se fait alors par bisect
+            self._tetes = [self._tete(b) for b in range(len(self.debuts))]
+        bloc = bisect_right(self._tetes, cle) - 1
+        return bloc, (self._bloc(bloc, cle) if bloc >= 0 else [])
+
+    def _rang(self, cle: bytes) -> int:
+        """Rang (à partir de 0) du premier terme >= cle."""
+        bloc, termes = self._localiser(cle)
+        if bloc < 0:
+            return 0
+        return bloc * self.taille_bloc + bisect_left(termes, cle)
+
+    # -- interface ---------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self.nb_termes
+
+    def get(self, mot: str, defaut=None):
+        """idTerme de `mot` (à partir de 1), ou `defaut`."""
+        cle = mot.encode("utf-8")
+        bloc, termes = self._localiser(cle)
+        if termes and termes[-1] == cle:
+            return bloc * self.taille_bloc + len(termes)
+        return defaut
+
+    def __getitem__(self, mot: str) -> int:
+        term_id = self.get(mot)
+        if term_id is None:
+            raise KeyError(mot)
+        return term_id
+
+    def __contains__(self, mot) -> bool:
+        return isinstance(mot, str) and self.get(mot) is not None
+
+    def mot(self, term_id: int) -> str:
+        """Terme d'idTerme `term_id` (à partir de 1)."""
+        if not 1 <= term_id <= self.nb_termes:
+            raise IndexError(term_id)
+        bloc, i = divmod(term_id - 1, self.taille_bloc)
+        return self._bloc(bloc)[i].decode("utf-8")
+
+    def depuis(self, rang: int = 0):
+        """Générateur (idTerme, mot) à partir du rang `rang` (à partir de 0)."""
+        bloc, i = divmod(rang, self.taille_bloc)
+        for bloc in range(bloc, len(self.debuts)):
+            termes = self._bloc(bloc)
+            for j in range(i, len(termes)):
+                yield bloc * self.taille_bloc + j + 1, termes[j].decode("utf-8")
+            i = 0
+
+    def __iter__(self):
+        for _, mot in self.depuis(0):
+            yield mot
+
+    def items(self):
+        """(idTerme, mot) dans l'ordre des idTermes."""
+        return self.depuis(0)
+
+    def plage_prefixe(self, prefixe: str) -> range:
+        """idTermes des termes qui commencent par `prefixe` (plage contiguë, éventuellement vide)."""
+        cle = prefixe.encode("utf-8")
+        debut = self._rang(cle)
+        suivant = _successeur(cle)
+        fin = self._rang(suivant) if suivant is not None else self.nb_termes
+        return range(debut + 1, fin + 1)
+
+    def prefixe(self, prefixe: str):
+        """Générateur (idTerme, mot) des termes qui commencent par `prefixe`."""
+        plage = self.plage_prefixe(prefixe)
+        if plage:
+            for term_id, mot in self.depuis(plage.start - 1):
+                if term_id >= plage.stop:
+                    break
+                yield term_id, mot
+
+
+def ecrire_dictionnaire(path_vocab: Path, mots) -> None:
+    """Écrit le fichier .dict voisin de vocabulaire.txt, à partir des mots triés."""
+    DictionnaireTermes.construire(mots).ecrire(path_vocab.with_suffix(".dict"))
+
+
+def ouvrir_dictionnaire(path_vocab: Path) -> DictionnaireTermes:
+    """
+    Dictionnaire des termes de vocabulaire.txt, lu depuis le fichier voisin
+    .dict (projeté en mémoire). Si celui-ci manque ou est plus ancien que
+    vocabulaire.txt, le dictionnaire est construit en mémoire, sans rien
+    écrire : le .dict n'est écrit que par les scripts qui produisent
+    vocabulaire.txt, jamais par plusieurs lecteurs à la fois.
+    """
+    path_dict = path_vocab.with_suffix(".dict")
+    if (not path_dict.is_file()
+            or path_dict.stat().st_mtime < path_vocab.stat().st_mtime):
+        return DictionnaireTermes.depuis_vocabulaire(path_vocab)
+    return DictionnaireTermes.charger(path_dict)
+
+
+def developper_joker(termes: DictionnaireTermes, mot: str) -> list:
+    """
+    Termes désignés par un mot de requête : `algo*` donne tous les termes du
+    vocabulaire qui commencent par "algo", un mot sans joker se donne lui-même
+    s'il est dans le vocabulaire. Renvoie une liste de (idTerme, mot).
+    """
+    if mot.endswith("*"):
+        prefixe = mot.rstrip("*")
+        return list(termes.prefixe(prefixe)) if prefixe else []
+    term_id = termes.get(mot)
+    return [(term_id, mot)] if term_id is not None else []
@@ -0,0 +1,61 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: echeance.py
+Objectif du programme:
+    Borner le temps d'une requête : les moteurs vérifient régulièrement
+    une échéance, renvoient le meilleur top-k trouvé jusque-là si elle est
+    dépassée, et ce module compte combien de requêtes ont été interrompues.
+"""
+
+import time
+
+# Compteurs partagés par les moteurs d'un même processus
+STATISTIQUES = {"requetes": 0, "depassements": 0}
+
+
+class Echeance:
+    """
+    Échéance coopérative d'une requête.
+
+    - budget_ms : temps maximal en millisecondes (None = pas de limite),
+    - pas : l'horloge n'est lue qu'une fois tous les `pas` appels à verifier(),
+      pour que le contrôle reste négligeable dans les boucles serrées.
+    """
+
+    def __init__(self, budget_ms: float | None, pas: int = 64):
+        self.budget_ms = budget_ms
+        self.pas = pas
+        self.debut = time.perf_counter()
+        self.limite = None if budget_ms is None else self.debut + budget_ms / 1000
+        self.appels = 0
+        self.depassee = False
+
+    def verifier(self) -> bool:
+        """Renvoie True dès que l'échéance est dépassée (et le reste ensuite)."""
+        if self.limite is None or self.depassee:
+            return self.depassee
+        self.appels += 1
+        if self.appels % self.pas == 0 and time.perf_counter() >= self.limite:
+            self.depassee = True
+        return self.depassee
+
+    def verifier_maintenant(self) -> bool:
+        """Comme verifier(), mais lit l'horloge à chaque appel (boucles à gros grain)."""
+        if self.limite is not None and not self.depassee:
+            self.depassee = time.perf_counter() >= self.limite
+        return self.depassee
+
+
+def enregistrer(partiel: bool) -> None:
+    """Comptabilise une requête terminée, interrompue ou non."""
+    STATISTIQUES["requetes"] += 1
+    if partiel:
+        STATISTIQUES["depassements"] += 1
+
+
+def resume_statistiques() -> str:
+    """Ligne de synthèse : nombre et taux de requêtes interrompues."""
+    n = STATISTIQUES["requetes"]
+    d = STATISTIQUES["depassements"]
+    taux = 100.0 * d / n if n else 0.0
+    return f"Échéances dépassées : {d} / {n} requête(s) ({taux:.1f} %)"
@@ -0,0 +1,71 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: evaluation.py
+Objectif du programme:
+    Mesures de qualité des classements, par rapport aux jugements de
+    pertinence (qrels.text) : MAP, nDCG@k et P@k, moyennées sur les requêtes
+    qui ont au moins un document pertinent.
+
+Chaque classement est d'abord réduit à son vecteur de pertinence (0/1 par
+rang) et à ses cumuls (itertools.accumulate) : toutes les mesures se lisent
+ensuite dans ces tableaux, sans reparcourir les listes de documents. Les
+remises 1 / log2(rang + 1) et leurs cumuls (nDCG idéal) sont calculés une
+seule fois pour toutes les requêtes.
+"""
+
+from itertools import accumulate
+import math
+
+K_DEFAUT = 10
+
+
+def remises(profondeur: int) -> tuple:
+    """(remises 1/log2(i + 2) pour i = 0..profondeur-1, cumuls de ces remises)."""
+    table = [1.0 / math.log2(i + 2) for i in range(profondeur)]
+    return table, list(accumulate(table))
+
+
+def vecteur_pertinence(classement: list, pertinents: set) -> list:
+    """1 au rang d'un document pertinent, 0 sinon."""
+    return [1 if nom_doc in pertinents else 0 for nom_doc in classement]
+
+
+def mesures_requete(pertinence: list, nb_pertinents: int, table: list, cumul_table: list,
+                    k: int = K_DEFAUT) -> tuple:
+    """(AP, nDCG@k, P@k) d'une requête, à partir de son vecteur de pertinence."""
+    cumuls = list(accumulate(pertinence))
+    ap = sum(c / rang for rang, (p, c) in enumerate(zip(pertinence, cumuls), start=1) if p)
+    ap /= nb_pertinents
+    p_k = (cumuls[min(k, len(cumuls)) - 1] if cumuls else 0) / k
+    dcg = sum(r for p, r in zip(pertinence[:k], table) if p)
+    ndcg = dcg / cumul_table[min(nb_pertinents, k) - 1]
+    return ap, ndcg, p_k
+
+
+def evaluer(classements: dict, jugements: dict, k: int = K_DEFAUT) -> dict:
+    """
+    classements : {idRequête: [nom_doc, ...]} dans l'ordre du classement ;
+    jugements : {idRequête: ensemble des documents pertinents} (ri.requetes_cacm.lire_qrels).
+    Renvoie {"map", f"ndcg_{k}", f"p_{k}", "requetes"} ; une requête jugée mais
+    absente de `classements` compte pour 0.
+    """
+    ids = sorted(q for q, pertinents in jugements.items() if pertinents)
+    if not ids:
+        return {"map": 0.0, f"ndcg_{k}": 0.0, f"p_{k}": 0.0, "requetes": 0}
+    table, cumul_table = remises(k)
+
+    somme_ap = somme_ndcg = somme_p = 0.0
+    for q in ids:
+        pertinence = vecteur_pertinence(classements.get(q, []), jugements[q])
+        ap, ndcg, p_k = mesures_requete(pertinence, len(jugements[q]), table, cumul_table, k)
+        somme_ap += ap
+        somme_ndcg += ndcg
+        somme_p += p_k
+
+    n = len(ids)
+    return {
+        "map": round(somme_ap / n, 4),
+        f"ndcg_{k}": round(somme_ndcg / n, 4),
+        f"p_{k}": round(somme_p / n, 4),
+        "requetes": n,
+    }
@@ -0,0 +1,243 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: expansion.py
+Objectif du programme:
+    Développer un mot de requête en termes du vocabulaire, sans parcourir tout
+    le vocabulaire à chaque requête :
+    - jokers `algo*`       : plage de préfixe du dictionnaire des termes ;
+    - jokers `*tion`, `a*ithm?` : index de k-grammes (k = 3, bornes marquées
+      par `$`) ; les termes qui contiennent tous les k-grammes du motif sont
+      ensuite vérifiés avec fnmatch ;
+    - mots proches `mot~`, `mot~1` : arbre BK (Burkhard-Keller) sur la distance
+      de Levenshtein, qui n'examine qu'une petite partie du vocabulaire ;
+    - un mot absent du vocabulaire (faute de frappe) est remplacé par les
+      termes les plus proches (distance 1, sinon 2).
+    Chaque terme obtenu reçoit un facteur (1 pour un joker ou un mot exact,
+    POIDS_DISTANCE[d] pour un terme à distance d) qui multiplie son tf dans le
+    vecteur de la requête.
+    L'index de k-grammes et l'arbre BK sont construits au premier usage.
+"""
+
+from array import array
+from fnmatch import fnmatchcase
+
+K = 3
+DISTANCE_MAX = 2
+# facteur appliqué au tf d'un terme trouvé à distance d du mot de la requête
+POIDS_DISTANCE = {0: 1.0, 1: 0.5, 2: 0.25}
+JOKERS = "*?"
+
+
+def distance_levenshtein(a: str, b: str, maximum: int | None = None) -> int:
+    """
+    Distance d'édition (insertion, suppression, substitution) entre a et b,
+    par l'algorithme bit-parallèle de Myers (une colonne de la table de
+    programmation dynamique tient dans un entier : une boucle par caractère
+    de `a` au lieu d'une par case). Avec `maximum`, renvoie maximum + 1 dès que
+    la différence de longueur suffit à dépasser ce maximum.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if maximum is not None and len(a) - len(b) > maximum:
+        return maximum + 1
+    m = len(b)
+    if m == 0:
+        return len(a)
+    # bits des positions de chaque caractère dans b
+    positions = {}
+    for i, c in enumerate(b):
+        positions[c] = positions.get(c, 0) | (1 << i)
+    masque = (1 << m) - 1
+    haut = 1 << (m - 1)
+    pv, mv, score = masque, 0, m
+    for c in a:
+        eq = positions.get(c, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & haut:
+            score += 1
+        elif mh & haut:
+            score -= 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & masque
+        mv = ph & xv
+    return score
+
+
+def kgrammes(mot: str, k: int = K) -> set:
+    """k-grammes de `$mot$` (les `$` marquent le début et la fin du terme)."""
+    borne = f"${mot}$"
+    return {borne[i:i + k] for i in range(len(borne) - k + 1)}
+
+
+class IndexKGrammes:
+    """k-gramme -> idTermes (croissants) des termes qui le contiennent."""
+
+    def __init__(self, termes, k: int = K):
+        self.termes = termes
+        self.k = k
+        self.postings = {}
+        for term_id, mot in termes.items():
+            for g in kgrammes(mot, k):
+                liste = self.postings.get(g)
+                if liste is None:
+                    liste = self.postings[g] = array("I")
+                liste.append(term_id)
+
+    def kgrammes_motif(self, motif: str) -> set:
+        """k-grammes imposés par un motif à jokers (morceaux sans joker, bornes comprises)."""
+        borne = f"${motif}$"
+        morceaux = borne.replace("?", "*").split("*")
+        return {m[i:i + self.k] for m in morceaux for i in range(len(m) - self.k + 1)}
+
+    def chercher(self, motif: str) -> list:
+        """(idTerme, mot) des termes qui correspondent au motif (`*` et `?`)."""
+        grammes = self.kgrammes_motif(motif)
+        if grammes:
+            listes = sorted((self.postings.get(g, array("I")) for g in grammes), key=len)
+            candidats = set(listes[0])
+            for liste in listes[1:]:
+                if not candidats:
+                    break
+                candidats.intersection_update(liste)
+            candidats = sorted(candidats)
+        else:
+            # motif trop court pour donner un k-gramme (ex. `a*`, `*`) : tout le vocabulaire
+            candidats = range(1, len(self.termes) + 1)
+        resultat = []
+        for term_id in candidats:
+            mot = self.termes.mot(term_id)
+            if fnmatchcase(mot, motif):
+                resultat.append((term_id, mot))
+        return resultat
+
+
+class ArbreBK:
+    """
+    Arbre BK : chaque nœud est un terme, ses enfants sont rangés selon leur
+    distance à ce terme. Grâce à l'inégalité triangulaire, une recherche à
+    distance <= d ne descend que dans les enfants d'étiquette [dist - d, dist + d].
+    """
+
+    def __init__(self, termes):
+        self.mots = []
+        self.ids = array("I")
+        self.enfants = []  # par nœud : None ou dict {distance: nœud}
+        for term_id, mot in termes.items():
+            self.ajouter(term_id, mot)
+
+    def ajouter(self, term_id: int, mot: str) -> None:
+        nouveau = len(self.mots)
+        self.mots.append(mot)
+        self.ids.append(term_id)
+        self.enfants.append(None)
+        if nouveau == 0:
+            return
+        noeud = 0
+        while True:
+            d = distance_levenshtein(mot, self.mots[noeud])
+            if d == 0:
+                return
+            enfants = self.enfants[noeud]
+            if enfants is None:
+                enfants = self.enfants[noeud] = {}
+            suivant = enfants.get(d)
+            if suivant is None:
+                enfants[d] = nouveau
+                return
+            noeud = suivant
+
+    def chercher(self, mot: str, distance_max: int) -> list:
+        """[(distance, idTerme, terme)] des termes à distance <= distance_max, triés."""
+        if not self.mots:
+            return []
+        resultat = []
+        a_voir = [0]
+        while a_voir:
+            noeud = a_voir.pop()
+            d = distance_levenshtein(mot, self.mots[noeud])
+            if d <= distance_max:
+                resultat.append((d, self.ids[noeud], self.mots[noeud]))
+            enfants = self.enfants[noeud]
+            if enfants:
+                for etiquette, enfant in enfants.items():
+                    if d - distance_max <= etiquette <= d + distance_max:
+                        a_voir.append(enfant)
+        resultat.sort()
+        return resultat
+
+
+class ExpansionTermes:
+    """
+    Développement des mots de requête sur un dictionnaire des termes (ri.dictionnaire).
+
+        expansion = ExpansionTermes(termes)
+        expansion.developper("algo*")      -> [(idTerme, mot, 1.0), ...]
+        expansion.developper("algoritm")   -> [(897, "algorithm", 0.5)]
+        expansion.developper("sort~1")     -> sort (1.0), short, port, ... (0.5)
+    """
+
+    def __init__(self, termes, k: int = K, corriger: bool = True):
+        self.termes = termes
+        self.k = k
+        self.corriger = corriger
+        self._kgrammes = None
+        self._arbre = None
+
+    @property
+    def kgrammes(self) -> IndexKGrammes:
+        if self._kgrammes is None:
+            self._kgrammes = IndexKGrammes(self.termes, self.k)
+        return self._kgrammes
+
+    @property
+    def arbre(self) -> ArbreBK:
+        if self._arbre is None:
+            self._arbre = ArbreBK(self.termes)
+        return self._arbre
+
+    def jokers(self, motif: str) -> list:
+        """(idTerme, mot) des termes qui correspondent au motif à jokers."""
+        prefixe = motif.rstrip("*")
+        if prefixe and not any(c in prefixe for c in JOKERS):
+            # `algo*` : plage contiguë du dictionnaire, sans k-grammes
+            return list(self.termes.prefixe(prefixe))
+        return self.kgrammes.chercher(motif)
+
+    def proches(self, mot: str, distance_max: int = DISTANCE_MAX) -> list:
+        """[(distance, idTerme, terme)] des termes à distance d'édition <= distance_max."""
+        return self.arbre.chercher(mot, distance_max)
+
+    def developper(self, mot: str) -> list:
+        """
+        [(idTerme, terme, facteur)] pour un mot de requête (liste vide si rien
+        ne correspond). Un motif sans aucune lettre (`*`, `?`, `~`, `~1`) ne
+        désigne rien : il développerait une grande partie du vocabulaire.
+        """
+        if "~" in mot:
+            base, _, suffixe = mot.partition("~")
+            if not base.strip(JOKERS):
+                return []
+            distance_max = int(suffixe) if suffixe.isdigit() else DISTANCE_MAX
+            return [(term_id, terme, POIDS_DISTANCE.get(d, 0.0))
+                    for d, term_id, terme in self.proches(base, min(distance_max, DISTANCE_MAX))]
+        if any(c in mot for c in JOKERS):
+            if not mot.strip(JOKERS):
+                return []
+            return [(term_id, terme, 1.0) for term_id, terme in self.jokers(mot)]
+        term_id = self.termes.get(mot)
+        if term_id is not None:
+            return [(term_id, mot, 1.0)]
+        if not self.corriger:
+            return []
+        # mot inconnu : termes les plus proches seulement (distance 1, sinon 2 ;
+        # 1 seulement pour les mots courts, où 2 modifications changent tout le mot)
+        distance_max = 1 if len(mot) <= 4 else DISTANCE_MAX
+        proches = self.proches(mot, distance_max)
+        if not proches:
+            return []
+        d_min = proches[0][0]
+        return [(term_id, terme, POIDS_DISTANCE[d]) for d, term_id, terme in proches if d == d_min]
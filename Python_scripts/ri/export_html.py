@@ -0,0 +1,108 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: export_html.py
+Objectif du programme:
+    Génération des collections HTML consultables (clean_v2.py : .flt ->
+    Collection1.html, remove_v2.py : .stp -> Collection2.html).
+    La lecture des fichiers et l'échappement HTML des articles se font par
+    paquets, éventuellement dans plusieurs processus (ri.parallele) ; les
+    articles sont écrits dans l'ordre de Collection/Collection, au fur et à
+    mesure que les paquets sont prêts.
+    Avec `docs_par_fichier`, la collection est découpée en plusieurs pages
+    (Collection1/Collection1-001.html, ...) accompagnées d'une page d'index
+    (Collection1/index.html) qui donne le premier et le dernier document de
+    chacune.
+"""
+
+from pathlib import Path
+import html
+
+from ri.parallele import map_ordonne
+
+TAILLE_PAQUET = 128
+
+
+def rendre_document(tache: tuple) -> tuple:
+    """(doc_id, chemin) -> (doc_id, bloc <article> ou None si le fichier manque)."""
+    doc_id, text_path = tache
+    path = Path(text_path)
+    if not path.exists():
+        return doc_id, None
+    # Ajout du numéro du document au début, dans un <article> avec classe cacm
+    texte = html.escape(path.read_text(encoding="utf-8"))
+    return doc_id, f"<article class=\"cacm\" id=\"{doc_id}\">\n[{doc_id}] {texte}\n</article>\n\n"
+
+
+def debut_page(titre: str) -> str:
+    return ("<!DOCTYPE html>\n"
+            "<html>\n<head>\n<meta charset=\"utf-8\">\n"
+            f"<title>{titre}</title>\n</head>\n<body>\n")
+
+
+FIN_PAGE = "</body>\n</html>\n"
+
+
+def articles(doc_ids, base_dir: Path, extension: str, nb_processus: int = 1,
+             taille_paquet: int = TAILLE_PAQUET):
+    """Générateur (doc_id, bloc <article>) dans l'ordre de doc_ids ; les fichiers manquants sont signalés."""
+    taches = ((doc_id, str(base_dir / f"{doc_id}{extension}"))
+              for doc_id in doc_ids
+              # seulement les fichiers texte et non les fichiers HTML
+              if doc_id.startswith("CACM"))
+    for doc_id, bloc in map_ordonne(rendre_document, taches, nb_processus, taille_paquet):
+        if bloc is None:
+            print(f"ATTENTION : fichier manquant {base_dir / f'{doc_id}{extension}'}, ignoré.")
+            continue
+        yield doc_id, bloc
+
+
+def exporter_collection(doc_ids, base_dir: Path, extension: str, output_file: Path, titre: str,
+                        nb_processus: int = 1, docs_par_fichier: int | None = None) -> list:
+    """
+    Écrit la collection HTML. Renvoie la liste des fichiers écrits
+    (output_file seul, ou les pages puis l'index si docs_par_fichier est donné).
+    """
+    if docs_par_fichier is not None and docs_par_fichier <= 0:
+        raise ValueError(f"docs_par_fichier doit être strictement positif : {docs_par_fichier}")
+    flux_articles = articles(doc_ids, base_dir, extension, nb_processus)
+
+    if docs_par_fichier is None:
+        with output_file.open("w", encoding="utf-8") as out:
+            out.write(debut_page(titre))
+            for _, bloc in flux_articles:
+                out.write(bloc)
+            out.write(FIN_PAGE)
+        return [output_file]
+
+    dossier = output_file.with_suffix("")
+    dossier.mkdir(parents=True, exist_ok=True)
+    for ancien in dossier.glob(f"{output_file.stem}-*.html"):
+        ancien.unlink()
+
+    pages = []  # (fichier, premier doc, dernier doc, nombre)
+    out = None
+    for doc_id, bloc in flux_articles:
+        if out is None or pages[-1][3] == docs_par_fichier:
+            if out is not None:
+                out.write(FIN_PAGE)
+                out.close()
+            path = dossier / f"{output_file.stem}-{len(pages) + 1:03d}.html"
+            out = path.open("w", encoding="utf-8")
+            out.write(debut_page(f"{titre} ({len(pages) + 1})"))
+            pages.append([path, doc_id, doc_id, 0])
+        out.write(bloc)
+        pages[-1][2] = doc_id
+        pages[-1][3] += 1
+    if out is not None:
+        out.write(FIN_PAGE)
+        out.close()
+
+    index = dossier / "index.html"
+    with index.open("w", encoding="utf-8") as f:
+        f.write(debut_page(titre))
+        f.write(f"<h1>{html.escape(titre)}</h1>\n<ul>\n")
+        for path, premier, dernier, nombre in pages:
+            f.write(f"<li><a href=\"{path.name}\">{premier} … {dernier}</a> ({nombre} documents)</li>\n")
+        f.write("</ul>\n")
+        f.write(FIN_PAGE)
+    return [p[0] for p in pages] + [index]
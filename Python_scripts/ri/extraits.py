@@ -0,0 +1,158 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: extraits.py
+Objectif du programme:
+    Extraits des documents trouvés, choisis en fonction de la requête, avec
+    les termes de la requête mis en évidence (page HTML des résultats et
+    affichage dans le terminal).
+    La fenêtre retenue est celle qui contient le plus de termes distincts de
+    la requête, puis la plus grande somme des proximités floues (même
+    fonction triangulaire que moteur_proximite.py).
+    Le texte n'est lu que pour les documents affichés (top-k) : le coût des
+    extraits ne dépend pas de la taille de la collection.
+
+Les extraits sont pris dans la représentation .flt (texte nettoyé, mots
+vides conservés), plus lisible que .stp. Les mots de la requête peuvent être
+des mots vides ou des opérateurs ("and") : seuls les termes que le modèle a
+pu noter, c'est-à-dire présents dans l'index (argument `termes_indexes` de
+termes_requete), sont mis en évidence.
+"""
+
+from pathlib import Path
+from typing import NamedTuple
+import html
+
+from ri.collection_compacte import SourceDocuments
+from ri.dictionnaire import developper_joker
+
+LONGUEUR_EXTRAIT = 24  # mots
+K_EXTRAIT = 5          # largeur de la zone d'influence d'une occurrence
+
+
+def termes_requete(query: str, termes=None, expansion=None, termes_indexes=None) -> set:
+    """
+    Ensemble des termes désignés par la requête : développés par `expansion`
+    (ri.expansion) si elle est donnée, sinon jokers `algo*` du dictionnaire
+    `termes`, sinon mots pris tels quels.
+    termes_indexes : si donné (clés d'un index, df, ...), seuls les termes
+    qui y figurent sont gardés ; le vocabulaire, construit sur les .flt,
+    contient encore les mots vides.
+    """
+    resultat = set()
+    for mot in query.lower().split():
+        if expansion is not None:
+            resultat.update(terme for _, terme, _ in expansion.developper(mot))
+        elif termes is not None:
+            resultat.update(terme for _, terme in developper_joker(termes, mot))
+        else:
+            resultat.add(mot)
+    if termes_indexes is not None:
+        resultat = {terme for terme in resultat if terme in termes_indexes}
+    return resultat
+
+
+def proximites(tokens, termes_q, k: int) -> list:
+    """
+    Proximité floue p(x) à chaque position : chaque occurrence d'un terme de
+    la requête diffuse une influence triangulaire (k - |delta|) / k sur les
+    positions à moins de k, et on garde le maximum.
+    """
+    L = len(tokens)
+    prox = [0.0] * L
+    for pos, mot in enumerate(tokens):
+        if mot not in termes_q:
+            continue
+        start = max(0, pos - (k - 1))
+        end = min(L, pos + k)
+        for x in range(start, end):
+            val = (k - abs(x - pos)) / k
+            if val > prox[x]:
+                prox[x] = val
+    return prox
+
+
+def meilleure_fenetre(tokens, termes_q, longueur: int = LONGUEUR_EXTRAIT,
+                      k: int = K_EXTRAIT) -> int:
+    """
+    Début de la fenêtre de `longueur` mots qui contient le plus de termes
+    distincts de la requête ; à égalité, la plus grande somme des proximités,
+    puis la plus à gauche.
+    """
+    L = len(tokens)
+    if L <= longueur:
+        return 0
+    prox = proximites(tokens, termes_q, k)
+
+    # fenêtre glissante : occurrences par terme et somme des proximités
+    compte = {}
+    somme = 0.0
+    for x in range(longueur):
+        somme += prox[x]
+        if tokens[x] in termes_q:
+            compte[tokens[x]] = compte.get(tokens[x], 0) + 1
+    meilleur = (len(compte), somme)
+    debut = 0
+
+    for fin in range(longueur, L):
+        entre, sort = tokens[fin], tokens[fin - longueur]
+        somme += prox[fin] - prox[fin - longueur]
+        if entre in termes_q:
+            compte[entre] = compte.get(entre, 0) + 1
+        if sort in termes_q:
+            compte[sort] -= 1
+            if compte[sort] == 0:
+                del compte[sort]
+        cle = (len(compte), somme)
+        # petite marge : la somme glissante accumule des erreurs d'arrondi
+        if cle[0] > meilleur[0] or (cle[0] == meilleur[0] and cle[1] > meilleur[1] + 1e-9):
+            meilleur = cle
+            debut = fin - longueur + 1
+    return debut
+
+
+class Extrait(NamedTuple):
+    mots: list        # mots de la fenêtre
+    surlignes: list   # True pour les termes de la requête
+    coupe_debut: bool
+    coupe_fin: bool
+
+    def html(self) -> str:
+        morceaux = [f"<mark>{html.escape(m)}</mark>" if s else html.escape(m)
+                    for m, s in zip(self.mots, self.surlignes)]
+        return self._entourer(" ".join(morceaux))
+
+    def console(self, couleur: bool = False) -> str:
+        """Termes en gras (séquences ANSI) si `couleur`, sinon entre astérisques."""
+        avant, apres = ("\033[1m", "\033[0m") if couleur else ("*", "*")
+        morceaux = [f"{avant}{m}{apres}" if s else m
+                    for m, s in zip(self.mots, self.surlignes)]
+        return self._entourer(" ".join(morceaux))
+
+    def _entourer(self, texte: str) -> str:
+        return ("… " if self.coupe_debut else "") + texte + (" …" if self.coupe_fin else "")
+
+
+def extrait(tokens, termes_q, longueur: int = LONGUEUR_EXTRAIT, k: int = K_EXTRAIT) -> Extrait:
+    debut = meilleure_fenetre(tokens, termes_q, longueur, k)
+    mots = tokens[debut:debut + longueur]
+    return Extrait(mots, [m in termes_q for m in mots],
+                   debut > 0, debut + len(mots) < len(tokens))
+
+
+def calculer_extraits(source: SourceDocuments, noms_docs, termes_q,
+                      longueur: int = LONGUEUR_EXTRAIT, k: int = K_EXTRAIT) -> dict:
+    """
+    {nom_doc: Extrait} pour les documents donnés (les résultats affichés) ;
+    seuls ces documents sont lus. Un document illisible n'a pas d'extrait.
+    """
+    extraits = {}
+    for nom_doc in noms_docs:
+        tokens = source.lire_tokens(nom_doc)
+        if tokens:
+            extraits[nom_doc] = extrait(tokens, termes_q, longueur, k)
+    return extraits
+
+
+def source_extraits(collection_dir: Path) -> SourceDocuments:
+    """Textes .flt de la collection (collection compacte ou magasin compressé s'ils existent)."""
+    return SourceDocuments(collection_dir, "flt")
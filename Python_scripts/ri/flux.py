@@ -0,0 +1,339 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: flux.py
+Objectif du programme:
+    Chaîne de préparation de la collection CACM sous forme de générateurs :
+    lecture des enregistrements de cacm.all, nettoyage (comme clean.pl),
+    suppression des mots vides (comme remove.pl), puis distribution de chaque
+    document à des « consommateurs » (vocabulaire, df, compteur, index,
+    vecteurs, fichiers de la collection) en un seul passage.
+    Le consommateur Racinisation transmet une version racinisée de chaque
+    document à ses propres consommateurs : les index avec et sans
+    racinisation sont construits dans le même passage.
+    Aucun fichier intermédiaire n'est écrit, sauf si un consommateur le demande.
+"""
+
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple
+import math
+import re
+
+from ri.dictionnaire import ecrire_dictionnaire
+from ri.vecteurs import EcrivainVecteurs
+
+# Lignes de balise reconnues par DecodeCACMXX.pl
+MARQUEURS = {".W", ".B", ".N", ".A", ".X", ".K", ".T", ".I"}
+# Sections dont le texte est conservé (titre, source, auteurs, résumé)
+SECTIONS_TEXTE = (".T", ".A", ".W", ".B")
+
+# Équivalents Python des expressions de clean.pl
+ACCENTS = str.maketrans("àâäéèêëîïù", "aaaeeeeiiu")
+MOTIF_PONCTUATION = re.compile(r"[\",=/.?'()_$%+\[\]{}&;:~!@#^*|<>\-]|\\s|\\")
+MOTIF_BLANCS = re.compile(r"\s+")
+
+
+class Document(NamedTuple):
+    """Un document à la sortie de la chaîne."""
+    doc_id: str         # "CACM-123"
+    texte: str          # texte brut (équivalent du fichier CACM-123)
+    mots: list          # mots nettoyés (équivalent du .flt)
+    tokens: list        # mots sans mots vides (équivalent du .stp)
+
+
+# ----------------------------------------------------------------------
+# Étapes de la chaîne
+# ----------------------------------------------------------------------
+
+def lire_enregistrements_cacm(path_cacm: Path) -> Iterator[tuple]:
+    """
+    Découpe cacm.all en enregistrements (doc_id, texte brut), en reproduisant
+    DecodeCACMXX.pl : les lignes qui suivent .T, .A, .W et .B sont conservées
+    jusqu'à la prochaine ligne de balise, chacune suivie d'une espace.
+    """
+    doc_id = None
+    morceaux = []
+
+    with path_cacm.open("r", encoding="utf-8", errors="ignore") as f:
+        lignes = (line.rstrip("\n") for line in f)
+        courante = ""
+        fin = False
+
+        while not fin:
+            if re.search(r"\.I\s", courante):
+                if doc_id is not None:
+                    yield doc_id, "".join(morceaux)
+                doc_id = "CACM-" + re.sub(r"\.I\s", "", courante)
+                morceaux = []
+
+            if any(m in courante for m in SECTIONS_TEXTE):
+                for courante in lignes:
+                    if courante in MARQUEURS:
+                        break
+                    if doc_id is not None:
+                        morceaux.append(courante + " ")
+                else:
+                    fin = True
+            else:
+                courante = next(lignes, None)
+                if courante is None:
+                    fin = True
+
+    if doc_id is not None:
+        yield doc_id, "".join(morceaux)
+
+
+def nettoyer(texte: str) -> str:
+    """Même traitement que clean.pl : accents, ponctuation, blancs, minuscules."""
+    texte = texte.replace("\n", " ").translate(ACCENTS)
+    texte = MOTIF_PONCTUATION.sub(" ", texte)
+    texte = MOTIF_BLANCS.sub(" ", texte)
+    return texte.lower()
+
+
+def charger_mots_vides(path_stop: Path) -> set:
+    """Charge la stoplist (un mot par ligne), comme remove.pl."""
+    with path_stop.open("r", encoding="utf-8") as f:
+        return {line.rstrip("\n") for line in f}
+
+
+def flux_documents(path_cacm: Path, mots_vides: set) -> Iterator[Document]:
+    """Enchaîne lecture, nettoyage et suppression des mots vides, document par document."""
+    for doc_id, texte in lire_enregistrements_cacm(path_cacm):
+        mots = nettoyer(texte).split()
+        tokens = [m for m in mots if m not in mots_vides]
+        yield Document(doc_id, texte, mots, tokens)
+
+
+def executer(documents: Iterable[Document], consommateurs: list) -> int:
+    """
+    Distribue chaque document à tous les consommateurs (un seul passage),
+    puis les termine dans l'ordre de la liste. Renvoie le nombre de documents.
+    """
+    nb_docs = 0
+    for id_doc, doc in enumerate(documents, start=1):
+        for c in consommateurs:
+            c.traiter(id_doc, doc)
+        nb_docs = id_doc
+    for c in consommateurs:
+        c.terminer(nb_docs)
+    return nb_docs
+
+
+# ----------------------------------------------------------------------
+# Consommateurs : chacun reproduit la sortie d'un script du TP
+# ----------------------------------------------------------------------
+
+class Vocabulaire:
+    """Mots distincts des textes nettoyés (vocabulary.py) -> vocabulaire.txt."""
+
+    def __init__(self, output_file: Path | None = None):
+        self.output_file = output_file
+        self.mots = set()
+        self.mot2id = {}
+
+    def traiter(self, id_doc: int, doc: Document) -> None:
+        self.mots.update(doc.mots)
+
+    def terminer(self, nb_docs: int) -> None:
+        tries = sorted(self.mots)
+        self.mot2id = {mot: i + 1 for i, mot in enumerate(tries)}
+        if self.output_file is not None:
+            with self.output_file.open("w", encoding="utf-8") as out:
+                for mot in tries:
+                    out.write(mot + "\n")
+            ecrire_dictionnaire(self.output_file, tries)
+
+
+class FrequencesDocumentaires:
+    """Fréquence documentaire des mots des .stp (df.py) -> df.txt."""
+
+    def __init__(self, output_file: Path | None = None):
+        self.output_file = output_file
+        self.df = {}
+
+    def traiter(self, id_doc: int, doc: Document) -> None:
+        for mot in set(doc.tokens):
+            self.df[mot] = self.df.get(mot, 0) + 1
+
+    def terminer(self, nb_docs: int) -> None:
+        # même exception que df.py : "cacm" provient de la ligne .B
+        self.df.pop("cacm", None)
+        if self.output_file is not None:
+            with self.output_file.open("w", encoding="utf-8") as out:
+                for mot, freq in sorted(self.df.items(), key=lambda x: (-x[1], x[0])):
+                    out.write(f"{mot} {freq}\n")
+
+
+class Compteur:
+    """Nombre total d'occurrences des mots des .stp (count.py) -> counter.txt."""
+
+    def __init__(self, output_file: Path | None = None):
+        self.output_file = output_file
+        self.counter = {}
+
+    def traiter(self, id_doc: int, doc: Document) -> None:
+        for mot in doc.tokens:
+            self.counter[mot] = self.counter.get(mot, 0) + 1
+
+    def terminer(self, nb_docs: int) -> None:
+        self.counter.pop("cacm", None)
+        if self.output_file is not None:
+            with self.output_file.open("w", encoding="utf-8") as out:
+                tries = sorted(self.counter.items(), key=lambda x: (-x[1], x[0]))
+                for rang, (mot, compte) in enumerate(tries, start=1):
+                    out.write(f"{rang} {compte} {mot}\n")
+
+
+class IndexInverse:
+    """
+    Index inversé et positionnel des .stp (indexInverse.py)
+    -> indexInverse.txt et indexPositionnel.txt.
+    Les idTermes ne sont connus qu'une fois le vocabulaire terminé :
+    ce consommateur doit donc être placé après `vocabulaire` dans la liste.
+    """
+
+    def __init__(self, vocabulaire: Vocabulaire,
+                 output_file: Path | None = None,
+                 output_pos_file: Path | None = None):
+        self.vocabulaire = vocabulaire
+        self.output_file = output_file
+        self.output_pos_file = output_pos_file
+        self.postings = {}  # mot -> [(idDoc, [positions]), ...]
+
+    def traiter(self, id_doc: int, doc: Document) -> None:
+        positions_doc = {}
+        for pos, mot in enumerate(doc.tokens):
+            positions_doc.setdefault(mot, []).append(pos)
+        for mot, positions in positions_doc.items():
+            self.postings.setdefault(mot, []).append((id_doc, positions))
+
+    def terminer(self, nb_docs: int) -> None:
+        mot2id = self.vocabulaire.mot2id
+        id2mot = sorted(mot2id, key=mot2id.get)
+
+        if self.output_file is not None:
+            with self.output_file.open("w", encoding="utf-8") as f_out:
+                for id_terme, mot in enumerate(id2mot, start=1):
+                    postings = self.postings.get(mot)
+                    if postings:
+                        docs_str = " ".join(str(d) for d, _ in postings)
+                        f_out.write(f"{id_terme} {mot} {docs_str}\n")
+                    else:
+                        f_out.write(f"{id_terme} {mot}\n")
+
+        if self.output_pos_file is not None:
+            with self.output_pos_file.open("w", encoding="utf-8") as f_out:
+                for id_terme, mot in enumerate(id2mot, start=1):
+                    postings = self.postings.get(mot)
+                    if postings:
+                        postings_str = " ".join(
+                            f"{d}:{','.join(str(p) for p in positions)}"
+                            for d, positions in postings
+                        )
+                        f_out.write(f"{id_terme} {mot} {postings_str}\n")
+                    else:
+                        f_out.write(f"{id_terme} {mot}\n")
+
+
+class Vecteurs:
+    """
+    Vecteurs binaires, TF et TF-IDF des .stp (vecteur*.py)
+    -> vecteurBinaire.txt, vecteurTF.txt, vecteurTFIDF.txt (chacun optionnel),
+    plus la version binaire CSR (.npz) de chacun si `npz` est vrai.
+    À placer après `vocabulaire` et `df` dans la liste des consommateurs.
+    """
+
+    def __init__(self, vocabulaire: Vocabulaire, df: FrequencesDocumentaires,
+                 binaire_file: Path | None = None,
+                 tf_file: Path | None = None,
+                 tfidf_file: Path | None = None,
+                 npz: bool = False):
+        self.vocabulaire = vocabulaire
+        self.df = df
+        self.binaire_file = binaire_file
+        self.tf_file = tf_file
+        self.tfidf_file = tfidf_file
+        self.npz = npz
+        self.tf_docs = []  # un dict {mot: tf} par document
+
+    def traiter(self, id_doc: int, doc: Document) -> None:
+        tf = {}
+        for mot in doc.tokens:
+            tf[mot] = tf.get(mot, 0) + 1
+        self.tf_docs.append(tf)
+
+    def terminer(self, nb_docs: int) -> None:
+        mot2id = self.vocabulaire.mot2id
+        df_mot = self.df.df
+        idf_par_id = {
+            idx: math.log(nb_docs / df_mot[mot]) if df_mot.get(mot, 0) > 0 else 0.0
+            for mot, idx in mot2id.items()
+        }
+
+        sorties = [
+            (self.binaire_file, "B", lambda ids, tfs: [1] * len(ids)),
+            (self.tf_file, "i", lambda ids, tfs: tfs),
+            (self.tfidf_file, "f", lambda ids, tfs: [tf * idf_par_id[i] for i, tf in zip(ids, tfs)]),
+        ]
+        for path, type_valeurs, valeurs in sorties:
+            if path is None:
+                continue
+            path_npz = path.with_suffix(".npz") if self.npz else None
+            with EcrivainVecteurs(path, path_npz, type_valeurs, len(mot2id)) as ecrivain:
+                for tf in self.tf_docs:
+                    couples = sorted((mot2id[mot], n) for mot, n in tf.items() if mot in mot2id)
+                    ids = [idx for idx, _ in couples]
+                    tfs = [n for _, n in couples]
+                    ecrivain.ajouter(ids, valeurs(ids, tfs))
+
+
+class Racinisation:
+    """
+    Variante racinisée de la collection : chaque document est transmis à
+    `consommateurs` avec ses mots et ses tokens remplacés par leur racine
+    (Raciniseur mémorisé de ri.racinisation : une racinisation par mot distinct).
+    """
+
+    def __init__(self, raciniseur, consommateurs: list):
+        self.raciniseur = raciniseur
+        self.consommateurs = consommateurs
+
+    def traiter(self, id_doc: int, doc: Document) -> None:
+        # les tokens sont un sous-ensemble des mots : leurs racines viennent du cache
+        doc = doc._replace(mots=self.raciniseur.tokens(doc.mots),
+                           tokens=self.raciniseur.tokens(doc.tokens))
+        for c in self.consommateurs:
+            c.traiter(id_doc, doc)
+
+    def terminer(self, nb_docs: int) -> None:
+        for c in self.consommateurs:
+            c.terminer(nb_docs)
+
+
+class EcrivainCollection:
+    """
+    Écrit la collection au format des scripts Perl : Collection/CACM-N,
+    CACM-N.flt, CACM-N.stp et la liste Collection/Collection.
+    """
+
+    def __init__(self, collection_dir: Path):
+        self.collection_dir = collection_dir
+        self.doc_ids = []
+        collection_dir.mkdir(parents=True, exist_ok=True)
+
+    def traiter(self, id_doc: int, doc: Document) -> None:
+        base = self.collection_dir / doc.doc_id
+        texte_flt = nettoyer(doc.texte)
+        # remove.pl conserve l'espace initiale éventuelle du .flt
+        prefixe = " " if texte_flt.startswith(" ") else ""
+        base.write_text(doc.texte, encoding="utf-8")
+        base.with_name(doc.doc_id + ".flt").write_text(texte_flt, encoding="utf-8")
+        base.with_name(doc.doc_id + ".stp").write_text(
+            prefixe + "".join(t + " " for t in doc.tokens), encoding="utf-8"
+        )
+        self.doc_ids.append(doc.doc_id)
+
+    def terminer(self, nb_docs: int) -> None:
+        with (self.collection_dir / "Collection").open("w", encoding="utf-8") as f:
+            for doc_id in self.doc_ids:
+                f.write(doc_id + "\n")
@@ -0,0 +1,176 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: incremental.py
+Objectif du programme:
+    Régénération incrémentale des fichiers de vecteurs (une ligne par document).
+    Les lignes sont rangées dans des fichiers segments de TAILLE_SEGMENT
+    documents, accompagnés d'un manifeste qui retient l'empreinte du texte de
+    chaque document. À l'exécution suivante, seules les lignes des documents
+    modifiés (ou signalés par `a_recalculer`) sont recalculées, et seuls les
+    segments qui les contiennent sont réécrits. Le fichier complet habituel
+    est ensuite recomposé par simple concaténation des segments.
+
+Organisation sur disque (pour outputs/vecteurTF.txt) :
+    outputs/vecteurTF.segments/manifeste.json   contexte, documents, données annexes
+    outputs/vecteurTF.segments/seg-00000.txt    lignes des documents 0 à 255, etc.
+"""
+
+from pathlib import Path
+from typing import Callable
+import hashlib
+import json
+import shutil
+
+TAILLE_SEGMENT = 256
+
+
+def empreinte_texte(texte: str) -> str:
+    return hashlib.blake2b(texte.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def empreinte_fichier(path: Path) -> str:
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+
+class SortieSegmentee:
+    """Fichier de vecteurs découpé en segments, avec son manifeste."""
+
+    def __init__(self, output_file: Path, taille_segment: int = TAILLE_SEGMENT):
+        self.output_file = output_file
+        self.dossier = output_file.with_suffix(".segments")
+        self.path_manifeste = self.dossier / "manifeste.json"
+        self.taille_segment = taille_segment
+        self.manifeste = {}
+        if self.path_manifeste.is_file():
+            with self.path_manifeste.open("r", encoding="utf-8") as f:
+                self.manifeste = json.load(f)
+        if self.manifeste.get("taille_segment") != taille_segment:
+            self.manifeste = {}
+        self._segments_lus = {}
+
+    def path_segment(self, num: int) -> Path:
+        return self.dossier / f"seg-{num:05d}.txt"
+
+    def lire_segment(self, num: int) -> list:
+        """Lignes d'un ancien segment (lues une seule fois)."""
+        if num not in self._segments_lus:
+            path = self.path_segment(num)
+            with path.open("r", encoding="utf-8") as f:
+                self._segments_lus[num] = f.read().splitlines()
+        return self._segments_lus[num]
+
+    @property
+    def annexe(self) -> dict:
+        """Données propres au script (ex. idf de référence), conservées dans le manifeste."""
+        return self.manifeste.get("annexe", {})
+
+    def regenerer(self, documents, calculer: Callable[[str], str], contexte: str,
+                  a_recalculer: Callable[[str], bool] | None = None,
+                  annexe: dict | None = None, complet: bool = False) -> dict:
+        """
+        documents    : itérable de (nom_doc, texte), dans l'ordre de sortie
+        calculer     : texte -> ligne de vecteur (sans fin de ligne)
+        contexte     : empreinte de ce dont dépendent toutes les lignes (vocabulaire...) ;
+                       s'il change, tout est recalculé
+        a_recalculer : ancienne ligne -> vrai si elle doit être recalculée même
+                       si le document n'a pas changé
+        Renvoie des statistiques {documents, recalcules, segments, segments_ecrits}.
+        """
+        anciens = {}
+        if not complet and self.manifeste.get("contexte") == contexte:
+            anciens = self.manifeste.get("documents", {})
+
+        nouveaux = {}
+        nouveaux_segments = []  # (fichier temporaire, segment) à remplacer à la fin
+        segment = []  # [(nom, ligne ou None si inchangée)]
+        num = 0
+        stats = {"documents": 0, "recalcules": 0, "segments": 0, "segments_ecrits": 0}
+        self.dossier.mkdir(parents=True, exist_ok=True)
+
+        def vider(segment, num):
+            stats["segments"] += 1
+            # segment inchangé : mêmes documents, aux mêmes places, aucune ligne recalculée
+            intact = all(
+                ligne is None and anciens[nom][1:] == [num, j]
+                for j, (nom, ligne) in enumerate(segment)
+            )
+            if intact and self.path_segment(num).is_file():
+                return
+            lignes = []
+            for nom, ligne in segment:
+                if ligne is None:
+                    _, ancien_num, ancienne_pos = anciens[nom]
+                    ligne = self.lire_segment(ancien_num)[ancienne_pos]
+                lignes.append(ligne + "\n")
+            tmp = self.path_segment(num).with_suffix(".tmp")
+            with tmp.open("w", encoding="utf-8") as f:
+                f.writelines(lignes)
+            nouveaux_segments.append((tmp, self.path_segment(num)))
+            stats["segments_ecrits"] += 1
+
+        for nom_doc, texte in documents:
+            h = empreinte_texte(texte)
+            ancien = anciens.get(nom_doc)
+            ligne = None
+            if ancien is None or ancien[0] != h:
+                ligne = calculer(texte)
+            elif a_recalculer is not None:
+                _, ancien_num, ancienne_pos = ancien
+                if a_recalculer(self.lire_segment(ancien_num)[ancienne_pos]):
+                    ligne = calculer(texte)
+            if ligne is not None:
+                stats["recalcules"] += 1
+            stats["documents"] += 1
+
+            nouveaux[nom_doc] = [h, num, len(segment)]
+            segment.append((nom_doc, ligne))
+            if len(segment) == self.taille_segment:
+                vider(segment, num)
+                segment = []
+                num += 1
+        if segment:
+            vider(segment, num)
+            num += 1
+
+        # Les anciens segments ont été lus avant d'être remplacés
+        for tmp, path in nouveaux_segments:
+            tmp.replace(path)
+        supprimes = 0
+        for path in self.dossier.glob("seg-*.txt"):
+            if int(path.stem[4:]) >= num:
+                path.unlink()
+                supprimes += 1
+
+        self.manifeste = {
+            "taille_segment": self.taille_segment,
+            "contexte": contexte,
+            "documents": nouveaux,
+            "annexe": annexe if annexe is not None else self.annexe,
+        }
+        with self.path_manifeste.open("w", encoding="utf-8") as f:
+            json.dump(self.manifeste, f)
+
+        if stats["segments_ecrits"] or supprimes or not self.output_file.is_file():
+            self.assembler(num)
+        return stats
+
+    def assembler(self, nb_segments: int) -> None:
+        """Recompose le fichier complet par concaténation des segments."""
+        tmp = self.output_file.with_suffix(".tmp")
+        with tmp.open("wb") as f_out:
+            for num in range(nb_segments):
+                with self.path_segment(num).open("rb") as f_seg:
+                    shutil.copyfileobj(f_seg, f_out)
+        tmp.replace(self.output_file)
+
+
+def documents_source(path_doc_list: Path, source):
+    """Générateur (nom_doc, texte) des documents de la liste ; les absents sont sautés."""
+    with path_doc_list.open("r", encoding="utf-8") as f:
+        for line in f:
+            nom_doc = line.strip()
+            if not nom_doc:
+                continue
+            texte = source.lire_texte(nom_doc)
+            if texte is not None:
+                yield nom_doc, texte
@@ -0,0 +1,221 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: index.py
+Objectif du programme:
+    Accès commun aux fichiers produits par l'indexation (liste des documents,
+    vocabulaire, df, vecteurs) : un objet Index charge chaque fichier à sa
+    première utilisation, une seule fois, puis le garde. Un même processus
+    peut ainsi interroger les modèles tf.idf et à proximité floue sur un seul
+    index chargé.
+
+        index = Index()
+        resultats, partiel = index.recherche_tfidf("parallel algorithm")
+        resultats, partiel = index.recherche_proximite("parallel algorithm", k=5)
+
+Les fonctions charger_* lisent un fichier à chaque appel ; elles servent aux
+scripts de construction, qui ne lisent chaque fichier qu'une fois.
+"""
+
+from pathlib import Path
+import time
+
+from ri.collection_compacte import SourceDocuments
+from ri.dictionnaire import DictionnaireTermes, ouvrir_dictionnaire
+from ri.expansion import ExpansionTermes
+from ri.extraits import K_EXTRAIT, calculer_extraits, source_extraits, termes_requete
+from ri.proximite import recherche_proximite
+from ri.tfidf import charger_vecteurs_tfidf, recherche_tfidf
+
+COLLECTION_DIR = Path("Collection")
+OUTPUTS_DIR = Path("outputs")
+
+
+def charger_liste_docs(path_doc_list: Path) -> list:
+    """
+    Retourne une liste de noms de documents (sans suffixe .stp),
+    dans l'ordre où ils apparaissent dans Collection/Collection.
+    """
+    noms_docs = []
+    with path_doc_list.open("r", encoding="utf-8") as f:
+        for line in f:
+            nom = line.strip()
+            if nom:
+                noms_docs.append(nom)
+    return noms_docs
+
+
+def charger_vocabulaire(path_vocab: Path) -> DictionnaireTermes:
+    """
+    Dictionnaire des termes (ri.dictionnaire, fichier voisin vocabulaire.dict
+    projeté en mémoire) : termes[mot] -> idTerme, termes.mot(idTerme) -> mot,
+    termes.items() dans l'ordre des idTermes, termes.prefixe("algo") pour les jokers.
+    """
+    return ouvrir_dictionnaire(path_vocab)
+
+
+def charger_ids_termes(path_vocab: Path) -> dict:
+    """
+    dict {mot: idTerme} (idTerme à partir de 1) : pour les boucles qui
+    cherchent chaque occurrence, un dict reste plus rapide que le dictionnaire
+    compact des termes.
+    """
+    mots = []
+    with path_vocab.open("r", encoding="utf-8") as f:
+        for line in f:
+            mot = line.strip()
+            if mot:
+                mots.append(mot)
+    return {mot: i + 1 for i, mot in enumerate(mots)}
+
+
+def charger_df(path_df: Path) -> dict:
+    """
+    Charge le fichier df.txt et retourne un dict {mot: df}.
+    On suppose des lignes "mot df".
+    """
+    df_mot = {}
+    with path_df.open("r", encoding="utf-8") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) != 2:
+                continue
+            mot, df_str = parts
+            try:
+                df_mot[mot] = int(df_str)
+            except ValueError:
+                continue
+    return df_mot
+
+
+class Index:
+    """
+    Fichiers d'un index (Collection/ et outputs/), chargés à la demande.
+
+    - docs, termes, df_mot : liste des documents, dictionnaire des termes, df ;
+    - vecteurs_tfidf(format_poids) : (MatriceCSR, normes), un calcul par format ;
+    - expansion : jokers, mots proches et corrections (None si exact=True, le défaut :
+      seuls les mots exacts et les jokers `algo*` comptent) ;
+    - source_docs / source_textes : textes .stp (proximité) et .flt (extraits) ;
+    - durees : temps de chargement de chaque fichier chargé (secondes).
+    Créer un Index ne lit aucun fichier.
+    """
+
+    def __init__(self, collection_dir: Path = COLLECTION_DIR, outputs_dir: Path = OUTPUTS_DIR,
+                 exact: bool = True):
+        self.collection_dir = collection_dir
+        self.doc_list_file = collection_dir / "Collection"
+        self.vocab_file = outputs_dir / "vocabulaire.txt"
+        self.df_file = outputs_dir / "df.txt"
+        self.vect_tf_file = outputs_dir / "vecteurTF.txt"
+        self.exact = exact
+        self.source_docs = SourceDocuments(collection_dir, "stp")
+        self.source_textes = source_extraits(collection_dir)
+        self._docs = None
+        self._termes = None
+        self._df_mot = None
+        self._expansion = None
+        self._vecteurs = {}
+        self.durees = {}
+
+    def _mesurer(self, nom: str, fonction, *args):
+        debut = time.perf_counter()
+        valeur = fonction(*args)
+        self.durees[nom] = time.perf_counter() - debut
+        return valeur
+
+    def fichiers_manquants(self, *fichiers: Path) -> list:
+        """Parmi les fichiers donnés (par défaut la liste des documents), ceux qui n'existent pas."""
+        return [f for f in (fichiers or (self.doc_list_file,)) if not f.exists()]
+
+    @property
+    def docs(self) -> list:
+        if self._docs is None:
+            self._docs = self._mesurer("documents", charger_liste_docs, self.doc_list_file)
+        return self._docs
+
+    @property
+    def n_docs(self) -> int:
+        return len(self.docs)
+
+    @property
+    def termes(self) -> DictionnaireTermes:
+        if self._termes is None:
+            self._termes = self._mesurer("dictionnaire des termes", charger_vocabulaire,
+                                         self.vocab_file)
+        return self._termes
+
+    @property
+    def df_mot(self) -> dict:
+        if self._df_mot is None:
+            self._df_mot = self._mesurer("df", charger_df, self.df_file)
+        return self._df_mot
+
+    @property
+    def expansion(self) -> ExpansionTermes | None:
+        """None en mode exact, ou si le vocabulaire n'a pas été construit."""
+        if self._expansion is None and not self.exact and self.vocab_file.is_file():
+            self._expansion = ExpansionTermes(self.termes)
+        return self._expansion
+
+    def vecteurs_tfidf(self, format_poids: str = "f32"):
+        if format_poids not in self._vecteurs:
+            docs, termes, df_mot = self.docs, self.termes, self.df_mot
+            self._vecteurs[format_poids] = self._mesurer(
+                f"vecteurs tf.idf ({format_poids})", charger_vecteurs_tfidf,
+                self.vect_tf_file, docs, termes, df_mot, len(docs), format_poids)
+        return self._vecteurs[format_poids]
+
+    def recherche_tfidf(self, query: str, max_resultats: int = 20,
+                        budget_ms: float | None = None, format_poids: str = "f32"):
+        """(resultats, partiel) du modèle tf.idf (ri.tfidf.recherche_tfidf)."""
+        doc_vectors, doc_norms = self.vecteurs_tfidf(format_poids)
+        return recherche_tfidf(query, self.docs, doc_vectors, doc_norms, self.termes,
+                               self.df_mot, self.n_docs, max_resultats=max_resultats,
+                               budget_ms=budget_ms, expansion=self.expansion)
+
+    def recherche_proximite(self, query: str, k: int = 5, max_resultats: int = 20,
+                            budget_ms: float | None = None):
+        """(resultats, partiel) du modèle à proximité floue (ri.proximite.recherche_proximite)."""
+        expansion = self.expansion
+        termes = self.termes if expansion is None and self.vocab_file.is_file() else None
+        return recherche_proximite(query, self.docs, k, max_resultats=max_resultats,
+                                   budget_ms=budget_ms, expansion=expansion,
+                                   source=self.source_docs, termes=termes)
+
+    def termes_requete(self, query: str) -> set:
+        """
+        Termes désignés par la requête, développée comme pour la recherche ;
+        si df.txt existe, seuls les termes qui y figurent (ni mots vides ni
+        opérateurs : ils ne comptent dans aucun score).
+        """
+        expansion = self.expansion
+        termes_indexes = self.df_mot if self.df_file.is_file() else None
+        if expansion is None and self.vocab_file.is_file():
+            return termes_requete(query, self.termes, termes_indexes=termes_indexes)
+        return termes_requete(query, expansion=expansion, termes_indexes=termes_indexes)
+
+    def extraits(self, query: str, resultats: list, k: int = K_EXTRAIT) -> dict:
+        """{nom_doc: Extrait} des documents de `resultats` (seuls ceux-là sont lus)."""
+        return calculer_extraits(self.source_textes, [nom_doc for _, nom_doc in resultats],
+                                 self.termes_requete(query), k=k)
+
+    def rapport_demarrage(self, duree_imports: float) -> str:
+        """Temps des imports (mesuré par le script) puis de chaque chargement, en ms."""
+        lignes = ["Démarrage :", f"  {'imports':28} {1000 * duree_imports:8.1f} ms"]
+        for nom, duree in self.durees.items():
+            lignes.append(f"  {nom:28} {1000 * duree:8.1f} ms")
+        total = duree_imports + sum(self.durees.values())
+        lignes.append(f"  {'total':28} {1000 * total:8.1f} ms")
+        return "\n".join(lignes)
+
+    def fermer(self) -> None:
+        if self._termes is not None:
+            self._termes.fermer()
+            self._termes = None
+            self._expansion = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.fermer()
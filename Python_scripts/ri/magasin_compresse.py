@@ -0,0 +1,212 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: magasin_compresse.py
+Objectif du programme:
+    Stocker les textes des documents compressés par blocs (zlib ou lzma de la
+    bibliothèque standard). Un petit index indique, pour chaque document, son
+    bloc et sa position dans le bloc décompressé : lire un document ne demande
+    de décompresser que son bloc, et les derniers blocs décompressés sont
+    gardés dans un cache LRU.
+
+Organisation sur disque (dossier Collection_compressee/) :
+    stp.blocs   blocs compressés concaténés
+    stp.idx     "# methode=zlib", puis des lignes
+                  "B offset longueur"          (un bloc compressé)
+                  "D nom bloc debut longueur"  (un document dans son bloc décompressé)
+"""
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable
+import zlib
+
+# Taille visée (non compressée) d'un bloc : compromis taux de compression / coût d'un accès
+TAILLE_BLOC = 32 * 1024
+
+
+def _compresser_zlib(donnees: bytes) -> bytes:
+    return zlib.compress(donnees, 9)
+
+
+def _compresser_lzma(donnees: bytes) -> bytes:
+    # lzma n'est importé que pour les magasins compressés avec lzma
+    import lzma
+    return lzma.compress(donnees)
+
+
+def _decompresser_lzma(donnees: bytes) -> bytes:
+    import lzma
+    return lzma.decompress(donnees)
+
+
+METHODES = {
+    "zlib": (_compresser_zlib, zlib.decompress),
+    "lzma": (_compresser_lzma, _decompresser_lzma),
+}
+
+
+def chemins(dossier: Path, representation: str):
+    """Renvoie (fichier des blocs, fichier d'index) d'une représentation."""
+    return dossier / f"{representation}.blocs", dossier / f"{representation}.idx"
+
+
+class EcrivainCompresse:
+    """Écriture incrémentale : les documents sont accumulés jusqu'à remplir un bloc."""
+
+    def __init__(self, dossier: Path, representation: str,
+                 methode: str = "zlib", taille_bloc: int = TAILLE_BLOC):
+        if methode not in METHODES:
+            raise ValueError(f"Méthode de compression inconnue : {methode}")
+        dossier.mkdir(parents=True, exist_ok=True)
+        path_blocs, path_idx = chemins(dossier, representation)
+        self.compresser = METHODES[methode][0]
+        self.taille_bloc = taille_bloc
+        self.f_blocs = path_blocs.open("wb")
+        self.f_idx = path_idx.open("w", encoding="utf-8")
+        self.f_idx.write(f"# methode={methode}\n")
+        self.offset = 0
+        self.num_bloc = 0
+        self.tampon = bytearray()
+        self.n = 0
+
+    def ajouter(self, nom_doc: str, texte: str) -> None:
+        donnees = texte.encode("utf-8")
+        self.f_idx.write(f"D {nom_doc} {self.num_bloc} {len(self.tampon)} {len(donnees)}\n")
+        self.tampon += donnees
+        self.n += 1
+        if len(self.tampon) >= self.taille_bloc:
+            self._vider()
+
+    def _vider(self) -> None:
+        if not self.tampon:
+            return
+        bloc = self.compresser(bytes(self.tampon))
+        self.f_blocs.write(bloc)
+        self.f_idx.write(f"B {self.offset} {len(bloc)}\n")
+        self.offset += len(bloc)
+        self.num_bloc += 1
+        self.tampon = bytearray()
+
+    def fermer(self) -> None:
+        self._vider()
+        self.f_blocs.close()
+        self.f_idx.close()
+
+
+def ecrire_magasin_compresse(dossier: Path, representation: str,
+                             documents: Iterable[tuple],
+                             methode: str = "zlib",
+                             taille_bloc: int = TAILLE_BLOC) -> int:
+    """Écrit une représentation à partir de (nom_doc, texte). Renvoie le nombre de documents."""
+    ecrivain = EcrivainCompresse(dossier, representation, methode, taille_bloc)
+    try:
+        for nom_doc, texte in documents:
+            ecrivain.ajouter(nom_doc, texte)
+    finally:
+        ecrivain.fermer()
+    return ecrivain.n
+
+
+class MagasinCompresse:
+    """
+    Lecteur : accès direct à un document en ne décompressant que son bloc.
+    Les `taille_cache` derniers blocs décompressés restent en mémoire (LRU).
+    """
+
+    def __init__(self, dossier: Path, representation: str = "stp", taille_cache: int = 16):
+        self.path_blocs, self.path_idx = chemins(dossier, representation)
+        self.blocs = []      # (offset, longueur) des blocs compressés
+        self.positions = {}  # nom -> (bloc, debut, longueur)
+        self.noms = []
+        methode = "zlib"
+
+        with self.path_idx.open("r", encoding="utf-8") as f:
+            for line in f:
+                parts = line.split()
+                if not parts:
+                    continue
+                if parts[0] == "#":
+                    methode = parts[1].split("=", 1)[1]
+                elif parts[0] == "B":
+                    self.blocs.append((int(parts[1]), int(parts[2])))
+                elif parts[0] == "D":
+                    self.positions[parts[1]] = (int(parts[2]), int(parts[3]), int(parts[4]))
+                    self.noms.append(parts[1])
+
+        self.decompresser = METHODES[methode][1]
+        self.taille_cache = taille_cache
+        self.cache = OrderedDict()
+        self.succes = 0
+        self.echecs = 0
+        self._fichier = None
+
+    def __len__(self) -> int:
+        return len(self.noms)
+
+    def __contains__(self, nom_doc: str) -> bool:
+        return nom_doc in self.positions
+
+    def _bloc(self, num: int) -> bytes:
+        """Bloc décompressé, depuis le cache si possible."""
+        bloc = self.cache.get(num)
+        if bloc is not None:
+            self.cache.move_to_end(num)
+            self.succes += 1
+            return bloc
+
+        self.echecs += 1
+        if self._fichier is None:
+            self._fichier = self.path_blocs.open("rb")
+        offset, longueur = self.blocs[num]
+        self._fichier.seek(offset)
+        bloc = self.decompresser(self._fichier.read(longueur))
+
+        self.cache[num] = bloc
+        if len(self.cache) > self.taille_cache:
+            self.cache.popitem(last=False)
+        return bloc
+
+    def lire_texte(self, nom_doc: str) -> str | None:
+        """Texte du document, ou None s'il est absent du magasin."""
+        position = self.positions.get(nom_doc)
+        if position is None:
+            return None
+        num, debut, longueur = position
+        return self._bloc(num)[debut:debut + longueur].decode("utf-8", errors="ignore")
+
+    def lire_tokens(self, nom_doc: str) -> list:
+        texte = self.lire_texte(nom_doc)
+        return texte.split() if texte else []
+
+    def fermer(self) -> None:
+        if self._fichier is not None:
+            self._fichier.close()
+            self._fichier = None
+        self.cache.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.fermer()
+
+
+class EcrivainMagasinCompresse:
+    """Consommateur pour ri.flux.executer : écrit le magasin compressé pendant le passage."""
+
+    def __init__(self, dossier: Path, representations=("flt", "stp"), methode: str = "zlib"):
+        self.ecrivains = {r: EcrivainCompresse(dossier, r, methode) for r in representations}
+
+    def traiter(self, id_doc: int, doc) -> None:
+        for r, ecrivain in self.ecrivains.items():
+            if r == "brut":
+                texte = doc.texte
+            elif r == "flt":
+                texte = " ".join(doc.mots)
+            else:
+                texte = " ".join(doc.tokens)
+            ecrivain.ajouter(doc.doc_id, texte)
+
+    def terminer(self, nb_docs: int) -> None:
+        for ecrivain in self.ecrivains.values():
+            ecrivain.fermer()
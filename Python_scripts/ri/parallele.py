@@ -0,0 +1,62 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: parallele.py
+Objectif du programme:
+    Appliquer une fonction à une suite d'éléments dans plusieurs processus,
+    par paquets, en rendant les résultats dans l'ordre des éléments.
+    Les éléments sont lus au fur et à mesure : au plus 2 paquets par
+    processus sont en cours à un instant donné, si bien que la mémoire ne
+    dépend pas de la longueur de la suite (contrairement à Executor.map, qui
+    soumet tout d'un coup).
+"""
+
+from collections import deque
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+import os
+
+TAILLE_PAQUET = 64
+
+
+def _appliquer(fonction: Callable, paquet: list) -> list:
+    return [fonction(x) for x in paquet]
+
+
+def paquets(elements: Iterable, taille: int) -> Iterator[list]:
+    iterateur = iter(elements)
+    while True:
+        paquet = list(islice(iterateur, taille))
+        if not paquet:
+            return
+        yield paquet
+
+
+def map_ordonne(fonction: Callable, elements: Iterable, nb_processus: int | None = 1,
+                taille_paquet: int = TAILLE_PAQUET,
+                initialisation: Callable | None = None, args_init: tuple = ()) -> Iterator:
+    """
+    Générateur des fonction(x) pour x dans elements, dans l'ordre.
+    nb_processus : 1 = dans le processus courant, None = un par cœur.
+    `fonction` et `initialisation` doivent être définies au niveau d'un module
+    (elles sont transmises aux processus par leur nom).
+    """
+    if nb_processus is None:
+        nb_processus = os.cpu_count() or 1
+    if nb_processus <= 1:
+        if initialisation is not None:
+            initialisation(*args_init)
+        yield from map(fonction, elements)
+        return
+
+    # importé ici : en un seul processus, le module n'est pas chargé (~25 ms)
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(nb_processus, initializer=initialisation,
+                             initargs=args_init) as pool:
+        en_cours = deque()
+        for paquet in paquets(elements, taille_paquet):
+            en_cours.append(pool.submit(_appliquer, fonction, paquet))
+            if len(en_cours) >= 2 * nb_processus:
+                yield from en_cours.popleft().result()
+        while en_cours:
+            yield from en_cours.popleft().result()
@@ -0,0 +1,103 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: performances.py
+Objectif du programme:
+    Outils de mesure pour les bancs d'essai : percentiles et débit des temps
+    de réponse, pic de mémoire du processus, et comparaison de deux séries de
+    mesures (résultats courants / référence enregistrée) pour signaler les
+    régressions.
+"""
+
+import math
+import sys
+
+# Mesures dont une hausse est une régression ; pour le débit et la qualité
+# des classements (ri.evaluation : map, ndcg_10, p_10, ...), c'est une baisse
+MESURES_A_LA_BAISSE = ("secondes", "pic_memoire_mo", "p50_ms", "p95_ms", "p99_ms", "chargement_s")
+MESURES_A_LA_HAUSSE = ("qps", "map")
+PREFIXES_A_LA_HAUSSE = ("ndcg_", "p_")
+
+
+def percentile(valeurs, p: float) -> float:
+    """Percentile p (0-100) par la méthode du rang le plus proche ; 0.0 si `valeurs` est vide."""
+    triees = sorted(valeurs)
+    if not triees:
+        return 0.0
+    rang = max(1, math.ceil(p / 100 * len(triees)))
+    return triees[rang - 1]
+
+
+def resume_latences(durees) -> dict:
+    """
+    Résumé d'une série de temps de réponse (secondes) : nombre de requêtes,
+    p50 / p95 / p99 en millisecondes et débit (requêtes par seconde, en série).
+    """
+    durees = list(durees)
+    total = sum(durees)
+    return {
+        "n": len(durees),
+        "p50_ms": round(1000 * percentile(durees, 50), 3),
+        "p95_ms": round(1000 * percentile(durees, 95), 3),
+        "p99_ms": round(1000 * percentile(durees, 99), 3),
+        "qps": round(len(durees) / total, 2) if total > 0 else 0.0,
+    }
+
+
+def pic_memoire_mo() -> float | None:
+    """
+    Pic de mémoire résidente du processus (Mo) : VmHWM de /proc/self/status
+    sous Linux, sinon getrusage ; None si aucun des deux n'est disponible.
+    Sous Linux, ru_maxrss est conservé par execve : un processus enfant y
+    verrait le pic de son parent, d'où la préférence pour VmHWM.
+    """
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    pic = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss est en kilo-octets sous Linux, en octets sous macOS
+    octets = pic if sys.platform == "darwin" else pic * 1024
+    return round(octets / (1024 * 1024), 1)
+
+
+def aplatir(mesures: dict, prefixe: str = "") -> dict:
+    """{"x1/requetes/tfidf/p95_ms": valeur, ...} à partir de dictionnaires imbriqués."""
+    resultat = {}
+    for cle, valeur in mesures.items():
+        chemin = f"{prefixe}/{cle}" if prefixe else str(cle)
+        if isinstance(valeur, dict):
+            resultat.update(aplatir(valeur, chemin))
+        elif isinstance(valeur, (int, float)) and not isinstance(valeur, bool):
+            resultat[chemin] = valeur
+    return resultat
+
+
+def comparer(courant: dict, reference: dict, tolerance: float = 0.2) -> list:
+    """
+    Compare deux séries de mesures imbriquées. Renvoie les régressions
+    [(chemin, référence, courant, écart relatif)] : une mesure de temps ou de
+    mémoire plus de `tolerance` au-dessus de la référence, ou un débit ou une
+    mesure de qualité plus de `tolerance` en dessous. Les mesures absentes de
+    l'une des séries sont ignorées.
+    """
+    plat_ref = aplatir(reference)
+    regressions = []
+    for chemin, valeur in aplatir(courant).items():
+        ref = plat_ref.get(chemin)
+        nom = chemin.rsplit("/", 1)[-1]
+        if ref is None or ref <= 0:
+            continue
+        ecart = (valeur - ref) / ref
+        if nom in MESURES_A_LA_BAISSE and ecart > tolerance:
+            regressions.append((chemin, ref, valeur, ecart))
+        elif (nom in MESURES_A_LA_HAUSSE or nom.startswith(PREFIXES_A_LA_HAUSSE)) \
+                and ecart < -tolerance:
+            regressions.append((chemin, ref, valeur, ecart))
+    return regressions
@@ -0,0 +1,146 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: postings.py
+Objectif du programme:
+    Opérations sur des listes de postings triées (docIDs croissants) :
+    intersection par pointeurs de saut ou recherche galopante selon le
+    rapport des tailles, union et différence. Utilisées par le moteur
+    booléen et par le moteur d'expressions (moteur_booleen.py, moteur_phrase.py).
+"""
+
+from bisect import bisect_left
+import math
+
+# Au-delà de ce rapport de tailles, la recherche galopante bat le parcours avec sauts
+RAPPORT_GALOP = 8
+
+
+def pas_de_saut(n: int) -> int:
+    """Pas des pointeurs de saut : sqrt(n) positions, comme conseillé en cours."""
+    return max(1, int(math.sqrt(n)))
+
+
+def intersection_sauts(a: list, b: list) -> list:
+    """
+    Intersection de deux listes triées de tailles comparables,
+    en suivant des pointeurs de saut espacés de sqrt(n).
+    """
+    resultat = []
+    saut_a = pas_de_saut(len(a))
+    saut_b = pas_de_saut(len(b))
+    i = j = 0
+
+    while i < len(a) and j < len(b):
+        if a[i] == b[j]:
+            resultat.append(a[i])
+            i += 1
+            j += 1
+        elif a[i] < b[j]:
+            # pointeur de saut présent tous les saut_a éléments
+            if i % saut_a == 0 and i + saut_a < len(a) and a[i + saut_a] <= b[j]:
+                while i % saut_a == 0 and i + saut_a < len(a) and a[i + saut_a] <= b[j]:
+                    i += saut_a
+            else:
+                i += 1
+        else:
+            if j % saut_b == 0 and j + saut_b < len(b) and b[j + saut_b] <= a[i]:
+                while j % saut_b == 0 and j + saut_b < len(b) and b[j + saut_b] <= a[i]:
+                    j += saut_b
+            else:
+                j += 1
+
+    return resultat
+
+
+def recherche_galopante(liste: list, cible: int, debut: int) -> int:
+    """
+    Renvoie le plus petit indice i >= debut tel que liste[i] >= cible.
+    On double le pas (1, 2, 4, ...) puis on termine par une dichotomie.
+    """
+    n = len(liste)
+    if debut >= n or liste[debut] >= cible:
+        return debut
+
+    pas = 1
+    bas = debut
+    haut = debut + 1
+    while haut < n and liste[haut] < cible:
+        bas = haut
+        pas *= 2
+        haut = debut + pas
+
+    return bisect_left(liste, cible, bas + 1, min(haut + 1, n))
+
+
+def intersection_galopante(petite: list, grande: list) -> list:
+    """Intersection quand une liste est beaucoup plus courte que l'autre."""
+    resultat = []
+    pos = 0
+    for doc in petite:
+        pos = recherche_galopante(grande, doc, pos)
+        if pos >= len(grande):
+            break
+        if grande[pos] == doc:
+            resultat.append(doc)
+            pos += 1
+    return resultat
+
+
+def intersection(a: list, b: list) -> list:
+    """Choisit la stratégie d'intersection selon le rapport des tailles."""
+    if len(a) > len(b):
+        a, b = b, a
+    if not a:
+        return []
+    if len(b) >= RAPPORT_GALOP * len(a):
+        return intersection_galopante(a, b)
+    return intersection_sauts(a, b)
+
+
+def union(a: list, b: list) -> list:
+    """Fusion de deux listes triées, sans doublons."""
+    resultat = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        if a[i] == b[j]:
+            resultat.append(a[i])
+            i += 1
+            j += 1
+        elif a[i] < b[j]:
+            resultat.append(a[i])
+            i += 1
+        else:
+            resultat.append(b[j])
+            j += 1
+    resultat.extend(a[i:])
+    resultat.extend(b[j:])
+    return resultat
+
+
+def difference(a: list, b: list) -> list:
+    """Éléments de a absents de b (a SAUF b)."""
+    if not a or not b:
+        return list(a)
+    resultat = []
+    pos = 0
+    for doc in a:
+        pos = recherche_galopante(b, doc, pos)
+        if pos >= len(b) or b[pos] != doc:
+            resultat.append(doc)
+    return resultat
+
+
+def intersection_multiple(listes: list) -> list:
+    """
+    Intersection de plusieurs listes en commençant par les plus courtes :
+    le résultat intermédiaire ne peut que diminuer, et on s'arrête dès qu'il est vide.
+    """
+    if not listes:
+        return []
+    listes = sorted(listes, key=len)
+    resultat = listes[0]
+    for liste in listes[1:]:
+        if not resultat:
+            break
+        resultat = intersection(resultat, liste)
+    return resultat
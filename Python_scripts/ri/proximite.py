@@ -0,0 +1,85 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: proximite.py
+Objectif du programme:
+    Modèle à proximité floue : chaque occurrence d'un terme de la requête
+    diffuse une influence triangulaire de largeur k autour d'elle, et le
+    score d'un document est la somme des proximités locales.
+    Utilisé par moteur_proximite.py, au travers de ri.index.Index.
+"""
+
+from pathlib import Path
+
+from ri.collection_compacte import SourceDocuments
+from ri.echeance import Echeance, enregistrer
+from ri.expansion import ExpansionTermes
+from ri.extraits import proximites, termes_requete
+
+# Collection_compacte/ si elle existe, sinon un fichier .stp par document
+SOURCE_DOCS = SourceDocuments(Path("Collection"), "stp")
+
+
+def lire_tokens_doc(doc_name: str, source: SourceDocuments | None = None):
+    """
+    Lit la version .stp du document et renvoie la liste de tokens (mots).
+    On suppose que le texte est déjà nettoyé (minuscules, pas de ponctuation).
+    """
+    # split() suffit : les .stp sont déjà filtrés
+    return (source if source is not None else SOURCE_DOCS).lire_tokens(doc_name)
+
+
+def score_proximite_fuzzy(tokens, query_terms, k: int):
+    """
+    Implémentation simplifiée de la proximité floue pour une requête "OU" de mots-clés.
+
+    - query_terms : ensemble de termes de la requête (minuscules).
+    - k : paramètre de largeur de la zone d'influence (en nombre de termes).
+
+    Retourne un score réel >= 0.
+    """
+    if not tokens or not query_terms:
+        return 0.0
+
+    # Proximité p_q^d(x) pour chaque position x : pour chaque occurrence d'un
+    # terme de la requête, "pyramide" triangulaire de largeur k,
+    # f(delta) = max((k - |delta|) / k, 0) (ri.extraits.proximites, qui sert
+    # aussi à placer les extraits) ; score = somme des proximités locales
+    return sum(proximites(tokens, query_terms, k))
+
+
+def recherche_proximite(query: str, docs, k: int, max_resultats: int = 20,
+                        budget_ms: float | None = None,
+                        expansion: ExpansionTermes | None = None,
+                        source: SourceDocuments | None = None,
+                        termes=None):
+    """
+    Retourne (resultats, partiel) :
+      - resultats : liste [(score, nom_doc), ...] triée par score décroissant,
+      - partiel   : True si le budget de temps a interrompu le parcours ;
+                    resultats est alors le meilleur top-k parmi les documents vus.
+    expansion : développement des mots de requête en termes du vocabulaire
+                (ri.expansion) ; sans elle, jokers `algo*` du dictionnaire
+                `termes` s'il est donné, sinon mots pris tels quels.
+    source    : textes .stp des documents (par défaut ceux de Collection/).
+    """
+    # lecture d'un fichier par document : on regarde l'horloge à chaque document
+    echeance = Echeance(budget_ms, pas=1)
+
+    # requête : ensemble de mots en minuscules, jokers développés
+    query_terms = termes_requete(query, termes, expansion=expansion)
+
+    resultats = []
+    for nom_doc in docs:
+        if echeance.verifier():
+            break
+        tokens = lire_tokens_doc(nom_doc, source)
+        if not tokens:
+            continue
+
+        score = score_proximite_fuzzy(tokens, query_terms, k)
+        if score > 0.0:
+            resultats.append((score, nom_doc))
+
+    resultats.sort(reverse=True, key=lambda x: x[0])
+    enregistrer(echeance.depassee)
+    return resultats[:max_resultats], echeance.depassee
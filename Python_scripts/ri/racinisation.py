@@ -0,0 +1,60 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: racinisation.py
+Objectif du programme:
+    Racinisation (Porter) mémorisée : la racine de chaque forme de surface est
+    calculée une seule fois puis relue dans un cache, puisque la plupart des
+    mots se répètent d'un document à l'autre. Le coût de la racinisation
+    dépend alors du nombre de mots distincts, et non plus du nombre
+    d'occurrences.
+    NLTK n'est nécessaire que pour le raciniseur de Porter par défaut ;
+    n'importe quelle fonction mot -> racine peut être mémorisée de la même façon.
+"""
+
+from typing import Callable
+
+
+def stemmer_porter() -> Callable[[str], str]:
+    """Fonction PorterStemmer().stem de NLTK (ImportError explicite si NLTK est absent)."""
+    try:
+        from nltk.stem.porter import PorterStemmer
+    except ImportError as e:
+        raise ImportError("la racinisation de Porter nécessite NLTK : pip install nltk") from e
+    return PorterStemmer().stem
+
+
+class Raciniseur:
+    """
+    Racinisation mémorisée, indexée par forme de surface.
+
+        raciniseur = Raciniseur()              # Porter (NLTK)
+        raciniseur("algorithms")  -> "algorithm"
+        raciniseur.tokens(["sorting", "sorted"])  -> ["sort", "sort"]
+    """
+
+    def __init__(self, raciniser: Callable[[str], str] | None = None):
+        self.raciniser = raciniser if raciniser is not None else stemmer_porter()
+        self.cache = {}
+        self.occurrences = 0
+
+    def __call__(self, mot: str) -> str:
+        self.occurrences += 1
+        racine = self.cache.get(mot)
+        if racine is None:
+            racine = self.cache[mot] = self.raciniser(mot)
+        return racine
+
+    def tokens(self, mots) -> list:
+        cache = self.cache
+        racines = []
+        for mot in mots:
+            racine = cache.get(mot)
+            if racine is None:
+                racine = cache[mot] = self.raciniser(mot)
+            racines.append(racine)
+        self.occurrences += len(racines)
+        return racines
+
+    def statistiques(self) -> str:
+        return (f"racinisation : {len(self.cache)} mots distincts racinisés "
+                f"pour {self.occurrences} occurrences")
@@ -0,0 +1,111 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: requetes_cacm.py
+Objectif du programme:
+    Requêtes de test de la collection CACM : lecture de query.text (requêtes
+    .I / .W) et de qrels.text (documents pertinents de chaque requête),
+    fournis avec cacm.all. À défaut de query.text, une liste de requêtes
+    d'exemple permet encore de mesurer les temps de réponse.
+
+Format de qrels.text : une ligne "idRequête idDoc 0 0" par document
+pertinent ; idDoc est le numéro du document (CACM-<idDoc>).
+"""
+
+from pathlib import Path
+
+from ri.flux import nettoyer
+
+SCRIPT_DIR = Path(__file__).resolve().parent.parent
+# query.text et qrels.text sont cherchés à côté de cacm.all, puis à la racine du projet
+DOSSIERS_CACM = (SCRIPT_DIR / "5_Processus_en_python", SCRIPT_DIR.parent,
+                 SCRIPT_DIR.parent / "Collection")
+
+REQUETES_EXEMPLE = [
+    "computer science education",
+    "algorithm sorting",
+    "parallel processing systems",
+    "compiler optimization code generation",
+    "operating system time sharing",
+    "numerical solution differential equations",
+    "information retrieval indexing",
+    "syntax analysis parsing",
+    "storage allocation memory",
+    "matrix inversion",
+    "graph theory shortest path",
+    "programming language semantics",
+    "random number generator",
+    "database management query",
+    "error correcting codes",
+    "file organization hashing",
+    "list processing recursion",
+    "simulation model queueing",
+    "pattern recognition",
+    "fortran subroutine",
+]
+
+
+def trouver_fichier_cacm(nom: str) -> Path | None:
+    """Premier fichier `nom` trouvé dans DOSSIERS_CACM, ou None."""
+    for dossier in DOSSIERS_CACM:
+        path = dossier / nom
+        if path.is_file():
+            return path
+    return None
+
+
+def lire_requetes_cacm(path: Path) -> dict:
+    """
+    Lit query.text : renvoie {idRequête: texte de la section .W}, le texte
+    étant nettoyé comme les documents (ponctuation, accents, minuscules).
+    """
+    requetes = {}
+    id_requete = None
+    morceaux = None  # lignes de la section .W en cours, None hors de .W
+
+    def terminer():
+        if id_requete is not None and morceaux:
+            requetes[id_requete] = nettoyer(" ".join(morceaux)).strip()
+
+    with path.open("r", encoding="utf-8", errors="ignore") as f:
+        for line in f:
+            if line.startswith(".I"):
+                terminer()
+                id_requete = int(line.split()[1])
+                morceaux = None
+            elif line.startswith(".W"):
+                morceaux = []
+            elif line.startswith("."):
+                terminer()
+                morceaux = None
+            elif morceaux is not None:
+                morceaux.append(line.strip())
+    terminer()
+    return requetes
+
+
+def lire_qrels(path: Path) -> dict:
+    """Lit qrels.text : renvoie {idRequête: ensemble des noms de documents pertinents}."""
+    pertinents = {}
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) < 2:
+                continue
+            try:
+                id_requete, id_doc = int(parts[0]), int(parts[1])
+            except ValueError:
+                continue
+            pertinents.setdefault(id_requete, set()).add(f"CACM-{id_doc}")
+    return pertinents
+
+
+def requetes_de_test() -> tuple:
+    """
+    (source, liste des requêtes) : celles de query.text s'il est trouvé,
+    sinon REQUETES_EXEMPLE.
+    """
+    path = trouver_fichier_cacm("query.text")
+    if path is None:
+        return "exemples intégrés", list(REQUETES_EXEMPLE)
+    requetes = lire_requetes_cacm(path)
+    return str(path), [requetes[i] for i in sorted(requetes)]
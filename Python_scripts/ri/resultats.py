@@ -0,0 +1,106 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: resultats.py
+Objectif du programme:
+    Présentation des résultats des moteurs de recherche : liste des
+    documents dans le terminal (avec leurs extraits) et page HTML de
+    résultats avec un lien vers chaque document.
+"""
+
+from pathlib import Path
+
+RESULTS_DIR = Path("outputs")
+
+
+def afficher_resultats(resultats: list, extraits: dict | None = None, couleur: bool = False,
+                       collection_dir: Path = Path("Collection"), extension: str = ".stp") -> None:
+    """Une ligne par document (score, lien), suivie de son extrait s'il y en a un."""
+    for score, nom_doc in resultats:
+        lien = f"{collection_dir.as_posix()}/{nom_doc}{extension}"
+        print(f"- {nom_doc}  (score = {score:.4f})  -> {lien}")
+        if extraits and nom_doc in extraits:
+            print(f"    {extraits[nom_doc].console(couleur)}")
+
+
+def ecrire_resultats_html(
+    moteur_nom: str,
+    query: str,
+    resultats: list[tuple[float, str]],
+    output_path: Path,
+    collection_dir: Path,
+    extension: str = ".stp",
+    extraits: dict | None = None,
+) -> None:
+    """
+    Génère une page HTML contenant les résultats et un lien cliquable vers chaque document.
+    resultats : liste de tuples (score, doc_id).
+    extraits  : {doc_id: ri.extraits.Extrait} ; ajoute une colonne d'extraits,
+                termes de la requête surlignés.
+    """
+    # importés ici : ils ne servent qu'à l'écriture de la page
+    from datetime import datetime
+    from urllib.parse import quote
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    rows = []
+    for rank, (score, doc_id) in enumerate(resultats, start=1):
+        rel = f"../{collection_dir.as_posix()}/{doc_id}{extension}"
+        href = quote(rel, safe="/:._-")
+        cellule_extrait = ""
+        if extraits is not None:
+            cellule_extrait = f"<td>{extraits[doc_id].html() if doc_id in extraits else ''}</td>"
+        rows.append(
+            f"<tr>"
+            f"<td>{rank}</td>"
+            f"<td>{doc_id}</td>"
+            f"<td>{score:.6f}</td>"
+            f"{cellule_extrait}"
+            f"<td><a href='{href}' target='_blank' rel='noopener'>ouvrir</a></td>"
+            f"</tr>"
+        )
+    nb_colonnes = 5 if extraits is not None else 4
+    entete_extrait = "\n        <th>Extrait</th>" if extraits is not None else ""
+    aucun = f"<tr><td colspan='{nb_colonnes}'>Aucun résultat.</td></tr>"
+
+    html = f"""<!DOCTYPE html>
+<html lang="fr">
+<head>
+  <meta charset="utf-8">
+  <title>Résultats — {moteur_nom}</title>
+  <style>
+    body {{ font-family: Arial, sans-serif; margin: 24px; }}
+    code {{ background: #f4f4f4; padding: 2px 4px; border-radius: 4px; }}
+    table {{ border-collapse: collapse; width: 100%; margin-top: 16px; }}
+    th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
+    th {{ background: #f7f7f7; }}
+    mark {{ background: #fff3a0; padding: 0 1px; }}
+  </style>
+</head>
+<body>
+  <h1>Résultats — {moteur_nom}</h1>
+  <p><b>Requête :</b> <code>{query}</code></p>
+  <p><b>Généré le :</b> {now}</p>
+
+  <table>
+    <thead>
+      <tr>
+        <th>#</th>
+        <th>Document</th>
+        <th>Score</th>{entete_extrait}
+        <th>Lien</th>
+      </tr>
+    </thead>
+    <tbody>
+      {"".join(rows) if rows else aucun}
+    </tbody>
+  </table>
+
+  <p style="margin-top:16px; font-size: 0.9em; color: #666;">
+    Astuce: ouvrez ce fichier avec un navigateur (double-clic) pour cliquer les liens.
+  </p>
+</body>
+</html>
+"""
+    output_path.write_text(html, encoding="utf-8")
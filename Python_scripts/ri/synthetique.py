@@ -0,0 +1,103 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: synthetique.py
+Objectif du programme:
+    Générateur de collections synthétiques de taille quelconque, pour tester
+    le passage à l'échelle (index, moteurs) sans autre donnée que CACM :
+    - fréquences des termes selon la loi de Zipf p(r) ∝ r^-s, avec
+      l'exposant s ajusté sur counter.txt (ri.zipf, comme zipf_plot.py) ;
+      les termes de rang r sont ceux de counter.txt, puis des termes
+      inventés ("t<rang>") au-delà ;
+    - taille du vocabulaire qui croît comme la racine du nombre de documents
+      (loi de Heaps avec β ≈ 0,5), à partir de celle de CACM ;
+    - longueur de chaque document tirée parmi les longueurs (.stp) des
+      documents de CACM, ce qui conserve leur distribution (beaucoup de
+      notices courtes, quelques résumés longs).
+    Tous les tirages passent par random.Random(graine) : mêmes paramètres,
+    même collection.
+
+Les documents générés n'ont pas de mots vides : leur texte, leur .flt et
+leur .stp sont identiques. Les termes d'un document sont tirés
+indépendamment les uns des autres (pas de cooccurrences particulières).
+"""
+
+from itertools import accumulate
+from pathlib import Path
+from typing import Iterator, NamedTuple
+import math
+import random
+
+from ri.collection_compacte import SourceDocuments
+from ri.flux import Document
+from ri.zipf import ajuster_zipf, lire_counter
+
+
+class ModeleCollection(NamedTuple):
+    termes: list       # termes de la collection de référence, par rang croissant
+    exposant: float    # exposant s de la loi de Zipf
+    longueurs: list    # nombre de termes (.stp) de chaque document de référence
+
+
+def longueurs_documents(collection_dir: Path) -> list:
+    """Nombre de termes du .stp de chaque document de Collection/Collection."""
+    source = SourceDocuments(collection_dir, "stp")
+    longueurs = []
+    with (collection_dir / "Collection").open("r", encoding="utf-8") as f:
+        for line in f:
+            nom = line.strip()
+            if nom:
+                longueurs.append(len(source.lire_tokens(nom)))
+    return longueurs
+
+
+def modele_depuis_collection(counter_file: Path, collection_dir: Path) -> ModeleCollection:
+    """
+    Modèle ajusté sur une collection indexée : termes et exposant de Zipf
+    d'après counter.txt, longueurs des documents d'après Collection/.
+    """
+    stats = lire_counter(counter_file)
+    ajustement = ajuster_zipf([s.rank for s in stats], [s.freq for s in stats])
+    if ajustement is None:
+        raise ValueError(f"Pas assez de rangs dans {counter_file} pour ajuster la loi de Zipf.")
+    longueurs = longueurs_documents(collection_dir)
+    if not longueurs:
+        raise ValueError(f"Aucun document dans {collection_dir / 'Collection'}.")
+    return ModeleCollection([s.word for s in stats], -ajustement[0], longueurs)
+
+
+def taille_vocabulaire(modele: ModeleCollection, nb_docs: int) -> int:
+    """Vocabulaire de référence × √(nb_docs / nb_docs de référence), jamais moins que la référence."""
+    facteur = math.sqrt(nb_docs / len(modele.longueurs))
+    return max(len(modele.termes), round(len(modele.termes) * facteur))
+
+
+def vocabulaire_synthetique(termes: list, taille: int) -> list:
+    """Les `taille` premiers termes, complétés si besoin par "t<rang>" (sans doublon)."""
+    vocabulaire = termes[:taille]
+    connus = set(vocabulaire)
+    rang = len(vocabulaire)
+    while len(vocabulaire) < taille:
+        rang += 1
+        terme = f"t{rang}"
+        if terme not in connus:
+            vocabulaire.append(terme)
+    return vocabulaire
+
+
+def generer_documents(modele: ModeleCollection, nb_docs: int, graine: int = 0,
+                      taille: int | None = None, prefixe: str = "SYN") -> Iterator[Document]:
+    """
+    Flux de `nb_docs` documents <prefixe>-1, <prefixe>-2, ... (ri.flux.Document),
+    utilisable directement avec ri.flux.executer et ri.corpus.ecrire_corpus.
+    `taille` : taille du vocabulaire (défaut : taille_vocabulaire).
+    """
+    if taille is None:
+        taille = taille_vocabulaire(modele, nb_docs)
+    vocabulaire = vocabulaire_synthetique(modele.termes, taille)
+    # poids cumulés : random.choices cherche alors chaque tirage par dichotomie
+    cumuls = list(accumulate(r ** -modele.exposant for r in range(1, len(vocabulaire) + 1)))
+    rng = random.Random(graine)
+    for n in range(1, nb_docs + 1):
+        longueur = rng.choice(modele.longueurs)
+        tokens = rng.choices(vocabulaire, cum_weights=cumuls, k=longueur)
+        yield Document(f"{prefixe}-{n}", " ".join(tokens), tokens, tokens)
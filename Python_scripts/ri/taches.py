@@ -0,0 +1,173 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: taches.py
+Objectif du programme:
+    Exécuter une suite d'étapes (scripts du TP) à la manière de make :
+    chaque étape déclare ses entrées et ses sorties (motifs glob relatifs à la
+    racine du projet) ; une empreinte SHA-256 de leur contenu est enregistrée
+    après chaque exécution réussie. Une étape n'est relancée que si ses entrées
+    (script compris) ont changé ou si ses sorties manquent ou ont été modifiées.
+    Les étapes indépendantes sont lancées en parallèle (sous-processus).
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import NamedTuple
+import hashlib
+import json
+import subprocess
+import sys
+import time
+
+TAILLE_LECTURE = 1 << 20
+
+
+class Etape(NamedTuple):
+    """Une étape du pipeline."""
+    nom: str
+    commande: tuple          # ex. ("python", "6_.../vocabulary.py") ; chemins relatifs à Python_scripts/
+    entrees: tuple           # motifs glob relatifs à la racine du projet
+    sorties: tuple           # idem
+    dependances: tuple = ()  # noms des étapes à terminer avant celle-ci
+
+
+def empreinte_fichier(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for bloc in iter(lambda: f.read(TAILLE_LECTURE), b""):
+            h.update(bloc)
+    return h.hexdigest()
+
+
+def empreinte_motifs(racine: Path, motifs) -> dict:
+    """
+    Empreinte de chaque motif : SHA-256 des (chemin, contenu) des fichiers
+    correspondants, triés ; None si aucun fichier ne correspond.
+    """
+    resultat = {}
+    for motif in motifs:
+        fichiers = sorted(p for p in racine.glob(motif) if p.is_file())
+        if not fichiers:
+            resultat[motif] = None
+            continue
+        h = hashlib.sha256()
+        for p in fichiers:
+            h.update(p.relative_to(racine).as_posix().encode("utf-8"))
+            h.update(empreinte_fichier(p).encode("ascii"))
+        resultat[motif] = h.hexdigest()
+    return resultat
+
+
+class Pipeline:
+    """Ensemble d'étapes avec leur état persistant (fichier JSON)."""
+
+    def __init__(self, etapes: list, racine: Path, scripts_dir: Path, fichier_etat: Path):
+        self.etapes = {e.nom: e for e in etapes}
+        self.ordre = [e.nom for e in etapes]
+        self.racine = racine
+        self.scripts_dir = scripts_dir
+        self.fichier_etat = fichier_etat
+        self.etat = {}
+        if fichier_etat.is_file():
+            with fichier_etat.open("r", encoding="utf-8") as f:
+                self.etat = json.load(f)
+
+    def fermeture(self, noms: list) -> list:
+        """Étapes demandées et toutes leurs dépendances, dans l'ordre de déclaration."""
+        a_voir = list(noms)
+        retenues = set()
+        while a_voir:
+            nom = a_voir.pop()
+            if nom not in self.etapes:
+                raise ValueError(f"Étape inconnue : {nom}")
+            if nom not in retenues:
+                retenues.add(nom)
+                a_voir.extend(self.etapes[nom].dependances)
+        return [n for n in self.ordre if n in retenues]
+
+    def empreinte_entrees(self, etape: Etape) -> dict:
+        scripts = [a for a in etape.commande[1:] if a.endswith((".py", ".pl"))]
+        return {
+            "script": {s: empreinte_fichier(self.scripts_dir / s) for s in scripts},
+            "fichiers": empreinte_motifs(self.racine, etape.entrees),
+        }
+
+    def a_jour(self, etape: Etape, entrees: dict) -> bool:
+        """Vrai si les entrées sont celles de la dernière exécution et les sorties intactes."""
+        precedent = self.etat.get(etape.nom)
+        if precedent is None or precedent.get("entrees") != entrees:
+            return False
+        sorties = empreinte_motifs(self.racine, etape.sorties)
+        return None not in sorties.values() and precedent.get("sorties") == sorties
+
+    def lancer(self, etape: Etape) -> tuple:
+        """Exécute la commande d'une étape (depuis la racine). Renvoie (code, durée, sortie)."""
+        commande = [sys.executable if a == "python" else a for a in etape.commande]
+        commande = [commande[0]] + [
+            str(self.scripts_dir / a) if a.endswith((".py", ".pl")) else a for a in commande[1:]
+        ]
+        debut = time.perf_counter()
+        res = subprocess.run(commande, cwd=self.racine, capture_output=True, text=True)
+        return res.returncode, time.perf_counter() - debut, res.stdout + res.stderr
+
+    def executer(self, noms: list, forcer: bool = False, nb_taches: int = 4,
+                 afficher=print) -> dict:
+        """
+        Exécute les étapes demandées (et leurs dépendances) en respectant l'ordre
+        des dépendances, en parallèle dès que possible.
+        Renvoie {nom: "executee" | "a jour" | "echec" | "annulee"}.
+        """
+        a_faire = self.fermeture(noms)
+        statut = {}
+        en_cours = {}  # future -> nom
+        entrees_en_cours = {}
+
+        def pretes():
+            return [n for n in a_faire
+                    if n not in statut and n not in en_cours.values()
+                    and all(d in statut or d not in a_faire for d in self.etapes[n].dependances)]
+
+        with ThreadPoolExecutor(max_workers=max(1, nb_taches)) as pool:
+            while len(statut) < len(a_faire):
+                for nom in pretes():
+                    etape = self.etapes[nom]
+                    if any(statut.get(d) in ("echec", "annulee") for d in etape.dependances):
+                        statut[nom] = "annulee"
+                        afficher(f"[annulee] {nom} (dépendance en échec)")
+                        continue
+                    entrees = self.empreinte_entrees(etape)
+                    if not forcer and self.a_jour(etape, entrees):
+                        statut[nom] = "a jour"
+                        afficher(f"[a jour]  {nom}")
+                        continue
+                    entrees_en_cours[nom] = entrees
+                    en_cours[pool.submit(self.lancer, etape)] = nom
+
+                if not en_cours:
+                    continue
+
+                terminees, _ = wait(en_cours, return_when=FIRST_COMPLETED)
+                for future in terminees:
+                    nom = en_cours.pop(future)
+                    code, duree, sortie = future.result()
+                    entrees = entrees_en_cours.pop(nom)
+                    if code == 0:
+                        self.etat[nom] = {
+                            "entrees": entrees,
+                            "sorties": empreinte_motifs(self.racine, self.etapes[nom].sorties),
+                            "duree": round(duree, 3),
+                        }
+                        statut[nom] = "executee"
+                        afficher(f"[executee] {nom} ({duree:.2f} s)")
+                    else:
+                        self.etat.pop(nom, None)
+                        statut[nom] = "echec"
+                        afficher(f"[echec]   {nom} (code {code})\n{sortie.strip()}")
+                self.sauvegarder()
+
+        return statut
+
+    def sauvegarder(self) -> None:
+        self.fichier_etat.parent.mkdir(parents=True, exist_ok=True)
+        with self.fichier_etat.open("w", encoding="utf-8") as f:
+            json.dump(self.etat, f, indent=1, sort_keys=True)
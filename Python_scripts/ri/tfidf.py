@@ -0,0 +1,172 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: tfidf.py
+Objectif du programme:
+    Modèle tf.idf (cosinus) : poids tf.idf des documents calculés à partir
+    de vecteurTF, vecteur de la requête et classement des documents.
+    Utilisé par moteur_tfidf.py, au travers de ri.index.Index.
+"""
+
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+import math
+
+from ri.dictionnaire import developper_joker
+from ri.echeance import Echeance, enregistrer
+from ri.expansion import ExpansionTermes
+from ri.vecteurs import QUANTIFICATIONS, MatriceCSR, charger_vecteurs, quantifier_colonnes
+
+
+def charger_vecteurs_tfidf(vect_tf_path: Path,
+                           docs,
+                           termes,
+                           df_mot,
+                           n_docs: int,
+                           format_poids: str = "f32"):
+    """
+    À partir de vecteurTF.txt (ou de sa version binaire vecteurTF.npz) et df,
+    calcule les poids tf.idf pour chaque document.
+    Renvoie :
+      - doc_vectors : MatriceCSR (ri.vecteurs), une ligne par index doc :
+                      idTermes croissants dans un array('i'), poids dans un array('f')
+                      (environ 8 octets par terme au lieu de ~100 pour un dict)
+      - doc_norms   : array('d') des normes L2 des vecteurs doc
+    format_poids : "f64", "f32", ou "q16" / "q8" (codes entiers + échelle par terme,
+    dans doc_vectors.echelles) ; les normes sont toujours calculées en double précision.
+    """
+    # idf classique log(N/df), calculé une fois par terme ; 0 = terme ignoré
+    idf_par_id = {}
+    for term_id, mot in termes.items():
+        df = df_mot.get(mot)
+        if df:
+            idf_par_id[term_id] = math.log(n_docs / df)
+
+    indptr = array("q", [0])
+    indices = array("i")
+    poids = array("d" if format_poids == "f64" else "f")
+    doc_norms = array("d")
+
+    # vecteurTF.npz (aucune analyse de texte) s'il est à jour, sinon vecteurTF.txt
+    for term_ids, tfs in charger_vecteurs(vect_tf_path, entiers=True):
+        norm_sq = 0.0
+        for term_id, tf in zip(term_ids, tfs):
+            idf = idf_par_id.get(term_id)
+            if idf is None:
+                continue
+            w = tf * idf
+            indices.append(term_id)
+            poids.append(w)
+            norm_sq += w * w
+
+        indptr.append(len(indices))
+        doc_norms.append(math.sqrt(norm_sq) if norm_sq > 0 else 0.0)
+
+    doc_vectors = MatriceCSR(indptr, indices, poids, len(termes) + 1)
+    if format_poids in QUANTIFICATIONS:
+        doc_vectors.data, doc_vectors.echelles = quantifier_colonnes(
+            indices, poids, QUANTIFICATIONS[format_poids], doc_vectors.nb_colonnes)
+
+    # Sanity check : nombre de lignes == nombre de docs
+    if len(doc_vectors) != len(docs):
+        print("Attention : nombre de lignes dans vecteurTF.txt différent du nombre de documents.")
+
+    return doc_vectors, doc_norms
+
+
+def construire_vecteur_requete(query: str,
+                               termes,
+                               df_mot,
+                               n_docs: int,
+                               expansion: ExpansionTermes | None = None):
+    """
+    Construit le vecteur tf.idf de la requête et sa norme.
+    Avec `expansion`, chaque mot est développé en termes du vocabulaire
+    (jokers, mots proches, correction des mots inconnus), chacun compté avec
+    son facteur ; sans elle, seuls les mots exacts et les jokers `algo*` comptent.
+    Retourne (vec, norm) avec vec : {idTerme: poids_tfidf}.
+    """
+    mots = query.lower().split()
+
+    # tf dans la requête, par (idTerme, terme)
+    tf_q = {}
+    for mot in mots:
+        if expansion is not None:
+            developpes = expansion.developper(mot)
+        else:
+            developpes = [(term_id, terme, 1.0) for term_id, terme in developper_joker(termes, mot)]
+        for term_id, terme, facteur in developpes:
+            cle = (term_id, terme)
+            tf_q[cle] = tf_q.get(cle, 0) + facteur
+
+    vec = {}
+    for (term_id, mot), tf in tf_q.items():
+        df = df_mot.get(mot)
+        if not df or df == 0:
+            continue
+        idf = math.log(n_docs / df)
+        vec[term_id] = tf * idf
+
+    norm_sq = sum(w * w for w in vec.values())
+    norm = math.sqrt(norm_sq) if norm_sq > 0 else 0.0
+    return vec, norm
+
+
+def recherche_tfidf(query: str,
+                    docs,
+                    doc_vectors,
+                    doc_norms,
+                    termes,
+                    df_mot,
+                    n_docs: int,
+                    max_resultats: int = 20,
+                    budget_ms: float | None = None,
+                    expansion: ExpansionTermes | None = None):
+    """
+    Renvoie (resultats, partiel) :
+      - resultats : liste [(score, nom_doc), ...] triée par score décroissant,
+      - partiel   : True si le budget de temps a interrompu le parcours ;
+                    resultats est alors le meilleur top-k parmi les documents vus.
+    """
+    echeance = Echeance(budget_ms)
+
+    q_vec, q_norm = construire_vecteur_requete(query, termes, df_mot, n_docs, expansion)
+    if not q_vec or q_norm == 0.0:
+        enregistrer(False)
+        return [], False
+
+    resultats = []
+    termes_q = sorted(q_vec.items())
+    if doc_vectors.echelles is not None:
+        # poids quantifiés : l'échelle du terme est appliquée une fois au poids de la requête
+        termes_q = [(t, w * doc_vectors.echelles[t]) for t, w in termes_q]
+    indptr, indices, poids = doc_vectors.indptr, doc_vectors.indices, doc_vectors.data
+
+    for doc_idx, d_norm in enumerate(doc_norms):
+        if echeance.verifier():
+            break
+        if d_norm == 0.0:
+            continue
+
+        # produit scalaire sur les termes de la requête : recherche dichotomique
+        # dans la ligne du document (idTermes croissants), en repartant de la
+        # position précédente puisque les termes de la requête sont triés
+        num = 0.0
+        pos, fin = indptr[doc_idx], indptr[doc_idx + 1]
+        for term_id, w_q in termes_q:
+            pos = bisect_left(indices, term_id, pos, fin)
+            if pos == fin:
+                break
+            if indices[pos] == term_id:
+                num += w_q * poids[pos]
+
+        if num <= 0.0:
+            continue
+
+        score = num / (q_norm * d_norm)
+        if score > 0.0:
+            resultats.append((score, docs[doc_idx]))
+
+    resultats.sort(reverse=True, key=lambda x: x[0])
+    enregistrer(echeance.depassee)
+    return resultats[:max_resultats], echeance.depassee
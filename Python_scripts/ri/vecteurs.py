@@ -0,0 +1,432 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: vecteurs.py
+Objectif du programme:
+    Écriture et lecture rapides des fichiers de vecteurs de documents.
+    - Format texte habituel : une ligne "id:valeur id:valeur ..." par document,
+      formatée en une seule opération par ligne et écrite par paquets.
+    - Format binaire .npz (matrice creuse CSR, même disposition que
+      scipy.sparse.save_npz) : indptr, indices, data, shape, format.
+      Il est écrit et relu avec la seule bibliothèque standard (zipfile + array) ;
+      numpy.load ou scipy.sparse.load_npz savent aussi le lire.
+    - Poids quantifiés sur 8 ou 16 bits avec une échelle par terme
+      (quantifier_colonnes) : data contient alors les codes entiers et le
+      tableau supplémentaire `echelles` donne, pour chaque idTerme, le poids
+      d'une unité (poids ≈ code × echelles[idTerme]).
+    charger_vecteurs() lit l'un ou l'autre format et renvoie une MatriceCSR :
+    un consommateur qui dispose du .npz n'analyse plus aucun texte.
+    LecteurVecteurs lit le format texte à la demande (par paquets, ou un
+    document précis grâce à un index des débuts de ligne), sans tout charger.
+"""
+
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+import sys
+
+# Nombre de lignes accumulées avant chaque écriture groupée
+TAILLE_TAMPON = 1024
+
+# Code de type array -> descripteur de type numpy (petit-boutiste)
+DESCRIPTEURS = {"B": "|u1", "H": "<u2", "i": "<i4", "I": "<u4", "q": "<i8", "f": "<f4", "d": "<f8"}
+CODES = {v: k for k, v in DESCRIPTEURS.items()}
+
+
+# ----------------------------------------------------------------------
+# Format texte
+# ----------------------------------------------------------------------
+
+def formater_ligne(ids, valeurs, entiers: bool = False, decimales: int = 6) -> str:
+    """
+    "id:valeur id:valeur ..." en un seul formatage %-style pour toute la ligne
+    (environ deux fois plus rapide qu'une f-string par terme).
+    """
+    n = len(ids)
+    if n == 0:
+        return ""
+    alternes = [None] * (2 * n)
+    alternes[0::2] = ids
+    alternes[1::2] = valeurs
+    motif = "%d:%d " if entiers else f"%d:%.{decimales}f "
+    return (motif * n % tuple(alternes))[:-1]
+
+
+def analyser_ligne(ligne: str, entiers: bool = False) -> tuple:
+    """Inverse de formater_ligne : renvoie (ids, valeurs) en listes."""
+    ids = []
+    valeurs = []
+    conv = int if entiers else float
+    for couple in ligne.split():
+        id_str, _, val_str = couple.partition(":")
+        try:
+            ids.append(int(id_str))
+            valeurs.append(conv(val_str))
+        except ValueError:
+            continue
+    return ids, valeurs
+
+
+# ----------------------------------------------------------------------
+# Format .npy / .npz sans numpy
+# ----------------------------------------------------------------------
+
+def _octets_petit_boutiste(tableau: array) -> bytes:
+    if sys.byteorder == "big" and tableau.itemsize > 1:
+        tableau = array(tableau.typecode, tableau)
+        tableau.byteswap()
+    return tableau.tobytes()
+
+
+def _npy(tableau, descripteur: str, forme: tuple) -> bytes:
+    """Sérialise un tableau au format .npy (version 1.0)."""
+    en_tete = f"{{'descr': '{descripteur}', 'fortran_order': False, 'shape': {forme!r}, }}"
+    # le préambule (10 octets) + l'en-tête doivent occuper un multiple de 64 octets
+    remplissage = -(10 + len(en_tete) + 1) % 64
+    en_tete = (en_tete + " " * remplissage + "\n").encode("latin1")
+    donnees = _octets_petit_boutiste(tableau) if isinstance(tableau, array) else tableau
+    return b"\x93NUMPY\x01\x00" + len(en_tete).to_bytes(2, "little") + en_tete + donnees
+
+
+def _lire_npy(contenu: bytes) -> tuple:
+    """Renvoie (tableau array ou bytes, descripteur, forme) depuis le contenu d'un .npy."""
+    if contenu[:6] != b"\x93NUMPY":
+        raise ValueError("En-tête .npy invalide")
+    version = contenu[6]
+    if version == 1:
+        taille = int.from_bytes(contenu[8:10], "little")
+        debut = 10
+    else:
+        taille = int.from_bytes(contenu[8:12], "little")
+        debut = 12
+    import ast  # importé à la lecture seulement (démarrage des moteurs)
+
+    en_tete = ast.literal_eval(contenu[debut:debut + taille].decode("latin1"))
+    donnees = contenu[debut + taille:]
+    descripteur = en_tete["descr"]
+    if descripteur not in CODES:
+        return donnees, descripteur, en_tete["shape"]
+    tableau = array(CODES[descripteur])
+    tableau.frombytes(donnees)
+    if sys.byteorder == "big" and tableau.itemsize > 1:
+        tableau.byteswap()
+    return tableau, descripteur, en_tete["shape"]
+
+
+def ecrire_npz(path: Path, indptr: array, indices: array, data: array, shape: tuple,
+               echelles: array | None = None) -> None:
+    """Écrit une matrice CSR au format de scipy.sparse.save_npz (non compressé)."""
+    import zipfile
+
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED) as z:
+        if echelles is not None:
+            z.writestr("echelles.npy", _npy(echelles, DESCRIPTEURS[echelles.typecode], (len(echelles),)))
+        z.writestr("indices.npy", _npy(indices, DESCRIPTEURS[indices.typecode], (len(indices),)))
+        z.writestr("indptr.npy", _npy(indptr, DESCRIPTEURS[indptr.typecode], (len(indptr),)))
+        z.writestr("format.npy", _npy("csr".encode("utf-32-le"), "<U3", ()))
+        z.writestr("shape.npy", _npy(array("q", shape), "<i8", (2,)))
+        z.writestr("data.npy", _npy(data, DESCRIPTEURS[data.typecode], (len(data),)))
+
+
+# ----------------------------------------------------------------------
+# Matrice en mémoire
+# ----------------------------------------------------------------------
+
+class MatriceCSR:
+    """
+    Vecteurs de tous les documents en trois tableaux plats :
+    la ligne i (document i, à partir de 0) occupe indices/data[indptr[i]:indptr[i+1]].
+    """
+
+    __slots__ = ("indptr", "indices", "data", "nb_colonnes", "echelles")
+
+    def __init__(self, indptr: array, indices: array, data: array, nb_colonnes: int = 0,
+                 echelles: array | None = None):
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.nb_colonnes = nb_colonnes
+        self.echelles = echelles  # poids quantifiés : poids = code × echelles[colonne]
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def ligne(self, i: int) -> tuple:
+        """(ids, valeurs) du document i, sous forme de tranches d'array."""
+        debut, fin = self.indptr[i], self.indptr[i + 1]
+        return self.indices[debut:fin], self.data[debut:fin]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.ligne(i)
+
+    def valeur(self, i: int, colonne: int, defaut=None):
+        """Valeur (i, colonne) par recherche dichotomique dans la ligne i (ids croissants)."""
+        debut, fin = self.indptr[i], self.indptr[i + 1]
+        pos = bisect_left(self.indices, colonne, debut, fin)
+        if pos < fin and self.indices[pos] == colonne:
+            if self.echelles is not None:
+                return self.data[pos] * self.echelles[colonne]
+            return self.data[pos]
+        return defaut
+
+    def octets(self) -> int:
+        """Place occupée par les trois tableaux."""
+        tableaux = [self.indptr, self.indices, self.data]
+        if self.echelles is not None:
+            tableaux.append(self.echelles)
+        return sum(t.itemsize * len(t) for t in tableaux)
+
+
+def charger_npz(path: Path) -> MatriceCSR:
+    # zipfile (et threading, shutil...) n'est importé qu'au premier chargement
+    import zipfile
+
+    with zipfile.ZipFile(path, "r") as z:
+        tableaux = {nom[:-4]: _lire_npy(z.read(nom))[0] for nom in z.namelist()}
+    forme = tableaux.get("shape")
+    return MatriceCSR(tableaux["indptr"], tableaux["indices"], tableaux["data"],
+                      int(forme[1]) if forme is not None else 0, tableaux.get("echelles"))
+
+
+def charger_texte(path: Path, entiers: bool = False) -> MatriceCSR:
+    """Lit le format texte (une ligne par document) dans une MatriceCSR."""
+    indptr = array("q", [0])
+    indices = array("i")
+    data = array("i" if entiers else "f")
+    with path.open("r", encoding="utf-8") as f:
+        for ligne in f:
+            ids, valeurs = analyser_ligne(ligne, entiers)
+            indices.extend(ids)
+            data.extend(valeurs)
+            indptr.append(len(indices))
+    nb_colonnes = max(indices) + 1 if indices else 0
+    return MatriceCSR(indptr, indices, data, nb_colonnes)
+
+
+def charger_vecteurs(path: Path, entiers: bool = False) -> MatriceCSR:
+    """
+    Charge des vecteurs depuis `path` : le .npz voisin s'il existe et n'est pas
+    plus ancien que le texte (ou si `path` est lui-même un .npz), sinon le texte.
+    """
+    path_npz = path.with_suffix(".npz")
+    if path.suffix == ".npz":
+        return charger_npz(path)
+    if path_npz.is_file() and (not path.is_file()
+                               or path_npz.stat().st_mtime >= path.stat().st_mtime):
+        return charger_npz(path_npz)
+    return charger_texte(path, entiers)
+
+
+# ----------------------------------------------------------------------
+# Écriture
+# ----------------------------------------------------------------------
+
+class EcrivainVecteurs:
+    """
+    Écrit les vecteurs document par document, au format texte (par paquets de
+    TAILLE_TAMPON lignes) et/ou .npz (tableaux accumulés puis écrits à la fermeture).
+    type_valeurs : code array des valeurs ("B" binaire, "i" entiers, "f" réels).
+    """
+
+    def __init__(self, path_texte: Path | None = None, path_npz: Path | None = None,
+                 type_valeurs: str = "f", nb_termes: int = 0, decimales: int = 6):
+        self.f_texte = path_texte.open("w", encoding="utf-8", buffering=1 << 20) if path_texte else None
+        self.path_npz = path_npz
+        self.entiers = type_valeurs != "f"
+        self.decimales = decimales
+        self.nb_termes = nb_termes
+        self.tampon = []
+        self.indptr = array("q", [0])
+        self.indices = array("i")
+        self.data = array(type_valeurs)
+
+    def ajouter(self, ids, valeurs) -> None:
+        """Ajoute le vecteur d'un document (ids croissants)."""
+        if self.f_texte is not None:
+            self.tampon.append(formater_ligne(ids, valeurs, self.entiers, self.decimales) + "\n")
+            if len(self.tampon) >= TAILLE_TAMPON:
+                self.f_texte.writelines(self.tampon)
+                self.tampon.clear()
+        if self.path_npz is not None:
+            self.indices.extend(ids)
+            self.data.extend(valeurs)
+            self.indptr.append(len(self.indices))
+
+    def fermer(self) -> None:
+        if self.f_texte is not None:
+            self.f_texte.writelines(self.tampon)
+            self.tampon.clear()
+            self.f_texte.close()
+        if self.path_npz is not None:
+            nb_colonnes = max(self.nb_termes, max(self.indices) if self.indices else 0) + 1
+            ecrire_npz(self.path_npz, self.indptr, self.indices, self.data,
+                       (len(self.indptr) - 1, nb_colonnes))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.fermer()
+
+
+def convertir_en_npz(path_texte: Path, entiers: bool = False, type_valeurs: str | None = None) -> Path:
+    """
+    Écrit le .npz voisin d'un fichier de vecteurs texte. Renvoie son chemin.
+    type_valeurs "B" ou "H" sur des poids réels : quantification 8 ou 16 bits par terme.
+    """
+    matrice = charger_texte(path_texte, entiers)
+    echelles = None
+    if type_valeurs in QUANTIFICATIONS.values() and not entiers:
+        matrice.data, echelles = quantifier_colonnes(matrice.indices, matrice.data,
+                                                     type_valeurs, matrice.nb_colonnes)
+    elif type_valeurs is not None and type_valeurs != matrice.data.typecode:
+        matrice.data = array(type_valeurs, matrice.data)
+    path_npz = path_texte.with_suffix(".npz")
+    ecrire_npz(path_npz, matrice.indptr, matrice.indices, matrice.data,
+               (len(matrice), matrice.nb_colonnes), echelles)
+    return path_npz
+
+
+# ----------------------------------------------------------------------
+# Quantification des poids
+# ----------------------------------------------------------------------
+
+# Format de stockage des poids -> code array ("q8"/"q16" : entiers + échelle par terme)
+QUANTIFICATIONS = {"q8": "B", "q16": "H"}
+FORMATS_POIDS = {"f64": "d", "f32": "f", **QUANTIFICATIONS}
+
+
+def quantifier_colonnes(indices: array, valeurs, typecode: str, nb_colonnes: int) -> tuple:
+    """
+    Quantifie des poids positifs sur 8 ("B") ou 16 ("H") bits avec une échelle
+    par colonne (idTerme) : echelle = poids maximal du terme / code maximal.
+    Renvoie (codes, echelles) ; poids ≈ codes[k] × echelles[indices[k]].
+    """
+    code_max = (1 << (8 * array(typecode).itemsize)) - 1
+    maximums = array("d", bytes(8 * nb_colonnes))
+    for col, v in zip(indices, valeurs):
+        if v > maximums[col]:
+            maximums[col] = v
+    echelles = array("f", (m / code_max if m > 0 else 0.0 for m in maximums))
+    codes = array(typecode, (
+        min(code_max, round(v / echelles[col])) if echelles[col] > 0 else 0
+        for col, v in zip(indices, valeurs)
+    ))
+    return codes, echelles
+
+
+# ----------------------------------------------------------------------
+# Lecture paresseuse du format texte
+# ----------------------------------------------------------------------
+
+# Nombre de documents analysés ensemble dans un paquet
+TAILLE_PAQUET = 256
+
+
+def construire_offsets(path_texte: Path) -> array:
+    """
+    Position (en octets) du début de chaque ligne, plus la taille du fichier
+    en dernier élément : la ligne i occupe [offsets[i], offsets[i+1]).
+    """
+    offsets = array("q", [0])
+    position = 0
+    with path_texte.open("rb") as f:
+        for ligne in f:
+            position += len(ligne)
+            offsets.append(position)
+    return offsets
+
+
+class LecteurVecteurs:
+    """
+    Lecture à la demande d'un fichier de vecteurs texte, sans le charger en entier.
+    Un index des débuts de ligne (fichier voisin .off, int64 petit-boutiste)
+    est construit au premier usage et reconstruit si le texte est plus récent.
+
+        lecteur = LecteurVecteurs(Path("outputs/vecteurTF.txt"), entiers=True)
+        for doc_idx, ids, poids in lecteur:          # tout, paquet par paquet
+        ids, poids = lecteur.lire(41)                # un document (accès direct)
+        for doc_idx, ids, poids in lecteur.parcourir([3, 41, 2000]):
+    """
+
+    def __init__(self, path_texte: Path, entiers: bool = False,
+                 taille_paquet: int = TAILLE_PAQUET):
+        self.path_texte = path_texte
+        self.path_offsets = path_texte.with_suffix(".off")
+        self.entiers = entiers
+        self.taille_paquet = taille_paquet
+        self._offsets = None
+
+    @property
+    def offsets(self) -> array:
+        if self._offsets is None:
+            if (self.path_offsets.is_file()
+                    and self.path_offsets.stat().st_mtime >= self.path_texte.stat().st_mtime):
+                offsets = array("q")
+                offsets.frombytes(self.path_offsets.read_bytes())
+                if sys.byteorder == "big":
+                    offsets.byteswap()
+            else:
+                offsets = construire_offsets(self.path_texte)
+                self.path_offsets.write_bytes(_octets_petit_boutiste(offsets))
+            self._offsets = offsets
+        return self._offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def _analyser_paquet(self, lignes: list) -> MatriceCSR:
+        indptr = array("q", [0])
+        indices = array("i")
+        data = array("i" if self.entiers else "f")
+        for ligne in lignes:
+            ids, valeurs = analyser_ligne(ligne, self.entiers)
+            indices.extend(ids)
+            data.extend(valeurs)
+            indptr.append(len(indices))
+        return MatriceCSR(indptr, indices, data)
+
+    def paquets(self, debut: int = 0):
+        """Générateur (premier doc_idx, MatriceCSR) par paquets de `taille_paquet` documents."""
+        with self.path_texte.open("rb") as f:
+            if debut:
+                f.seek(self.offsets[debut])
+            doc_idx = debut
+            lignes = []
+            for ligne in f:
+                lignes.append(ligne.decode("utf-8"))
+                if len(lignes) == self.taille_paquet:
+                    yield doc_idx, self._analyser_paquet(lignes)
+                    doc_idx += len(lignes)
+                    lignes = []
+            if lignes:
+                yield doc_idx, self._analyser_paquet(lignes)
+
+    def depuis(self, debut: int = 0):
+        """Générateur (doc_idx, ids, poids) à partir du document `debut` (index 0)."""
+        for premier, paquet in self.paquets(debut):
+            for i in range(len(paquet)):
+                ids, poids = paquet.ligne(i)
+                yield premier + i, ids, poids
+
+    def __iter__(self):
+        return self.depuis(0)
+
+    def lire(self, doc_idx: int) -> tuple:
+        """(ids, poids) d'un seul document, lu directement à sa position."""
+        for _, ids, poids in self.parcourir([doc_idx]):
+            return ids, poids
+        raise IndexError(doc_idx)
+
+    def parcourir(self, doc_idxs):
+        """Générateur (doc_idx, ids, poids) pour les documents demandés, par position croissante."""
+        offsets = self.offsets
+        with self.path_texte.open("rb") as f:
+            for doc_idx in sorted(set(doc_idxs)):
+                if not 0 <= doc_idx < len(offsets) - 1:
+                    continue
+                f.seek(offsets[doc_idx])
+                ligne = f.read(offsets[doc_idx + 1] - offsets[doc_idx]).decode("utf-8")
+                ids, valeurs = analyser_ligne(ligne, self.entiers)
+                yield (doc_idx, array("i", ids),
+                       array("i" if self.entiers else "f", valeurs))
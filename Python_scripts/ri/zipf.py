@@ -0,0 +1,89 @@
+"""
+Auteurs: Livio Dadone, Gabriel Bragança De Oliveira
+Nom du fichier: zipf.py
+Objectif du programme:
+    Lecture de counter.txt (rang, fréquence, mot) et estimation de la loi de
+    Zipf f(r) ≈ C / r^s : droite des moindres carrés de log10(fréquence)
+    selon log10(rang). Utilisé par zipf_plot.py (graphique) et par
+    ri.synthetique (collections générées) ; bibliothèque standard seulement.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List
+import math
+
+# Rangs retenus pour l'ajustement : on exclut les tout premiers et tout derniers rangs
+RANG_MIN_AJUSTEMENT = 5
+RANG_MAX_AJUSTEMENT = 5000
+
+
+@dataclass
+class WordStat:
+    """Représente une ligne de counter.txt."""
+    rank: int
+    freq: int
+    word: str
+
+
+def lire_counter(path: Path) -> List[WordStat]:
+    """
+    Lit le fichier counter.txt et renvoie une liste de WordStat.
+
+    On suppose un format par ligne :
+        rang freq mot
+    où 'mot' peut éventuellement contenir des espaces (on recolle tout après la 2ᵉ colonne).
+
+    Les lignes non parseables (en-têtes, vides, etc.) sont ignorées.
+    """
+    stats: List[WordStat] = []
+
+    if not path.exists():
+        raise FileNotFoundError(f"Fichier introuvable : {path}")
+
+    with path.open(encoding="utf-8") as f:
+        for raw_line in f:
+            line = raw_line.strip()
+            if not line:
+                continue
+
+            parts = line.split()
+            if len(parts) < 3:
+                continue
+
+            try:
+                rank = int(parts[0])
+                freq = int(parts[1])
+            except ValueError:
+                # Probable ligne d'en-tête ou format invalide
+                continue
+
+            word = " ".join(parts[2:])
+            stats.append(WordStat(rank=rank, freq=freq, word=word))
+
+    # On s'assure que les données sont triées par rang croissant
+    stats.sort(key=lambda s: s.rank)
+    return stats
+
+
+def ajuster_zipf(ranks, freqs, rang_min: int = RANG_MIN_AJUSTEMENT,
+                 rang_max: int = RANG_MAX_AJUSTEMENT) -> tuple | None:
+    """
+    (pente, ordonnée à l'origine) de la régression linéaire de log10(freq) sur
+    log10(rang), pour les rangs entre rang_min et rang_max (même résultat que
+    numpy.polyfit de degré 1). L'exposant de Zipf est -pente.
+    None s'il reste moins de 3 points.
+    """
+    points = [(math.log10(r), math.log10(f)) for r, f in zip(ranks, freqs)
+              if rang_min <= r <= rang_max and r > 0 and f > 0]
+    n = len(points)
+    if n < 3:
+        return None
+    moy_x = sum(x for x, _ in points) / n
+    moy_y = sum(y for _, y in points) / n
+    sxx = sum((x - moy_x) ** 2 for x, _ in points)
+    if sxx == 0:
+        return None
+    sxy = sum((x - moy_x) * (y - moy_y) for x, y in points)
+    pente = sxy / sxx
+    return pente, moy_y - pente * moy_x